@@ -1,6 +1,6 @@
 import pygame
 from settings import WIDTH, ATH_HEIGHT, BLACK, WHITE
-from utilitaire import load_sprites, load_sprites_from_folder, animate, chemin_relatif
+from utilitaire import animate, chemin_relatif, sprite_cache, DigitCompositor
 
 
 class Ath(pygame.sprite.Sprite):
@@ -15,6 +15,7 @@ class Ath(pygame.sprite.Sprite):
     Attributs :
         player (Player): Référence au joueur pour récupérer HP, mana et score.
         font_title (pygame.font.Font): Police pour afficher le score.
+        score_counter (DigitCompositor): Compteur du score (glyphes pré-rendus).
         image (pygame.Surface): Surface principale sur laquelle on dessine l'ATH.
         rect (pygame.Rect): Rectangle de la surface principale.
         life_sprites (dict): Sprites des points de vie, indexés par HP.
@@ -23,6 +24,8 @@ class Ath(pygame.sprite.Sprite):
         current_frame (int): Frame actuelle de l'animation.
         animation_speed (float): Vitesse de l'animation.
         frame_timer (float): Timer interne pour gérer l'animation.
+        dirty (bool): True si `image` a été redessinée depuis son dernier affichage
+            (remis à False par le rendu qui la lit, pas par `update`).
     """
 
     SCALE_FACTOR = 2
@@ -57,6 +60,7 @@ class Ath(pygame.sprite.Sprite):
 
         # === Font ===
         self.font_title = pygame.font.Font(self.FONT_PATH, self.FONT_SIZE)
+        self.score_counter = DigitCompositor(self.font_title, WHITE, prefix="Score: ")
 
         # === Surface principale ===
         self.image = pygame.Surface((WIDTH, ATH_HEIGHT), pygame.SRCALPHA)
@@ -64,11 +68,11 @@ class Ath(pygame.sprite.Sprite):
 
         # === Sprites ===
         self.life_sprites = {
-            hp: self._load_and_scale(load_sprites_from_folder(path))
+            hp: sprite_cache.get_folder(path, self.SCALE_FACTOR)
             for hp, path in self.LIFE_PATHS.items()
         }
         self.mana_sprites = {
-            mana: self._load_and_scale(load_sprites(path, 1))
+            mana: sprite_cache.get(path, 1, self.SCALE_FACTOR)
             for mana, path in self.MANA_PATHS.items()
         }
 
@@ -78,23 +82,9 @@ class Ath(pygame.sprite.Sprite):
         self.animation_speed = 0.15
         self.frame_timer = 0
 
-    def _load_and_scale(self, sprites):
-        """
-        Redimensionne tous les sprites d'une liste.
-
-        Args:
-            sprites (list[pygame.Surface]): Liste de surfaces à redimensionner.
-
-        Returns:
-            list[pygame.Surface]: Liste de surfaces redimensionnées.
-        """
-        return [
-            pygame.transform.scale(
-                img,
-                (img.get_width() * self.SCALE_FACTOR, img.get_height() * self.SCALE_FACTOR),
-            )
-            for img in sprites
-        ]
+        # === Redessin uniquement si le contenu change ===
+        self.dirty = True
+        self._drawn_state = None
 
     def update(self):
         """
@@ -109,7 +99,14 @@ class Ath(pygame.sprite.Sprite):
         player_mana = max(0, min(4, self.player.mana))  # clamp entre 0 et 4
         mana_sprite = self.mana_sprites[player_mana][0]
 
-        # === Redessiner l'ATH ===
+        # === Redessiner l'ATH seulement si quelque chose a changé ===
+        # Plusieurs pas de simulation peuvent séparer deux affichages : le drapeau
+        # reste levé jusqu'à ce que le rendu l'ait lu
+        state = (self.current_sprite, mana_sprite, self.player.score)
+        if state == self._drawn_state:
+            return
+        self.dirty = True
+        self._drawn_state = state
         self.image.fill(BLACK)
 
         # HP - à gauche
@@ -118,7 +115,7 @@ class Ath(pygame.sprite.Sprite):
             self.image.blit(self.current_sprite, rect_hp)
 
         # Score - au milieu
-        score_text = self.font_title.render(f"Score: {self.player.score}", True, WHITE)
+        score_text = self.score_counter.render(self.player.score)
         score_rect = score_text.get_rect(center=(self.rect.width // 2, 40))
         self.image.blit(score_text, score_rect)
 
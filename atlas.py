@@ -0,0 +1,340 @@
+"""
+atlas.py
+
+Cache disque des sprites prétraités.
+
+Le découpage des spritesheets, le recadrage (`get_bounding_rect`) et la mise
+à l'échelle sont faits une seule fois par une étape de build :
+
+    python atlas.py
+
+Les frames obtenues sont écrites en RGBA brut, à la suite, dans un fichier
+`assets/cache/sprites.atlas`, accompagné d'un petit index JSON
+(`assets/cache/sprites.json`). Au lancement, le fichier est mappé en mémoire
+(mmap) et `sprite_cache` y lit directement les frames au lieu de refaire le
+travail. Le dossier étant dans `assets/`, il est embarqué par PyInstaller
+(`--add-data "assets:assets"`) et relu depuis `_MEIPASS`.
+
+Chaque entrée garde le CRC32 du contenu de sa source et une empreinte du
+traitement (paramètres de la clé, code de découpage et de mise à l'échelle,
+`PROCESSING_VERSION`) : une image modifiée, même à taille égale, ou un
+traitement changé rend l'entrée obsolète, et la frame est recalculée.
+
+En mémoire, `pack_sprite_cache` regroupe ensuite toutes les frames
+d'animation dans quelques grandes surfaces (pages) : chaque frame devient
+une sous-surface de sa page. Le jeu continue de blitter les frames comme
+des surfaces ordinaires (`animate`, `LayeredUpdates.draw`, rendu partiel) :
+pygame lit directement les pixels dans la page, sans passer de couple
+(page, zone source) aux appels de blit. Seules les frames présentes dans
+le cache au moment du regroupement sont packées. Les frames packées sont
+partagées et jamais modifiées : l'opacité du joueur (clignotement,
+invisibilité, mort) est appliquée dans ses propres tampons, le reste du
+temps il affiche directement la frame de la page.
+"""
+import inspect
+import json
+import mmap
+import os
+import zlib
+import pygame
+from utilitaire import chemin_relatif, load_sprites, load_sprites_from_folder, scale_sprites, SpriteCache
+from profiling import timed
+
+ATLAS_VERSION = 2  # 2 : CRC des sources et empreinte du traitement par entrée
+PROCESSING_VERSION = 1  # à incrémenter si le rendu des frames change hors du code suivi (ex: pygame)
+# Code qui produit les frames stockées (son bytecode entre dans l'empreinte du traitement)
+PROCESSING_CODE = (load_sprites, load_sprites_from_folder, scale_sprites,
+                   SpriteCache.get, SpriteCache.get_image, SpriteCache.get_folder)
+ATLAS_DIR = "assets/cache"
+ATLAS_DATA = "sprites.atlas"
+ATLAS_INDEX = "sprites.json"
+
+
+def _relative(path):
+    """Chemin relatif à la racine des ressources (indépendant de _MEIPASS)."""
+    return os.path.relpath(path, chemin_relatif("")).replace(os.sep, "/")
+
+
+def key_id(key):
+    """
+    Convertit une clé de `SpriteCache` en identifiant texte stable.
+
+    Args:
+        key (tuple): Clé du cache (chemin absolu en première position).
+
+    Returns:
+        str: Identifiant utilisé dans l'index de l'atlas.
+    """
+    path, *rest = key
+    return json.dumps([_relative(path)] + [list(value) if isinstance(value, tuple) else value for value in rest])
+
+
+def source_checksum(path):
+    """CRC32 du contenu de la source d'une entrée (fichier ou dossier de PNG)."""
+    if os.path.isdir(path):
+        checksum = 0
+        for filename in sorted(os.listdir(path)):
+            if filename.endswith(".png"):
+                checksum = zlib.crc32(filename.encode(), checksum)
+                with open(os.path.join(path, filename), "rb") as f:
+                    checksum = zlib.crc32(f.read(), checksum)
+        return checksum
+    with open(path, "rb") as f:
+        return zlib.crc32(f.read())
+
+
+def _code_checksum(code, checksum):
+    checksum = zlib.crc32(code.co_code, checksum)
+    checksum = zlib.crc32(repr(code.co_names).encode(), checksum)
+    for const in code.co_consts:
+        if inspect.iscode(const):
+            checksum = _code_checksum(const, checksum)
+        elif isinstance(const, frozenset):
+            # Ordre d'un frozenset variable d'un lancement à l'autre (hachage aléatoire des str)
+            checksum = zlib.crc32(repr(sorted(map(repr, const))).encode(), checksum)
+        else:
+            checksum = zlib.crc32(repr(const).encode(), checksum)
+    return checksum
+
+
+def processing_fingerprint():
+    """
+    Empreinte du traitement des frames : `PROCESSING_VERSION` et bytecode de `PROCESSING_CODE`.
+
+    Returns:
+        int: CRC32 qui change dès que le découpage, le recadrage ou la mise à l'échelle change.
+    """
+    checksum = zlib.crc32(str(PROCESSING_VERSION).encode())
+    for func in PROCESSING_CODE:
+        checksum = _code_checksum(inspect.unwrap(func).__code__, checksum)
+    return checksum
+
+
+def entry_processing(key, fingerprint):
+    """
+    Empreinte du traitement d'une entrée : paramètres de la clé (échelle, taille...)
+    et empreinte du code.
+
+    Args:
+        key (tuple): Clé de `SpriteCache`.
+        fingerprint (int): Résultat de `processing_fingerprint()`.
+    """
+    return zlib.crc32(key_id(key).encode(), fingerprint)
+
+
+class SpriteAtlas:
+    """
+    Atlas de frames prétraitées, lu depuis le disque via mmap.
+
+    Attributs :
+        index (dict): Entrées de l'index, par identifiant de clé.
+        fingerprint (int): Empreinte du traitement courant.
+    """
+    def __init__(self, data_path, index):
+        self.index = index["entries"]
+        self.fingerprint = processing_fingerprint()
+        self._checksums = {}  # chemin -> CRC de la source, calculé une fois par lancement
+        self._file = open(data_path, "rb")
+        self._data = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def _source_checksum(self, path):
+        checksum = self._checksums.get(path)
+        if checksum is None:
+            checksum = self._checksums[path] = source_checksum(path)
+        return checksum
+
+    @classmethod
+    def open(cls, directory=None):
+        """
+        Ouvre l'atlas s'il existe et correspond à la version courante.
+
+        Args:
+            directory (str | None): Dossier de l'atlas (par défaut `assets/cache`).
+
+        Returns:
+            SpriteAtlas | None: L'atlas, ou None s'il est absent ou obsolète.
+        """
+        directory = directory or chemin_relatif(ATLAS_DIR)
+        index_path = os.path.join(directory, ATLAS_INDEX)
+        data_path = os.path.join(directory, ATLAS_DATA)
+        if not (os.path.exists(index_path) and os.path.exists(data_path)):
+            return None
+        with open(index_path, "r") as f:
+            index = json.load(f)
+        if index.get("version") != ATLAS_VERSION or os.path.getsize(data_path) == 0:
+            return None
+        return cls(data_path, index)
+
+    @timed
+    def load(self, key):
+        """
+        Lit les frames d'une clé depuis l'atlas.
+
+        Args:
+            key (tuple): Clé de `SpriteCache`.
+
+        Returns:
+            tuple[pygame.Surface] | pygame.Surface | None: Frames (ou image simple)
+            converties au format de l'écran, None si absentes ou si la source ou le
+            traitement a changé.
+        """
+        entry = self.index.get(key_id(key))
+        if entry is None or entry["processing"] != entry_processing(key, self.fingerprint) \
+                or entry["checksum"] != self._source_checksum(key[0]):
+            return None
+
+        alpha = entry.get("alpha", True)
+        surfaces = []
+        for offset, width, height in entry["frames"]:
+            raw = self._data[offset:offset + width * height * 4]
+            surface = pygame.image.frombuffer(raw, (width, height), "RGBA")
+            surfaces.append(surface.convert_alpha() if alpha else surface.convert())
+        return surfaces[0] if entry["single"] else tuple(surfaces)
+
+    def close(self):
+        """Libère le mapping mémoire."""
+        self._data.close()
+        self._file.close()
+
+
+PAGE_SIZE = (2048, 2048)
+
+
+class TexturePacker:
+    """
+    Range des frames dans de grandes surfaces (pages) par étagères successives.
+
+    Chaque frame placée est retournée sous forme de sous-surface de sa page :
+    elle se blitte comme une surface normale, mais ses pixels sont contigus
+    à ceux des autres frames de la page.
+
+    Attributs :
+        page_size (tuple[int, int]): Taille des pages.
+        padding (int): Marge transparente entre deux frames.
+        pages (list[pygame.Surface]): Pages créées.
+    """
+    def __init__(self, page_size=PAGE_SIZE, padding=1):
+        self.page_size = page_size
+        self.padding = padding
+        self.pages = []
+        self._x = self._y = self._shelf_height = 0
+
+    def _new_page(self):
+        page = pygame.Surface(self.page_size, pygame.SRCALPHA).convert_alpha()
+        page.fill((0, 0, 0, 0))
+        self.pages.append(page)
+        self._x = self._y = self._shelf_height = 0
+
+    def _place(self, width, height):
+        """Réserve un emplacement et retourne (page, x, y)."""
+        page_width, page_height = self.page_size
+        if not self.pages:
+            self._new_page()
+        if self._x + width > page_width:
+            # Étagère pleine : on passe à la suivante
+            self._x = 0
+            self._y += self._shelf_height + self.padding
+            self._shelf_height = 0
+        if self._y + height > page_height:
+            self._new_page()
+        x, y = self._x, self._y
+        self._x += width + self.padding
+        self._shelf_height = max(self._shelf_height, height)
+        return self.pages[-1], x, y
+
+    def pack(self, surfaces):
+        """
+        Place une liste de frames dans les pages.
+
+        Args:
+            surfaces (list[pygame.Surface]): Frames à regrouper.
+
+        Returns:
+            list[pygame.Surface]: Sous-surfaces des pages, dans le même ordre que l'entrée.
+            Les frames plus grandes qu'une page sont retournées telles quelles.
+        """
+        packed = [None] * len(surfaces)
+        # Trier par hauteur décroissante limite la place perdue dans chaque étagère
+        order = sorted(range(len(surfaces)), key=lambda i: surfaces[i].get_height(), reverse=True)
+        for i in order:
+            surface = surfaces[i]
+            width, height = surface.get_size()
+            if width > self.page_size[0] or height > self.page_size[1]:
+                packed[i] = surface
+                continue
+            page, x, y = self._place(width, height)
+            # Copie exacte des pixels (la page est transparente, MAX ne mélange rien)
+            page.blit(surface, (x, y), special_flags=pygame.BLEND_RGBA_MAX)
+            packed[i] = page.subsurface((x, y, width, height))
+        return packed
+
+
+def pack_sprite_cache(cache, page_size=PAGE_SIZE):
+    """
+    Regroupe toutes les frames d'animation du cache dans des pages.
+
+    Args:
+        cache (SpriteCache): Cache à réorganiser (déjà rempli).
+        page_size (tuple[int, int]): Taille des pages.
+
+    Returns:
+        TexturePacker: Le packer, qui garde une référence aux pages.
+    """
+    packer = TexturePacker(page_size)
+    cache.repack(packer.pack)
+    return packer
+
+
+def build_atlas(cache, directory=None):
+    """
+    Écrit dans l'atlas toutes les entrées d'un `SpriteCache`.
+
+    Args:
+        cache (SpriteCache): Cache déjà rempli (ex: par le préchargement).
+        directory (str | None): Dossier de sortie (par défaut `assets/cache`).
+
+    Returns:
+        int: Nombre d'entrées écrites.
+    """
+    directory = directory or chemin_relatif(ATLAS_DIR)
+    os.makedirs(directory, exist_ok=True)
+
+    entries = {}
+    offset = 0
+    fingerprint = processing_fingerprint()
+    with open(os.path.join(directory, ATLAS_DATA), "wb") as data:
+        for key, value in cache.items():
+            single = isinstance(value, pygame.Surface)
+            frames = []
+            for surface in ([value] if single else value):
+                raw = pygame.image.tobytes(surface, "RGBA")
+                data.write(raw)
+                frames.append((offset, surface.get_width(), surface.get_height()))
+                offset += len(raw)
+            entries[key_id(key)] = {
+                "checksum": source_checksum(key[0]),
+                "processing": entry_processing(key, fingerprint),
+                "single": single,
+                # Les images simples stockent leur mode de conversion en 4e position de la clé
+                "alpha": key[3] if single else True,
+                "frames": frames,
+            }
+
+    with open(os.path.join(directory, ATLAS_INDEX), "w") as f:
+        json.dump({"version": ATLAS_VERSION, "entries": entries}, f)
+    return len(entries)
+
+
+if __name__ == "__main__":
+    # Étape de build : charge tout le manifeste sans fenêtre puis écrit l'atlas
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+
+    from preload import build_manifest, load_entry
+    from utilitaire import sprite_cache
+
+    for kind, args in build_manifest():
+        load_entry(kind, args)
+    count = build_atlas(sprite_cache)
+    print(f"[Atlas] {count} entrées écrites dans {chemin_relatif(ATLAS_DIR)}")
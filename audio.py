@@ -1,7 +1,249 @@
-import sounddevice as sd
+"""
+audio.py
+
+Mesure du niveau sonore du micro (cri pour continuer).
+
+Le signal vient d'une source interchangeable :
+    - `DeviceSource` : micro réel (sounddevice, importé seulement à l'ouverture) ;
+    - `WavSource`    : relecture d'un fichier WAV ;
+    - `SignalSource` : signal généré (silence, sinus, bruit, cri).
+
+La variable d'environnement `ALAIN_MIC` choisit la source du service partagé
+(voir `source_from_spec`), ex: `ALAIN_MIC=signal:scream python main.py`.
+"""
+import os
+import threading
+import time
+import wave
+from abc import ABC, abstractmethod
 import numpy as np
 
 
+def rms_to_db(rms):
+    """
+    Convertit un niveau RMS en décibels "positifs" (même échelle que SoundMeter) :
+    dBFS décalés de 100, soit 100 pour un signal à pleine échelle et 0 pour le silence.
+
+    Args:
+        rms (float): Niveau RMS du signal.
+
+    Returns:
+        float: Niveau en dB ramené à une valeur positive pour affichage.
+    """
+    db = 20 * np.log10(rms + 1e-6)
+    return max(0.0, float(db + 100))
+
+
+class InputSource(ABC):
+    """
+    Source de signal audio : appelle un callback pour chaque buffer capturé,
+    avec la même signature que `sounddevice.InputStream`
+    (`callback(indata, frames, time_info, status)`).
+
+    Attributs :
+        sample_rate (int): Fréquence d'échantillonnage en Hz.
+        channels (int): Nombre de canaux.
+        blocksize (int): Taille d'un buffer en nombre d'échantillons.
+    """
+
+    def __init__(self, sample_rate=44100, channels=1, blocksize=1024):
+        self.sample_rate = sample_rate
+        self.channels = channels
+        self.blocksize = blocksize
+
+    @abstractmethod
+    def open(self, callback):
+        """Commence à livrer des buffers au callback."""
+
+    @abstractmethod
+    def close(self):
+        """Arrête la livraison des buffers."""
+
+
+class DeviceSource(InputSource):
+    """
+    Micro réel via `sounddevice.InputStream`.
+
+    Attributs :
+        device (int ou None): ID du périphérique audio (None = par défaut).
+    """
+
+    def __init__(self, sample_rate=44100, channels=1, blocksize=1024, device=None):
+        super().__init__(sample_rate, channels, blocksize)
+        self.device = device
+        self._stream = None
+
+    def open(self, callback):
+        # Import tardif : sans PortAudio, seules les autres sources restent utilisables
+        import sounddevice as sd
+        self._stream = sd.InputStream(callback=callback,
+                                      channels=self.channels,
+                                      samplerate=self.sample_rate,
+                                      blocksize=self.blocksize,
+                                      device=self.device)
+        self._stream.start()
+
+    def close(self):
+        if self._stream is not None:
+            self._stream.stop()
+            self._stream.close()
+            self._stream = None
+
+
+class _ThreadedSource(InputSource):
+    """
+    Source simulée : un thread livre les buffers au rythme du temps réel
+    (ou aussi vite que possible si `realtime` vaut False).
+    """
+
+    def __init__(self, sample_rate=44100, channels=1, blocksize=1024, realtime=True):
+        super().__init__(sample_rate, channels, blocksize)
+        self.realtime = realtime
+        self._thread = None
+        self._running = False
+
+    @abstractmethod
+    def next_block(self):
+        """
+        Returns:
+            np.ndarray | None: Buffer suivant (blocksize x channels, float32), None à la fin.
+        """
+
+    def _run(self, callback):
+        period = self.blocksize / self.sample_rate
+        next_time = time.perf_counter()
+        while self._running:
+            block = self.next_block()
+            if block is None:
+                break
+            callback(block, len(block), None, None)
+            if self.realtime:
+                next_time += period
+                delay = next_time - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+
+    def open(self, callback):
+        self._running = True
+        self._thread = threading.Thread(target=self._run, args=(callback,), daemon=True)
+        self._thread.start()
+
+    def close(self):
+        self._running = False
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+
+class WavSource(_ThreadedSource):
+    """
+    Relecture d'un fichier WAV PCM (8, 16 ou 32 bits) comme s'il venait du micro.
+
+    Attributs :
+        path (str): Chemin du fichier WAV.
+        loop (bool): Si True, le fichier est relu en boucle.
+    """
+
+    def __init__(self, path, blocksize=1024, loop=True, realtime=True):
+        with wave.open(path, "rb") as wav:
+            sample_rate = wav.getframerate()
+            channels = wav.getnchannels()
+            width = wav.getsampwidth()
+            raw = wav.readframes(wav.getnframes())
+        super().__init__(sample_rate, channels, blocksize, realtime)
+        self.path = path
+        self.loop = loop
+
+        if width == 1:
+            samples = (np.frombuffer(raw, dtype=np.uint8).astype(np.float32) - 128) / 128
+        elif width in (2, 4):
+            dtype = np.int16 if width == 2 else np.int32
+            samples = np.frombuffer(raw, dtype=dtype).astype(np.float32) / np.iinfo(dtype).max
+        else:
+            raise ValueError(f"Format WAV non supporté ({width * 8} bits) : {path}")
+        self._samples = samples.reshape(-1, channels)
+        self._position = 0
+
+    def next_block(self):
+        end = self._position + self.blocksize
+        if end > len(self._samples):
+            if not self.loop or len(self._samples) < self.blocksize:
+                return None
+            self._position, end = 0, self.blocksize
+        block = self._samples[self._position:end]
+        self._position = end
+        return block
+
+
+class SignalSource(_ThreadedSource):
+    """
+    Signal généré, pour tester sans micro.
+
+    Formes disponibles :
+        - "silence" : signal nul ;
+        - "sine"    : sinus continu ;
+        - "noise"   : bruit blanc ;
+        - "whisper" : sinus très faible (sous le seuil du cri pour continuer) ;
+        - "scream"  : silence puis, après `delay` secondes, un sinus fort.
+
+    Attributs :
+        kind (str): Forme du signal.
+        amplitude (float): Amplitude crête (0.0 à 1.0).
+        frequency (float): Fréquence du sinus en Hz.
+        delay (float): Début du cri en secondes (forme "scream").
+    """
+    KINDS = ("silence", "sine", "noise", "whisper", "scream")
+    WHISPER_AMPLITUDE = 0.01  # environ 57 dB sur l'échelle de `rms_to_db`
+
+    def __init__(self, kind="sine", amplitude=0.5, frequency=440.0, delay=1.0,
+                 sample_rate=44100, channels=1, blocksize=1024, realtime=True, seed=None):
+        if kind not in self.KINDS:
+            raise ValueError(f"Signal inconnu : {kind}")
+        super().__init__(sample_rate, channels, blocksize, realtime)
+        self.kind = kind
+        self.amplitude = amplitude
+        self.frequency = frequency
+        self.delay = delay
+        self._rng = np.random.default_rng(seed)
+        self._sample = 0  # indice du premier échantillon du prochain buffer
+
+    def next_block(self):
+        start = self._sample
+        self._sample += self.blocksize
+        if self.kind == "silence" or (self.kind == "scream" and start < self.delay * self.sample_rate):
+            mono = np.zeros(self.blocksize, dtype=np.float32)
+        elif self.kind == "noise":
+            mono = self._rng.uniform(-self.amplitude, self.amplitude, self.blocksize).astype(np.float32)
+        else:
+            amplitude = self.WHISPER_AMPLITUDE if self.kind == "whisper" else self.amplitude
+            t = np.arange(start, start + self.blocksize) / self.sample_rate
+            mono = (amplitude * np.sin(2 * np.pi * self.frequency * t)).astype(np.float32)
+        return np.repeat(mono[:, None], self.channels, axis=1)
+
+
+def source_from_spec(spec, sample_rate=44100, channels=1, blocksize=1024):
+    """
+    Construit une source à partir d'une description texte.
+
+    Args:
+        spec (str | None): "device" (ou vide), "wav:<chemin>" ou "signal[:<forme>]".
+        sample_rate (int): Fréquence d'échantillonnage (micro et signal).
+        channels (int): Nombre de canaux (micro et signal).
+        blocksize (int): Taille des buffers.
+
+    Returns:
+        InputSource: Source correspondante.
+    """
+    kind, _, arg = (spec or "device").partition(":")
+    if kind == "device":
+        return DeviceSource(sample_rate, channels, blocksize)
+    if kind == "wav":
+        return WavSource(arg, blocksize)
+    if kind == "signal":
+        return SignalSource(arg or "sine", sample_rate=sample_rate, channels=channels, blocksize=blocksize)
+    raise ValueError(f"Source micro inconnue : {spec}")
+
+
 class SoundMeter:
     """
     Classe pour mesurer le niveau sonore via le microphone.
@@ -13,7 +255,7 @@ class SoundMeter:
         device (int ou None): ID du périphérique audio à utiliser (None = périphérique par défaut).
     """
 
-    def __init__(self, sample_rate=44100, channels=1, buffer=1024, device=None):
+    def __init__(self, sample_rate=44100, channels=1, buffer=1024, device=None, source=None):
         """
         Initialise le SoundMeter avec les paramètres audio.
 
@@ -22,11 +264,13 @@ class SoundMeter:
             channels (int): Nombre de canaux.
             buffer (int): Taille du buffer.
             device (int ou None): Périphérique audio.
+            source (InputSource ou None): Source du signal (par défaut le micro).
         """
         self.sample_rate = sample_rate
         self.channels = channels
         self.buffer = buffer
         self.device = device
+        self.source = source or DeviceSource(sample_rate, channels, buffer, device)
 
     def get_max_db(self, duration=3):
         """
@@ -39,7 +283,7 @@ class SoundMeter:
             float: Niveau sonore maximal en dB, arrondi à deux décimales.
 
         Fonctionnement :
-            - Capture le flux audio en temps réel via sounddevice.
+            - Capture le flux audio en temps réel via la source.
             - Calcule le RMS (Root Mean Square) pour chaque buffer.
             - Convertit le RMS en décibels.
             - Transforme les dB en valeurs positives pour affichage.
@@ -52,20 +296,306 @@ class SoundMeter:
             if status:
                 print(f"[SoundMeter Warning] {status}")
 
-            # RMS → dB
+            # RMS → dB "positifs" pour affichage
             rms = np.sqrt(np.mean(indata**2))
-            db = 20 * np.log10(rms + 1e-6)
-
-            # Décibels "positifs" pour affichage
-            db_pos = max(0, -db + 100)
+            db_pos = rms_to_db(rms)
 
             self.max_db = max(self.max_db, db_pos)
 
-        with sd.InputStream(callback=callback,
-                            channels=self.channels,
-                            samplerate=self.sample_rate,
-                            blocksize=self.buffer,
-                            device=self.device):
-            sd.sleep(int(duration * 1000))
+        self.source.open(callback)
+        try:
+            time.sleep(duration)
+        finally:
+            self.source.close()
+
+        return round(self.max_db, 2)  # arrondi pour lecture
+
+class LevelAnalyzer:
+    """
+    Analyse vectorisée du niveau sonore, canal par canal.
+
+    Pour chaque buffer, calcule le RMS, la crête et une enveloppe lissée
+    (attaque rapide, relâchement lent) de chaque canal. Tous les calculs se
+    font en place dans des tableaux alloués une seule fois : appeler
+    `process` depuis le callback audio n'alloue pas de mémoire. Plusieurs
+    buffers empilés (n, blocksize, canaux) peuvent être traités en un appel.
+
+    Les résultats sont rangés dans des tampons circulaires (séries
+    temporelles) ; `written` n'est avancé qu'après l'écriture des valeurs,
+    le thread principal peut donc les lire sans verrou.
+
+    Attributs :
+        channels (int): Nombre de canaux.
+        blocksize (int): Taille maximale d'un buffer.
+        attack (float): Coefficient de lissage quand le niveau monte (0 à 1).
+        release (float): Coefficient de lissage quand le niveau baisse (0 à 1).
+        rms (np.ndarray): Série des RMS (history x canaux).
+        peak (np.ndarray): Série des crêtes (history x canaux).
+        envelope (np.ndarray): Série de l'enveloppe lissée (history x canaux).
+        written (int): Nombre total de buffers analysés.
+    """
+
+    def __init__(self, channels=1, blocksize=1024, history=256, max_stack=8, attack=0.6, release=0.1):
+        """
+        Args:
+            channels (int): Nombre de canaux.
+            blocksize (int): Taille maximale d'un buffer.
+            history (int): Nombre de buffers conservés dans les séries.
+            max_stack (int): Nombre de buffers traités à la fois dans `process`.
+            attack (float): Lissage à la montée.
+            release (float): Lissage à la descente.
+        """
+        self.channels = channels
+        self.blocksize = blocksize
+        self.attack = attack
+        self.release = release
+        self.rms = np.zeros((history, channels), dtype=np.float32)
+        self.peak = np.zeros((history, channels), dtype=np.float32)
+        self.envelope = np.zeros((history, channels), dtype=np.float32)
+        self.written = 0
+
+        # Tampons de travail (alloués une fois)
+        self._scratch = np.empty((max_stack, blocksize, channels), dtype=np.float32)
+        self._block_rms = np.empty((max_stack, channels), dtype=np.float32)
+        self._block_peak = np.empty((max_stack, channels), dtype=np.float32)
+        self._env = np.zeros(channels, dtype=np.float32)
+        self._coef = np.empty(channels, dtype=np.float32)
+        self._delta = np.empty(channels, dtype=np.float32)
+        self._rising = np.empty(channels, dtype=bool)
+
+    def process(self, blocks):
+        """
+        Analyse un buffer (frames x canaux) ou une pile de buffers (n x frames x canaux).
+
+        Args:
+            blocks (np.ndarray): Échantillons float32, frames <= blocksize.
+
+        Returns:
+            int: Nombre de buffers analysés.
+        """
+        if blocks.ndim == 2:
+            blocks = blocks[None]
+        max_stack = len(self._scratch)
+        for start in range(0, len(blocks), max_stack):
+            self._process_stack(blocks[start:start + max_stack])
+        return len(blocks)
+
+    def _process_stack(self, blocks):
+        count, frames, _ = blocks.shape
+        scratch = self._scratch[:count, :frames]
+        rms = self._block_rms[:count]
+        peak = self._block_peak[:count]
+
+        # Crête : max(|x|) par buffer et par canal
+        np.abs(blocks, out=scratch)
+        np.max(scratch, axis=1, out=peak)
+        # RMS : sqrt(mean(x²)) par buffer et par canal
+        np.multiply(blocks, blocks, out=scratch)
+        np.mean(scratch, axis=1, out=rms)
+        np.sqrt(rms, out=rms)
+
+        history = len(self.rms)
+        for i in range(count):
+            # Enveloppe : env += coef * (rms - env), coef = attaque si le niveau monte
+            np.subtract(rms[i], self._env, out=self._delta)
+            np.greater(self._delta, 0, out=self._rising)
+            np.copyto(self._coef, self.release)
+            np.copyto(self._coef, self.attack, where=self._rising)
+            self._delta *= self._coef
+            self._env += self._delta
+
+            index = (self.written + i) % history
+            self.rms[index] = rms[i]
+            self.peak[index] = peak[i]
+            self.envelope[index] = self._env
+        self.written += count  # publié après l'écriture des valeurs
+
+    def latest(self, series=None):
+        """
+        Dernière valeur d'une série.
+
+        Args:
+            series (np.ndarray | None): Série à lire (par défaut `rms`).
+
+        Returns:
+            np.ndarray: Valeur par canal (vue, sans copie).
+        """
+        series = self.rms if series is None else series
+        return series[(self.written - 1) % len(series)]
+
+    def series(self, out, series=None):
+        """
+        Copie les dernières valeurs d'une série, de la plus ancienne à la plus récente,
+        mélangées sur les canaux (maximum), dans un tableau fourni.
+
+        Args:
+            out (np.ndarray): Tableau 1D de destination (sa taille fixe le nombre de points).
+            series (np.ndarray | None): Série à lire (par défaut `envelope`).
+
+        Returns:
+            np.ndarray: `out` (les points sans données valent 0).
+        """
+        series = self.envelope if series is None else series
+        written = self.written
+        count = min(len(out), written, len(series))
+        out[:len(out) - count] = 0
+        for i in range(count):
+            out[len(out) - count + i] = series[(written - count + i) % len(series)].max()
+        return out
+
+
+class MeterService:
+    """
+    Service de mesure du micro persistant, interrogé par la boucle principale.
+
+    Une seule source est ouverte (au premier usage) puis gardée ouverte.
+    Le callback audio écrit le niveau de chaque buffer (RMS et dB) et son
+    instant de capture dans des tampons circulaires ; il est le seul
+    écrivain et n'avance l'indice d'écriture qu'une fois les valeurs
+    posées, le thread principal peut donc lire sans verrou. Une mesure
+    (`listen`) ne crée ni thread ni flux : `poll()` est appelé à chaque
+    frame et retourne le résultat une fois la durée écoulée. Relancer ou
+    annuler une mesure remplace simplement la précédente.
+
+    Attributs :
+        source (InputSource): Source du signal (micro, WAV ou signal généré).
+        analyzer (LevelAnalyzer): Analyse par canal (RMS, crête, enveloppe) des buffers reçus.
+        rms (np.ndarray): Tampon circulaire des niveaux RMS (tous canaux confondus).
+        db (np.ndarray): Tampon circulaire des niveaux en dB.
+        times (np.ndarray): Tampon circulaire des instants de capture (`time.perf_counter`).
+        available (bool): False si la source n'a pas pu être ouverte.
+    """
+
+    def __init__(self, source=None, history=256):
+        """
+        Args:
+            source (InputSource ou None): Source du signal (par défaut le micro).
+            history (int): Nombre de buffers conservés dans les tampons circulaires.
+        """
+        self.source = source or DeviceSource()
+        self.analyzer = LevelAnalyzer(self.source.channels, self.source.blocksize, history)
+        self.rms = np.zeros(history, dtype=np.float32)
+        self.db = np.zeros(history, dtype=np.float32)
+        self.times = np.zeros(history, dtype=np.float64)
+        self.available = True
+        self._written = 0  # nombre total de buffers écrits (seul le callback l'avance)
+        self._open = False
+        self._session = None  # (indice de départ, échéance) de la mesure en cours
+
+    @property
+    def written(self):
+        """Nombre total de buffers reçus depuis l'ouverture."""
+        return self._written
+
+    def _callback(self, indata, frames, time_info, status):
+        """Fonction appelée pour chaque buffer audio capturé (thread audio)."""
+        self.feed(indata, status)
+
+    def feed(self, indata, status=None):
+        """
+        Enregistre le niveau d'un buffer capturé. Appelé par la source ouverte ;
+        peut aussi recevoir directement des buffers (benchmarks, tests).
+
+        Args:
+            indata (np.ndarray): Échantillons float32 (frames x canaux).
+            status (object | None): Statut transmis par la source (affiché s'il est vrai).
+        """
+        if status:
+            print(f"[SoundMeter Warning] {status}")
+        self.analyzer.process(indata)
+        # Niveau global (tous canaux) : moyenne des carrés des RMS par canal
+        channel_rms = self.analyzer.latest()
+        rms = float(np.sqrt(np.dot(channel_rms, channel_rms) / len(channel_rms)))
+        index = self._written % len(self.db)
+        self.rms[index] = rms
+        self.db[index] = rms_to_db(rms)
+        self.times[index] = time.perf_counter()
+        self._written += 1  # publié après l'écriture des valeurs
+
+    def start(self):
+        """
+        Ouvre la source si elle ne l'est pas déjà.
+
+        Returns:
+            bool: True si la source est ouverte.
+        """
+        if not self._open and self.available:
+            try:
+                self.source.open(self._callback)
+                self._open = True
+            except Exception as e:
+                print(f"[SoundMeter Warning] Micro indisponible : {e}")
+                self.available = False
+        return self._open
+
+    def close(self):
+        """Ferme la source et annule la mesure en cours."""
+        self.cancel()
+        if self._open:
+            self.source.close()
+            self._open = False
+
+    def listen(self, duration=3):
+        """
+        Démarre une mesure (remplace la mesure en cours s'il y en a une).
+
+        Args:
+            duration (int ou float): Durée de la mesure en secondes.
+        """
+        self.start()
+        self._session = (self._written, time.monotonic() + duration)
+
+    def cancel(self):
+        """Annule la mesure en cours."""
+        self._session = None
+
+    @property
+    def listening(self):
+        """True si une mesure est en cours."""
+        return self._session is not None
+
+    def latest(self):
+        """
+        Returns:
+            float: Dernier niveau mesuré en dB (0 si rien n'a encore été capté).
+        """
+        if self._written == 0:
+            return 0.0
+        return float(self.db[(self._written - 1) % len(self.db)])
+
+    def max_db_since(self, start):
+        """
+        Niveau maximal des buffers écrits depuis un indice donné.
+
+        Args:
+            start (int): Nombre de buffers écrits au début de l'intervalle.
+
+        Returns:
+            float: Maximum en dB, arrondi à deux décimales (0 si aucun buffer).
+        """
+        written = self._written
+        count = min(written - start, len(self.db))
+        if count <= 0:
+            return 0.0
+        indices = np.arange(written - count, written) % len(self.db)
+        return round(float(self.db[indices].max()), 2)
+
+    def poll(self):
+        """
+        À appeler à chaque frame.
+
+        Returns:
+            float | None: Niveau maximal de la mesure si elle vient de se terminer,
+            None si aucune mesure n'est terminée.
+        """
+        if self._session is None:
+            return None
+        start, deadline = self._session
+        if time.monotonic() < deadline:
+            return None
+        self._session = None
+        return self.max_db_since(start)
+
 
-        return round(self.max_db, 2)  # arrondi pour lecture
\ No newline at end of file
+# Service unique : la source est ouverte une fois et réutilisée
+meter_service = MeterService(source_from_spec(os.environ.get("ALAIN_MIC")))
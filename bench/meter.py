@@ -0,0 +1,104 @@
+"""
+bench/meter.py
+
+Benchmark du service micro (cri pour continuer), sans périphérique audio.
+
+Pour chaque taille de buffer :
+    - coût CPU du calcul RMS -> dB par buffer (callback appelé en boucle) ;
+    - latence callback -> décision : délai entre la capture d'un buffer et
+      le moment où la boucle principale (60 FPS) le voit via le service
+      (avec un vrai micro, s'y ajoute la durée d'un buffer, colonne "période") ;
+    - latence d'attaque : délai entre le premier buffer du cri et la frame
+      qui le détecte.
+
+Usage :
+    python bench/meter.py [--blocksizes 256 512 1024] [--duration 2] [--source signal:scream]
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from audio import MeterService, SignalSource, source_from_spec  # noqa: E402
+
+FRAME_TIME = 1 / 60
+
+
+def bench_cpu(blocksize, iterations=2000, channels=1):
+    """
+    Mesure le coût du callback pour une taille de buffer.
+
+    Returns:
+        float: Durée moyenne d'un callback en microsecondes.
+    """
+    meter = MeterService(SignalSource("noise", blocksize=blocksize, channels=channels, seed=0))
+    block = meter.source.next_block()
+    start = time.perf_counter()
+    for _ in range(iterations):
+        meter.feed(block)
+    return (time.perf_counter() - start) / iterations * 1e6
+
+
+def bench_latency(source, duration, threshold=0.05):
+    """
+    Simule la boucle principale et mesure les latences de lecture.
+
+    Args:
+        source (InputSource): Source temps réel à mesurer.
+        duration (float): Durée de la simulation en secondes.
+        threshold (float): Niveau RMS à partir duquel un buffer compte comme un cri.
+
+    Returns:
+        tuple[np.ndarray, float | None]: Latences par buffer (s) et latence d'attaque (s).
+    """
+    meter = MeterService(source, history=1024)
+    meter.start()
+    latencies = []
+    onset = None
+    seen = 0
+    end = time.perf_counter() + duration
+    while time.perf_counter() < end:
+        time.sleep(FRAME_TIME)
+        now = time.perf_counter()
+        written = meter.written
+        for i in range(seen, written):
+            index = i % len(meter.times)
+            latencies.append(now - meter.times[index])
+            if onset is None and meter.rms[index] >= threshold:
+                onset = now - meter.times[index]
+        seen = written
+    meter.close()
+    return np.array(latencies), onset
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--blocksizes", type=int, nargs="+", default=[256, 512, 1024, 2048, 4096])
+    parser.add_argument("--duration", type=float, default=2.0, help="durée de chaque mesure de latence (s)")
+    parser.add_argument("--source", default="signal:scream", help="source : signal[:forme], wav:<chemin> ou device")
+    args = parser.parse_args()
+
+    print(f"{'buffer':>7} {'période':>9} {'CPU/buffer':>11} {'CPU %':>7} "
+          f"{'lat. moy':>9} {'lat. p95':>9} {'lat. max':>9} {'attaque':>9}")
+    for blocksize in args.blocksizes:
+        source = source_from_spec(args.source, blocksize=blocksize)
+        if isinstance(source, SignalSource):
+            source.delay = args.duration / 4
+        period = blocksize / source.sample_rate
+        cpu_us = bench_cpu(blocksize, channels=source.channels)
+        latencies, onset = bench_latency(source, args.duration)
+        if len(latencies) == 0:
+            print(f"{blocksize:>7} aucun buffer reçu")
+            continue
+        onset_text = f"{onset * 1000:7.1f}ms" if onset is not None else "      -  "
+        print(f"{blocksize:>7} {period * 1000:7.1f}ms {cpu_us:9.1f}us {cpu_us / (period * 1e6) * 100:6.2f}% "
+              f"{latencies.mean() * 1000:7.1f}ms {np.percentile(latencies, 95) * 1000:7.1f}ms "
+              f"{latencies.max() * 1000:7.1f}ms {onset_text}")
+
+
+if __name__ == "__main__":
+    main()
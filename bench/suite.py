@@ -0,0 +1,303 @@
+"""
+bench/suite.py
+
+Benchmarks des chemins critiques du jeu, sans fenêtre (pilotes SDL factices).
+
+Mesures :
+    - construction d'un `Enemy` par type, à froid (sprites retirés du cache)
+      et à chaud ;
+    - un pas de simulation (`Game.step` : horloge + `Game.update`) avec 10,
+      100 et 1000 ennemis ;
+    - une frame de `Game.draw` et de `Menu.draw` ;
+    - débit de `load_sprites` (chargement + découpage d'un spritesheet) ;
+    - latence de `SoundEffects.play_sound_one`.
+
+Les résultats (temps en microsecondes : médiane, moyenne, min, p95) sont
+écrits en JSON. Avec `--compare`, chaque mesure est comparée à une référence
+enregistrée : une médiane plus lente que la référence au-delà du seuil est une
+régression, et le code de sortie vaut 1.
+
+Usage :
+    python bench/suite.py --save bench/baseline.json      # enregistrer la référence
+    python bench/suite.py --compare bench/baseline.json   # comparer avant une release
+    python bench/suite.py --filter game --runs 50         # sous-ensemble, plus de mesures
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from headless import init_headless  # noqa: E402
+import pygame  # noqa: E402
+from game import Game  # noqa: E402
+from menu import Menu  # noqa: E402
+from enemy import Enemy, ENEMY_STATS, ENEMY_SPRITES, warm_enemy_sprites, evict_enemy_sprites  # noqa: E402
+from player import Player  # noqa: E402
+from inputs import ScriptedInput  # noqa: E402
+from rng import random_streams  # noqa: E402
+from atlas import pack_sprite_cache  # noqa: E402
+from utilitaire import load_sprites, SoundEffects, audio_engine, sprite_cache  # noqa: E402
+
+BENCHMARKS = []
+
+
+def benchmark(name):
+    """
+    Enregistre une fonction de benchmark, qui retourne une liste de `Result`.
+
+    Args:
+        name (str): Préfixe des noms de ses mesures (utilisé par `--filter`).
+    """
+    def register(func):
+        BENCHMARKS.append((name, func))
+        return func
+    return register
+
+
+class Result:
+    """
+    Mesures d'un benchmark.
+
+    Attributs :
+        name (str): Nom de la mesure (ex: "game.update/100").
+        samples (list[float]): Durées mesurées en secondes.
+        extra (dict): Informations complémentaires (débit, compteurs...).
+    """
+
+    def __init__(self, name, samples, **extra):
+        self.name = name
+        self.samples = samples
+        self.extra = extra
+
+    def to_dict(self):
+        samples = sorted(self.samples)
+        data = {
+            "unit": "us",
+            "runs": len(samples),
+            "median": statistics.median(samples) * 1e6,
+            "mean": statistics.fmean(samples) * 1e6,
+            "min": samples[0] * 1e6,
+            "p95": samples[int(0.95 * (len(samples) - 1))] * 1e6,
+        }
+        data.update(self.extra)
+        return data
+
+
+def timed(func, runs, setup=None):
+    """
+    Chronomètre `runs` appels de `func`.
+
+    Args:
+        func (callable): Code mesuré.
+        runs (int): Nombre de mesures.
+        setup (callable | None): Préparation non chronométrée avant chaque mesure.
+
+    Returns:
+        list[float]: Durée de chaque appel en secondes.
+    """
+    samples = []
+    for _ in range(runs):
+        if setup is not None:
+            setup()
+        start = time.perf_counter()
+        func()
+        samples.append(time.perf_counter() - start)
+    return samples
+
+
+def make_game(screen, enemies):
+    """
+    Partie donjon reproductible avec `enemies` ennemis : le joueur est immobile
+    et invulnérable, et plus aucun ennemi n'apparaît.
+    """
+    random_streams.reseed(0)
+    game = Game(screen, False, isDungeon=True)
+    game.spawnable = False
+    game.player.controls = ScriptedInput([])
+    game.player.is_invulnerable = True
+    game.player.iframe_duration = float("inf")
+    for _ in range(enemies):
+        game.spawn_enemy()
+    return game
+
+
+@benchmark("enemy.construct")
+def bench_enemy_construction(screen, runs):
+    results = []
+    player = Player()
+    for enemy_type in ENEMY_STATS:
+        def construct():
+            Enemy(enemy_type, player, screen, (100, 100))
+
+        cold = timed(construct, max(3, runs // 10), setup=lambda: evict_enemy_sprites([enemy_type]))
+        warm_enemy_sprites([enemy_type])
+        warm = timed(construct, runs)
+        results.append(Result(f"enemy.construct.cold/{enemy_type}", cold))
+        results.append(Result(f"enemy.construct.warm/{enemy_type}", warm))
+    warm_enemy_sprites()
+    # Les frames rechargées ne sont plus dans les pages : on regroupe à nouveau, comme au lancement
+    pack_sprite_cache(sprite_cache)
+    return results
+
+
+@benchmark("game.update")
+def bench_game_update(screen, runs):
+    results = []
+    for count in (10, 100, 1000):
+        game = make_game(screen, count)
+        for _ in range(10):  # laisse les ennemis se mettre en mouvement
+            game.step()
+        samples = timed(game.step, runs)
+        results.append(Result(f"game.update/{count}", samples, enemies=len(game.enemies)))
+        game.assets.shutdown()
+    return results
+
+
+@benchmark("game.draw")
+def bench_game_draw(screen, runs):
+    game = make_game(screen, 100)
+    for _ in range(10):
+        game.step()
+    game.draw()  # attend le chargement du fond du stage
+    samples = timed(game.draw, runs)
+    game.assets.shutdown()
+    return [Result("game.draw/100", samples)]
+
+
+@benchmark("menu.draw")
+def bench_menu_draw(screen, runs):
+    menu = Menu(screen, False)
+    menu.draw()
+    return [Result("menu.draw", timed(menu.draw, runs))]
+
+
+@benchmark("load_sprites")
+def bench_load_sprites(screen, runs):
+    sheets = [(path, frames) for path, frames in Player.SPRITES.values()]
+    sheets += [(info[0], info[1]) for sprites in ENEMY_SPRITES.values()
+               for state, info in sprites.items() if state != "animation_speed"]
+    frames = sum(count for _, count in sheets)
+
+    def load_all():
+        for path, count in sheets:
+            load_sprites(path, count)
+
+    samples = timed(load_all, max(3, runs // 10))
+    return [Result("load_sprites", samples, sheets=len(sheets),
+                   frames_per_s=frames / statistics.median(samples))]
+
+
+@benchmark("sound.play_sound_one")
+def bench_play_sound(screen, runs):
+    sound = SoundEffects()
+    files = [path for paths in Player.SOUND_GROUPS.values() for path in paths] + [Player.KILL_SOUND]
+    for path in files:
+        sound.play_sound_one(path, 0)  # décodage hors mesure
+    pool = audio_engine.pool
+    if pool is None:
+        return []
+    # Sans la limite par frame : chaque appel passe par le choix de canal et la lecture
+    max_per_frame, pool.max_per_frame = pool.max_per_frame, None
+    index = iter(range(10 ** 9))
+    samples = timed(lambda: sound.play_sound_one(files[next(index) % len(files)], 0), runs)
+    pool.max_per_frame = max_per_frame
+    pygame.mixer.stop()
+    return [Result("sound.play_sound_one", samples, played=pool.played, stolen=pool.stolen)]
+
+
+def run(names_filter=None, runs=20):
+    """
+    Lance les benchmarks.
+
+    Args:
+        names_filter (str | None): Ne lance que les benchmarks dont le nom contient ce texte.
+        runs (int): Nombre de mesures par benchmark.
+
+    Returns:
+        dict: Rapport JSON (informations sur la machine et résultats).
+    """
+    screen = init_headless()
+    audio_engine.init()
+    results = {}
+    for name, func in BENCHMARKS:
+        if names_filter and names_filter not in name:
+            continue
+        for result in func(screen, runs):
+            results[result.name] = result.to_dict()
+            print(f"{result.name:<36} {results[result.name]['median']:>12.1f} us")
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "pygame": pygame.version.ver,
+            "platform": platform.platform(),
+            "atlas": sprite_cache.atlas is not None,
+            "packed_frames": sprite_cache.packed,
+            "runs": runs,
+            "date": time.strftime("%Y-%m-%d %H:%M:%S"),
+        },
+        "results": results,
+    }
+
+
+def compare(report, baseline, threshold):
+    """
+    Compare les médianes d'un rapport à celles d'une référence.
+
+    Args:
+        report (dict): Rapport courant.
+        baseline (dict): Rapport de référence.
+        threshold (float): Ralentissement toléré (0.15 = +15 %).
+
+    Returns:
+        list[str]: Noms des mesures en régression.
+    """
+    regressions = []
+    print(f"\n{'mesure':<36} {'référence':>12} {'actuel':>12} {'écart':>8}")
+    for name, current in report["results"].items():
+        reference = baseline["results"].get(name)
+        if reference is None:
+            print(f"{name:<36} {'-':>12} {current['median']:>10.1f}us {'nouveau':>8}")
+            continue
+        ratio = current["median"] / reference["median"] - 1
+        flag = ""
+        if ratio > threshold:
+            regressions.append(name)
+            flag = "  <- régression"
+        print(f"{name:<36} {reference['median']:>10.1f}us {current['median']:>10.1f}us {ratio:>+7.1%}{flag}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=20, help="nombre de mesures par benchmark")
+    parser.add_argument("--filter", help="ne lance que les benchmarks dont le nom contient ce texte")
+    parser.add_argument("--output", default="bench/results.json", help="fichier JSON des résultats")
+    parser.add_argument("--save", metavar="FICHIER", help="enregistre aussi les résultats comme référence")
+    parser.add_argument("--compare", metavar="FICHIER", help="compare les résultats à une référence")
+    parser.add_argument("--threshold", type=float, default=0.15,
+                        help="ralentissement toléré avant de signaler une régression (défaut : 0.15)")
+    args = parser.parse_args()
+
+    report = run(args.filter, args.runs)
+    for path in filter(None, (args.output, args.save)):
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        print(f"Résultats écrits dans {path}")
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)
+        regressions = compare(report, baseline, args.threshold)
+        if regressions:
+            print(f"\n{len(regressions)} régression(s) au-delà de {args.threshold:.0%}")
+            sys.exit(1)
+        print("\nAucune régression")
+
+
+if __name__ == "__main__":
+    main()
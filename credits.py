@@ -1,6 +1,7 @@
 import pygame
-from settings import BLACK, HEIGHT
+from settings import BLACK, HEIGHT, IDLE_FPS
 from utilitaire import pixelate, chemin_relatif
+from timing import frame_scheduler
 
 
 class Credits:
@@ -21,6 +22,7 @@ class Credits:
         running (bool): Indique si l'écran est actif.
         retour (bool): Indique si on doit retourner au menu précédent.
         pixel_ratio (float): Facteur de pixelisation appliqué aux textes.
+        layer (pygame.Surface | None): Écran pré-composé (construit au premier affichage).
     """
     FONT_TITLE = (chemin_relatif("assets/fonts/Chomsky.otf"), 52)
     FONT_SUBTITLE = (chemin_relatif("assets/fonts/Chomsky.otf"), 34)
@@ -51,16 +53,19 @@ class Credits:
         self.running = True
         self.retour = False
         self.pixel_ratio = 0.8
+        self.layer = None
 
     def run(self):
         """
         Boucle principale de l'écran des crédits.
         Gère les événements, le dessin, et met à jour l'affichage.
         """
+        frame_scheduler.reset()
         while self.running:
             self._handle_events()
             self._draw()
             pygame.display.flip()
+            frame_scheduler.tick(IDLE_FPS)
 
     def _handle_events(self):
         """
@@ -84,24 +89,39 @@ class Credits:
 
     def _draw(self):
         """
-        Dessine tous les éléments de l'écran des crédits :
+        Affiche l'écran, entièrement statique : il est composé une seule fois
+        puis simplement blitté à chaque frame.
+        """
+        if self.layer is None:
+            self.layer = self._bake_layer()
+        self.screen.blit(self.layer, (0, 0))
+
+    def _bake_layer(self):
+        """
+        Compose tous les éléments de l'écran :
         - Fond
         - Bouton retour
         - Titre
-        - Sections (Assets, Sons, Développeurs)
+        - Sections
+
+        Returns:
+            pygame.Surface: Écran complet, de la taille de la fenêtre.
         """
+        layer = pygame.Surface(self.screen.get_size()).convert()
+
         # Fond
         background = pygame.image.load(self.BG_IMG).convert_alpha()
-        self.screen.blit(background, (0, 0))
+        layer.blit(background, (0, 0))
 
         # Bouton retour
-        self.screen.blit(self.back, (10, 10))
+        layer.blit(self.back, (10, 10))
 
         # Titre
-        self._draw_title("Crédits")
+        self._draw_title(layer, "Crédits")
 
         # Sections
         self._draw_section(
+            layer,
             "Assets",
             ["Tiny Sword Pack by Pixel Frog on itch.io"],
             pos=(240, 160),
@@ -109,6 +129,7 @@ class Credits:
         )
 
         self._draw_section(
+            layer,
             "Sons",
             [
                 "musiques, de pixabay.com:",
@@ -127,11 +148,12 @@ class Credits:
                 "musique écran de mort :",
                 "KL peach game over II, Lightyeartraxx",
             ],
-            pos=(self.screen.get_width() - 340, 160),
+            pos=(layer.get_width() - 340, 160),
             align="right"
         )
 
         self._draw_section(
+            layer,
             "Développeurs",
             [
                 "Bastien ALLEGRE / Hugo BARBIERI",
@@ -141,23 +163,26 @@ class Credits:
             pos=(220, HEIGHT - 420),
             align="left"
         )
+        return layer
 
-    def _draw_title(self, text: str):
+    def _draw_title(self, surface, text: str):
         """
         Affiche le titre principal centré en haut de l'écran.
 
         Args:
+            surface (pygame.Surface): Surface sur laquelle dessiner.
             text (str): Texte du titre.
         """
         title_text = self.font_title.render(text, True, BLACK)
-        title_rect = title_text.get_rect(midtop=(self.screen.get_width() // 2, 50))
-        self.screen.blit(pixelate(title_text, self.pixel_ratio), title_rect)
+        title_rect = title_text.get_rect(midtop=(surface.get_width() // 2, 50))
+        surface.blit(pixelate(title_text, self.pixel_ratio), title_rect)
 
-    def _draw_section(self, subtitle: str, content: list[str], pos: tuple[int, int], align: str = "left"):
+    def _draw_section(self, surface, subtitle: str, content: list[str], pos: tuple[int, int], align: str = "left"):
         """
         Affiche une section avec sous-titre et contenu.
 
         Args:
+            surface (pygame.Surface): Surface sur laquelle dessiner.
             subtitle (str): Nom de la section.
             content (list[str]): Lignes de texte de la section.
             pos (tuple[int, int]): Position du sous-titre.
@@ -166,7 +191,7 @@ class Credits:
         # Sous-titre
         subtitle_surf = self.font_subtitle.render(subtitle, True, BLACK)
         subtitle_rect = subtitle_surf.get_rect(**{f"top{align}": pos})
-        self.screen.blit(pixelate(subtitle_surf, self.pixel_ratio), subtitle_rect)
+        surface.blit(pixelate(subtitle_surf, self.pixel_ratio), subtitle_rect)
 
         # Contenu
         for i, line in enumerate(content):
@@ -174,6 +199,6 @@ class Credits:
             x, y = pos
             y_offset = y + 40 + i * 30
             if align == "left":
-                self.screen.blit(line_text, (x - 20, y_offset))
+                surface.blit(line_text, (x - 20, y_offset))
             elif align == "right":
-                self.screen.blit(line_text, (self.screen.get_width() - 500, y_offset))
+                surface.blit(line_text, (surface.get_width() - 500, y_offset))
@@ -0,0 +1,156 @@
+"""
+cutscene.py
+
+Couche d'affichage des dialogues des cinématiques.
+
+Le cadre de la boîte de dialogue est dessiné une seule fois, et chaque
+réplique du script est pré-rendue (boîte + texte découpé en lignes) au
+lancement de la cinématique : pendant le dialogue, chaque frame n'est plus
+qu'un blit. Un effet machine à écrire optionnel révèle le texte
+progressivement en ne copiant que les caractères nouvellement révélés.
+"""
+import pygame
+from settings import WIDTH, HEIGHT, WHITE, BLACK, DIALOGUE_TYPEWRITER_SPEED
+from utilitaire import text_cache, wrap_text
+
+
+class DialoguePage:
+    """
+    Réplique pré-rendue.
+
+    Attributs :
+        surface (pygame.Surface): Boîte de dialogue complète avec le texte.
+        lines (list[tuple[int, list[int]]]): Pour chaque ligne, sa position verticale
+            dans la boîte et l'abscisse de fin de chacun de ses caractères.
+        length (int): Nombre total de caractères.
+    """
+
+    def __init__(self, surface, lines):
+        self.surface = surface
+        self.lines = lines
+        self.length = sum(len(offsets) - 1 for _, offsets in lines)
+
+
+class DialogueOverlay:
+    """
+    Boîte de dialogue des cinématiques, pré-rendue réplique par réplique.
+
+    Attributs :
+        font (pygame.font.Font): Police du texte.
+        color (tuple): Couleur du texte.
+        typewriter_speed (float): Caractères révélés par pas de simulation (0 = texte affiché d'un coup).
+        pages (list[DialoguePage]): Répliques du script chargé.
+        index (int | None): Réplique affichée.
+    """
+    BOX_RECT = pygame.Rect(50, HEIGHT - 200, WIDTH - 100, 150)
+    BORDER = 3
+    TEXT_OFFSET = (20, 20)  # position du texte dans la boîte
+    TEXT_WIDTH = WIDTH - 140  # largeur disponible pour le texte
+    LINE_SPACING = 5
+
+    def __init__(self, font, color=WHITE, typewriter_speed=DIALOGUE_TYPEWRITER_SPEED):
+        """
+        Args:
+            font (pygame.font.Font): Police du texte.
+            color (tuple): Couleur du texte.
+            typewriter_speed (float): Caractères révélés par pas de simulation (0 = désactivé).
+        """
+        self.font = font
+        self.color = color
+        self.typewriter_speed = typewriter_speed
+        self.pages = []
+        self.index = None
+
+        # Cadre dessiné une seule fois
+        self.box = pygame.Surface(self.BOX_RECT.size)
+        self.box.fill(BLACK)
+        pygame.draw.rect(self.box, WHITE, self.box.get_rect(), self.BORDER)
+
+        # Surface de la réplique en cours de révélation (réutilisée)
+        self._reveal = self.box.copy()
+        self._revealed = 0.0
+
+    def _render_page(self, text):
+        surface = self.box.copy()
+        x, y = self.TEXT_OFFSET
+        lines = []
+        for line in wrap_text(text, self.font, self.TEXT_WIDTH):
+            surface.blit(text_cache.render(self.font, line, self.color), (x, y))
+            offsets = [self.font.size(line[:i])[0] for i in range(len(line) + 1)]
+            lines.append((y, offsets))
+            y += self.font.get_height() + self.LINE_SPACING
+        return DialoguePage(surface, lines)
+
+    def load(self, script):
+        """
+        Pré-rend toutes les répliques d'un script (au lancement de la cinématique).
+
+        Args:
+            script (list[str]): Répliques du dialogue.
+        """
+        self.pages = [self._render_page(text) for text in script]
+        self.index = None
+
+    def show(self, index):
+        """
+        Passe à une réplique (depuis le début si l'effet machine à écrire est actif).
+        Appelé par la simulation, pas par le rendu : la révélation avance de la même
+        façon que la partie soit affichée ou non (`--headless`, `--replay`).
+
+        Args:
+            index (int): Indice de la réplique.
+        """
+        self.index = index
+        self._revealed = 0.0
+        self._reveal.blit(self.box, (0, 0))
+
+    @property
+    def revealing(self):
+        """True si la réplique affichée n'est pas encore entièrement révélée."""
+        return (self.typewriter_speed > 0 and self.index is not None
+                and self._revealed < self.pages[self.index].length)
+
+    def reveal_all(self):
+        """
+        Termine immédiatement la révélation de la réplique affichée.
+
+        Returns:
+            bool: True si du texte restait à révéler.
+        """
+        if not self.revealing:
+            return False
+        self._revealed = self.pages[self.index].length
+        return True
+
+    def update(self):
+        """Révèle les caractères suivants (effet machine à écrire), une fois par pas de simulation."""
+        if not self.revealing:
+            return
+        page = self.pages[self.index]
+        start = int(self._revealed)
+        self._revealed = min(page.length, self._revealed + self.typewriter_speed)
+        end = int(self._revealed)
+
+        # Copie seulement les caractères nouvellement révélés depuis la réplique pré-rendue
+        x = self.TEXT_OFFSET[0]
+        height = self.font.get_height()
+        first = 0
+        for y, offsets in page.lines:
+            count = len(offsets) - 1
+            a, b = max(start - first, 0), min(end - first, count)
+            if a < b:
+                area = pygame.Rect(x + offsets[a], y, offsets[b] - offsets[a], height)
+                self._reveal.blit(page.surface, area, area)
+            first += count
+
+    def draw(self, screen):
+        """
+        Affiche la boîte de dialogue de la réplique en cours (voir `show`).
+
+        Args:
+            screen (pygame.Surface): Surface d'affichage.
+        """
+        if self.index is None:
+            return
+        surface = self._reveal if self.revealing else self.pages[self.index].surface
+        screen.blit(surface, self.BOX_RECT)
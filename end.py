@@ -1,10 +1,11 @@
 # end.py
+import numpy as np
 import pygame
 from settings import TITLE, WHITE, WIDTH, HEIGHT
-from utilitaire import load_sprites, animate, SoundEffects, chemin_relatif, write_score
-from audio import SoundMeter
-
-import threading
+from utilitaire import animate, SoundEffects, chemin_relatif, write_score, sprite_cache, text_cache
+from audio import meter_service
+from timing import game_clock
+from replay import RESPAWN
 
 class End:
     """
@@ -28,12 +29,20 @@ class End:
         retry_button (pygame.Rect): Zone du bouton "Scream to continue".
         menu_button (pygame.Rect): Zone du bouton "Main Menu".
         sound (SoundEffects): Gestionnaire des sons et musiques.
-        meters (SoundMeter): Microphone pour mesurer le volume du joueur.
+        meter (MeterService): Service micro partagé pour mesurer le volume du joueur.
     """
     FONT_TITLE = (chemin_relatif("assets/fonts/Chomsky.otf"), 64)
     FONT_BUTTON = (chemin_relatif("assets/fonts/GenAR102.TTF"), 32)
     DEATH_SPRITE_PATH = chemin_relatif("assets/images/player/Dead.png")
     DEATH_FRAMES = 14
+    RETRY_IMG = chemin_relatif("assets/images/ui/retry_button.png")
+    RETRY_PRESSED_IMG = chemin_relatif("assets/images/ui/retry_button_pressed.png")
+    MENU_IMG = chemin_relatif("assets/images/ui/menu_button.png")
+    MICRO_IMG = chemin_relatif("assets/images/ui/micro.png")
+    LISTEN_DURATION = 3  # durée de l'écoute micro (s)
+    RESPAWN_DB = 80  # seuil du cri pour continuer (-20 dBFS, voir audio.rms_to_db)
+    LEVEL_BARS = 64  # nombre de barres de l'indicateur de niveau micro
+    LEVEL_FLOOR_DB = -60  # niveau (dBFS) correspondant à une barre vide
 
     def __init__(self, screen, player, game):
         """
@@ -54,31 +63,34 @@ class End:
         self.font_button = pygame.font.Font(*self.FONT_BUTTON)
 
         # Sprites & Animation
-        self.death_sprite = load_sprites(self.DEATH_SPRITE_PATH, self.DEATH_FRAMES)
+        self.death_sprite = sprite_cache.get(self.DEATH_SPRITE_PATH, self.DEATH_FRAMES)
         self.current_frame = 0
         self.animation_speed = 0.2
         self.frame_timer = 0
 
         # Boutons
-        self.retry_button_image = pygame.image.load(chemin_relatif("assets/images/ui/retry_button.png")).convert_alpha()
-        self.retry_button_pressed_image = pygame.image.load(chemin_relatif("assets/images/ui/retry_button_pressed.png")).convert_alpha()
-        self.menu_button_image = pygame.image.load(chemin_relatif("assets/images/ui/menu_button.png")).convert_alpha()
+        self.retry_button_image = sprite_cache.get_image(self.RETRY_IMG)
+        self.retry_button_pressed_image = sprite_cache.get_image(self.RETRY_PRESSED_IMG)
+        self.menu_button_image = sprite_cache.get_image(self.MENU_IMG)
         self.retry_button = pygame.Rect(WIDTH // 2 - 310, HEIGHT // 4, 300, 200)
         self.menu_button = pygame.Rect(WIDTH // 2 + 10, HEIGHT // 4, 300, 200)
         self.retry_clicked = False
 
         #microphone
-        self.micro= pygame.image.load(chemin_relatif("assets/images/ui/micro.png")).convert_alpha()
+        self.micro = sprite_cache.get_image(self.MICRO_IMG)
         self.microRect=self.micro.get_rect(center=(WIDTH//2,HEIGHT-200))
+        self.level_rect = pygame.Rect(0, 0, self.LEVEL_BARS * 3, self.microRect.height)
+        self.level_rect.midleft = (self.microRect.right + 20, self.microRect.centery)
+        self._levels = np.zeros(self.LEVEL_BARS, dtype=np.float32)  # réutilisé à chaque frame
 
         # Audio
         self.sound = SoundEffects()
-        self.meters = SoundMeter()
+        self.meter = meter_service
 
         # Timer
         self.timer = 1
         self.timer_active = False
-        self.last_tick = pygame.time.get_ticks()
+        self.last_tick = game_clock.time
 
     # ---------------------------
     # Logic
@@ -92,30 +104,34 @@ class End:
         """
         if event.type == pygame.MOUSEBUTTONDOWN:
             if self.retry_button.collidepoint(event.pos) and (self.player.nb_rea < 3):
-                # Lancer l'écoute micro dans un thread
-                self.timer_active = True
-                self.timer = 0
-                self.last_tick = pygame.time.get_ticks()
-                threading.Thread(target=self._try_respawn).start()
+                self._start_listening()
             elif self.menu_button.collidepoint(event.pos):
                 self._go_to_menu()
         elif event.type == pygame.JOYBUTTONDOWN:
             if event.button == 4 and (self.player.nb_rea < 3):
-                # Lancer l'écoute micro dans un thread
-                self.timer_active = True
-                self.timer = 0
-                self.last_tick = pygame.time.get_ticks()
-                threading.Thread(target=self._try_respawn).start()
+                self._start_listening()
             elif event.button == 5:
                 self._go_to_menu()
 
-    def _try_respawn(self):
+    def _start_listening(self):
+        """
+        Lance (ou relance) l'écoute micro sur le flux partagé.
+        Un nouveau clic remplace l'écoute en cours au lieu d'en ajouter une.
+        """
+        self.timer_active = True
+        self.timer = 0
+        self.last_tick = game_clock.time
+        self.meter.listen(self.LISTEN_DURATION)
+
+    def _try_respawn(self, max_value):
         """
-        Vérifie si le joueur crie assez fort pour continuer.
-        Seuil fixé à 100 dB (valeur simulée via SoundMeter).
+        Vérifie si le joueur a crié assez fort pour continuer.
+        Seuil fixé à RESPAWN_DB (80 : cri proche du micro, le silence vaut 0).
+
+        Args:
+            max_value (float): Niveau maximal mesuré pendant l'écoute.
         """
-        max_value = self.meters.get_max_db(3)
-        if max_value >= 100:
+        if max_value >= self.RESPAWN_DB:
             self.respawn_player()
 
     def _go_to_menu(self):
@@ -123,6 +139,7 @@ class End:
         Retourne au menu principal.
         Stoppe la musique et modifie l'état du jeu.
         """
+        self.meter.cancel()
         self.sound.stop_music()
         write_score(str(self.player.score))
         self.game.running = False
@@ -135,24 +152,29 @@ class End:
         - Change son état
         - Autorise respawn si pas au stage final
         """
+        self.game.record_action(RESPAWN)
         self.sound.stop_music()
         self.game.spawnable = (self.game.stage != 5)
         self.player.hp = 4
         self.player.nb_rea += 1
         self.player.state = "idleR"
         self.timer = 0  # reset timer quand le joueur respawn
-        self.last_tick = pygame.time.get_ticks()
+        self.last_tick = game_clock.time
 
 
     def update(self):
-        """Met à jour l'animation de mort."""
-        # Timer incrémenté toutes les 1000ms
+        """Met à jour l'animation de mort et relève le résultat de l'écoute micro."""
+        # Timer incrémenté toutes les secondes (temps de jeu)
         if self.timer_active:
-            now = pygame.time.get_ticks()
-            if now - self.last_tick >= 1000:
+            now = game_clock.time
+            if now - self.last_tick >= 1:
                 self.timer += 1
                 self.last_tick = now
 
+        max_value = self.meter.poll()
+        if max_value is not None:
+            self._try_respawn(max_value)
+
         mouse_pressed = pygame.mouse.get_pressed()
         mouse_pos = pygame.mouse.get_pos()
         self.retry_clicked = self.retry_button.collidepoint(mouse_pos) and mouse_pressed[0]
@@ -178,11 +200,12 @@ class End:
         self._draw_button(self.menu_button, self.menu_button_image)
 
         if self.timer_active:
-            timer_text = self.font_button.render(f"{self.timer}s", True, WHITE)
+            timer_text = text_cache.render(self.font_button, f"{self.timer}s", WHITE)
             timer_rect = timer_text.get_rect(center=(WIDTH // 2, HEIGHT - 100))
             self.screen.blit(timer_text, timer_rect)
             # Microphone
             self._draw_button(self.microRect, self.micro)
+            self._draw_level_meter()
 
 
 
@@ -193,7 +216,7 @@ class End:
         Args:
             text (str): Texte du titre.
         """
-        surf = self.font_title.render(text, True, WHITE)
+        surf = text_cache.render(self.font_title, text, WHITE)
         rect = surf.get_rect(center=(self.screen.get_width() // 2, 100))
         self.screen.blit(surf, rect)
 
@@ -208,6 +231,25 @@ class End:
                                         self.screen.get_height() // 2))
             self.screen.blit(img, rect)
 
+    def _draw_level_meter(self):
+        """
+        Affiche le niveau du micro en direct (enveloppe des derniers buffers),
+        à droite de l'icône du microphone.
+        """
+        levels = self.meter.analyzer.series(self._levels)
+        # RMS -> dBFS -> hauteur relative (0 à 1), calculé en place
+        np.add(levels, 1e-6, out=levels)
+        np.log10(levels, out=levels)
+        levels *= 20 / -self.LEVEL_FLOOR_DB
+        levels += 1
+        np.clip(levels, 0, 1, out=levels)
+
+        left, bottom = self.level_rect.left, self.level_rect.bottom
+        for i, level in enumerate(levels):
+            height = int(level * self.level_rect.height)
+            if height:
+                pygame.draw.rect(self.screen, WHITE, (left + i * 3, bottom - height, 2, height))
+
     def _draw_button(self, rect: pygame.Rect, image):
         """
         Affiche un bouton avec texte centré.
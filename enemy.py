@@ -1,7 +1,8 @@
 import pygame
 import math
-import time
-from utilitaire import load_sprites, animate, scale_sprites, chemin_relatif
+from utilitaire import animate, chemin_relatif, sprite_cache
+from timing import game_clock
+from profiling import timed
 
 # Dictionnaire contenant les statistiques des différents types d'ennemis
 ENEMY_STATS = {
@@ -63,73 +64,94 @@ ENEMY_STATS = {
     }
 }
 
+# Spritesheets orientés vers la droite : les variantes gauche ("walkL", "attackL",
+# "idleL") sont dérivées par miroir horizontal (voir SpriteCache.get_mirrored).
 ENEMY_SPRITES = {
     "pawn": {
         "walkR": (chemin_relatif("assets/images/enemy/pawn/Pawn_Run.png"), 6, 1),
         "attackR": (chemin_relatif("assets/images/enemy/pawn/Pawn_Attack.png"), 6, 1),
-        "walkL": (chemin_relatif("assets/images/enemy/pawn/Pawn_RunL.png"), 6, 1),
-        "attackL": (chemin_relatif("assets/images/enemy/pawn/Pawn_Attack_reversed.png"), 6, 1),
         "idleR": (chemin_relatif("assets/images/enemy/pawn/Pawn_IdleR.png"), 6, 1),
-        "idleL": (chemin_relatif("assets/images/enemy/pawn/Pawn_IdleL.png"), 6, 1),
         "animation_speed": 0.15
     },
     "goblin": {
         "walkR": (chemin_relatif("assets/images/enemy/goblin/Goblin_Run.png"), 6, 1),
         "attackR": (chemin_relatif("assets/images/enemy/goblin/Goblin_Attack.png"), 6, 1),
-        "walkL": (chemin_relatif("assets/images/enemy/goblin/Goblin_Run_reversed.png"), 6, 1),
-        "attackL": (chemin_relatif("assets/images/enemy/goblin/Goblin_Attack_reversed.png"), 6, 1),
         "idleR": (chemin_relatif("assets/images/enemy/goblin/Goblin_IdleR.png"), 7, 1),
-        "idleL": (chemin_relatif("assets/images/enemy/goblin/Goblin_IdleL.png"), 7, 1),
         "animation_speed": 0.15
     },
     "scout": {
         "walkR": (chemin_relatif("assets/images/enemy/scout/scoutRun.png"), 8, 3),
         "attackR": (chemin_relatif("assets/images/enemy/scout/scoutAttack.png"), 3, 3),
-        "walkL": (chemin_relatif("assets/images/enemy/scout/scoutRunL.png"), 8, 3),
-        "attackL": (chemin_relatif("assets/images/enemy/scout/scoutAttackL.png"), 3, 3),
         "idleR": (chemin_relatif("assets/images/enemy/scout/scoutIdle.png"), 8, 3),
-        "idleL": (chemin_relatif("assets/images/enemy/scout/scoutIdleL.png"), 8, 3),
         "animation_speed": 0.15
     },
     "tnt": {
         "walkR": (chemin_relatif("assets/images/enemy/tnt/tntRun.png"), 6, 1),
         "attackR": (chemin_relatif("assets/images/enemy/tnt/tntAttack.png"), 7, 1),
-        "walkL": (chemin_relatif("assets/images/enemy/tnt/tntRunL.png"), 6, 1),
-        "attackL": (chemin_relatif("assets/images/enemy/tnt/tntAttackL.png"), 7, 1),
         "idleR": (chemin_relatif("assets/images/enemy/tnt/tntIdle.png"), 6, 1),
-        "idleL": (chemin_relatif("assets/images/enemy/tnt/tntIdleL.png"), 6, 1),
         "animation_speed": 0.15
     },
     "lancier": {
         "walkR": (chemin_relatif("assets/images/enemy/lancier/Lancier_Run.png"), 6, 1),
         "attackR": (chemin_relatif("assets/images/enemy/lancier/Lancier_Attack.png"), 3, 1),
-        "walkL": (chemin_relatif("assets/images/enemy/lancier/Lancier_RunL.png"), 6, 1),
-        "attackL": (chemin_relatif("assets/images/enemy/lancier/Lancier_Attack_reversed.png"), 3, 1),
         "idleR": (chemin_relatif("assets/images/enemy/lancier/Lancier_IdleR.png"), 12, 1),
-        "idleL": (chemin_relatif("assets/images/enemy/lancier/Lancier_IdleL.png"), 12, 1),
         "animation_speed": 0.15
     },
     "archer": {
         "walkR": (chemin_relatif("assets/images/enemy/archer/archerWalkR.png"), 6, 1),
         "attackR": (chemin_relatif("assets/images/enemy/archer/archerAttackR.png"), 8, 1),
-        "walkL": (chemin_relatif("assets/images/enemy/archer/archerWalkL.png"), 6, 1),
-        "attackL": (chemin_relatif("assets/images/enemy/archer/archerAttackL.png"), 8, 1),
         "idleR": (chemin_relatif("assets/images/enemy/archer/archerIdleR.png"), 6, 1),
-        "idleL": (chemin_relatif("assets/images/enemy/archer/archerIdleL.png"), 6, 1),
         "animation_speed": 0.15
     },
     "boss": {
         "walkR": (chemin_relatif("assets/images/enemy/boss/Boss_Run.png"), 8, 5),
         "attackR": (chemin_relatif("assets/images/enemy/boss/Boss_Attack.png"), 6, 5),
-        "walkL": (chemin_relatif("assets/images/enemy/boss/Boss_Run_reversed.png"), 8, 5),
-        "attackL": (chemin_relatif("assets/images/enemy/boss/Boss_Attack_reversed.png"), 6, 5),
         "idleR": (chemin_relatif("assets/images/enemy/boss/Boss_IdleR.png"), 12, 5),
-        "idleL": (chemin_relatif("assets/images/enemy/boss/Boss_IdleL.png"), 12, 5),
         "death": (chemin_relatif("assets/images/enemy/boss/Boss_Death.png"), 10, 5),
         "animation_speed": 0.05
     }
 }
 
+# Ressources communes à tous les ennemis
+EXPLOSION_SPRITES = (chemin_relatif("assets/images/items/explosion.png"), 11, 1, (100, 100))
+QUESTION_MARK_IMAGE = (chemin_relatif("assets/images/ressources/question_mark.png"), (30, 30))
+
+
+def warm_enemy_sprites(enemy_types=None):
+    """
+    Précharge dans le cache partagé les sprites d'un ou plusieurs types d'ennemis,
+    ainsi que les ressources communes (explosion, point d'interrogation).
+
+    Args:
+        enemy_types (iterable[str] | None): Types à précharger (tous si None).
+    """
+    if enemy_types is None:
+        enemy_types = ENEMY_SPRITES.keys()
+    for enemy_type in enemy_types:
+        for state, sprite_info in ENEMY_SPRITES[enemy_type].items():
+            if state == "animation_speed":
+                continue
+            path, frames, scale_factor = sprite_info
+            sprite_cache.get(path, frames, scale_factor or 1)
+            if state.endswith("R"):
+                sprite_cache.get_mirrored(path, frames, scale_factor or 1)
+    sprite_cache.get(*EXPLOSION_SPRITES)
+    sprite_cache.get_image(*QUESTION_MARK_IMAGE)
+
+
+def evict_enemy_sprites(enemy_types):
+    """
+    Retire du cache partagé les sprites des types d'ennemis donnés.
+
+    Args:
+        enemy_types (iterable[str]): Types dont les sprites ne sont plus nécessaires.
+    """
+    for enemy_type in enemy_types:
+        for state, sprite_info in ENEMY_SPRITES[enemy_type].items():
+            if state != "animation_speed":
+                sprite_cache.evict(sprite_info[0])
+
+
 class Enemy(pygame.sprite.Sprite):
     """
     Représente un ennemi dans le jeu.
@@ -162,7 +184,7 @@ class Enemy(pygame.sprite.Sprite):
         self.enemy_type = enemy_type
         self.player = player
         self.screen = screen
-        self.last_attack_time = 0
+        self.last_attack_time = float("-inf")  # temps de jeu (jamais)
 
         # Charger les stats de l'ennemi à partir du dictionnaire
         self.load_stats()
@@ -171,10 +193,7 @@ class Enemy(pygame.sprite.Sprite):
 
         self.is_dead = False
         self.explosion_frame_index = 0
-        self.explosionFrames = [
-            pygame.transform.scale(frame, (100, 100))
-            for frame in load_sprites(chemin_relatif("assets/images/items/explosion.png"), 11)
-        ]
+        self.explosionFrames = sprite_cache.get(*EXPLOSION_SPRITES)
 
         self.current_frame = 0
         self.image = self.walkRSprites[self.current_frame]
@@ -183,7 +202,7 @@ class Enemy(pygame.sprite.Sprite):
         self.frame_timer = 0
         self.state = "idleR"
         self.attacking = False
-        self.last_damage_time = 0
+        self.last_damage_time = float("-inf")
         self.faceRorL = "R"
         self.stop_distance = 35
 
@@ -203,8 +222,7 @@ class Enemy(pygame.sprite.Sprite):
         self.default_speed = self.speed
 
     def load_common_assets(self):
-        self.question_mark = pygame.image.load(chemin_relatif("assets/images/ressources/question_mark.png")).convert_alpha()
-        self.question_mark = pygame.transform.scale(self.question_mark, (30, 30))
+        self.question_mark = sprite_cache.get_image(*QUESTION_MARK_IMAGE)
         self.question_mark_rect = self.question_mark.get_rect()
 
     def load_sprites(self):
@@ -217,24 +235,18 @@ class Enemy(pygame.sprite.Sprite):
                 continue
 
             path, frames, scale_factor = sprite_info
-            sprites = load_sprites(path, frames)
-
-            if scale_factor is not None and scale_factor != 1:
-                sprites = scale_sprites(sprites, scale_factor)
+            sprites = sprite_cache.get(path, frames, scale_factor or 1)
 
-            # Assigner les sprites à l'instance
+            # Assigner les sprites à l'instance (la version gauche est un miroir de la droite)
             if state == "walkR":
                 self.walkRSprites = sprites
-            elif state == "walkL":
-                self.walkLSprites = sprites
+                self.walkLSprites = sprite_cache.get_mirrored(path, frames, scale_factor or 1)
             elif state == "attackR":
                 self.attackRSprites = sprites
-            elif state == "attackL":
-                self.attackLSprites = sprites
+                self.attackLSprites = sprite_cache.get_mirrored(path, frames, scale_factor or 1)
             elif state == "idleR":
                 self.idleRSprites = sprites
-            elif state == "idleL":
-                self.idleLSprites = sprites
+                self.idleLSprites = sprite_cache.get_mirrored(path, frames, scale_factor or 1)
             elif state == "death":
                 self.deathSprites = sprites
 
@@ -259,6 +271,7 @@ class Enemy(pygame.sprite.Sprite):
                 self.attacking = False
                 self.current_frame = 0
 
+    @timed
     def update(self):
         if self.enemy_type == "boss" and self.is_dead:
             self.handle_boss_death()
@@ -307,8 +320,8 @@ class Enemy(pygame.sprite.Sprite):
                 self.is_knockback = False
                 self.currentKB = self.knockback_distance
 
-        current_time = time.time()
-        if current_time - getattr(self, 'stagger_start_time', 0) >= self.stagger_timer:
+        current_time = game_clock.time
+        if current_time - getattr(self, 'stagger_start_time', float("-inf")) >= self.stagger_timer:
             self.reset_from_stagger()
 
     def reset_from_stagger(self):
@@ -321,7 +334,7 @@ class Enemy(pygame.sprite.Sprite):
         self.check_distance_and_move()
 
     def handle_player_attack(self):
-        current_time = time.time()
+        current_time = game_clock.time
         if current_time - self.last_damage_time >= 0.5:
             if self.state != "staggered":
                 self.take_damage(self.player.str)
@@ -339,7 +352,6 @@ class Enemy(pygame.sprite.Sprite):
         else:
             self.state = "idleR"
         self.question_mark_rect.center = (self.rect.centerx, self.rect.top - 20)
-        self.screen.blit(self.question_mark, self.question_mark_rect)
 
     def handle_visible_player(self):
         player_x, player_y = self.player.rect.center
@@ -361,7 +373,7 @@ class Enemy(pygame.sprite.Sprite):
             self.rect.y += dy * self.speed
 
         if distance <= 50 and not self.attacking:
-            current_time = time.time()
+            current_time = game_clock.time
             if current_time - self.last_attack_time >= 1:
                 self.start_attack()
 
@@ -387,7 +399,7 @@ class Enemy(pygame.sprite.Sprite):
         self.current_frame = 0
         self.frame_timer = 0
         self.attack()
-        self.last_attack_time = time.time()
+        self.last_attack_time = game_clock.time
 
     def check_distance_and_move(self):
         player_x, player_y = self.player.rect.center
@@ -408,7 +420,7 @@ class Enemy(pygame.sprite.Sprite):
             self.state = "staggered"
             self.speed = 0
             self.animation_speed = 0
-            self.stagger_start_time = time.time()
+            self.stagger_start_time = game_clock.time
             player_x, player_y = self.player.rect.center
             enemy_x, enemy_y = self.rect.center
             dx, dy = enemy_x - player_x, enemy_y - player_y
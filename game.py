@@ -1,15 +1,21 @@
 # game.py
 import pygame
-import random
-import time
-from settings import WIDTH, HEIGHT, ATH_HEIGHT, FPS, WHITE
+from settings import WIDTH, HEIGHT, ATH_HEIGHT, RENDER_FPS, DIRTY_RENDERING
 from player import Player
-from enemy import Enemy
+from enemy import Enemy, warm_enemy_sprites
 from ath import Ath
 from end import End
 from shadow import Shadow
 from powerup import PowerUp
-from utilitaire import SoundEffects, chemin_relatif, render_multiline, read_score
+from streaming import AssetService
+from renderer import DirtyRenderer, Drawable
+from cutscene import DialogueOverlay
+from timing import frame_scheduler, game_clock, FixedTimestep
+from replay import CONFIRM
+from rng import random_streams
+from overlay import perf_overlay
+from profiling import timed, scope, count
+from utilitaire import SoundEffects, chemin_relatif, read_score, sprite_cache
 
 
 class Game:
@@ -29,7 +35,13 @@ class Game:
 
     Attributs principaux:
         screen (pygame.Surface): Surface d'affichage principale.
-        clock (pygame.time.Clock): Gestion du temps et des FPS.
+        scheduler (FrameScheduler): Cadenceur partagé (FPS et statistiques des frames).
+        timestep (FixedTimestep): Accumulateur de la simulation à pas fixe.
+        clock (GameClock): Horloge de jeu (figée pendant les dialogues).
+        tick (int): Nombre de pas simulés depuis le début de la partie.
+        recorder (ReplayRecorder | None): Enregistrement de la partie en cours.
+        overlay (PerfOverlay): Overlay de performances (F3).
+        previous_rects (dict): Position des sprites avant le dernier pas (interpolation).
         running (bool): Indique si le jeu est en cours d'exécution.
         isDungeon (bool): Indique si le jeu est en mode donjon.
         all_sprites (pygame.sprite.LayeredUpdates): Tous les sprites du jeu.
@@ -39,12 +51,14 @@ class Game:
         ath (Ath): Interface de l'ATH (affichage de la vie, score, mana…).
         end_screen (End | None): Écran de fin affiché si le joueur meurt.
         stage (int): Numéro du stage actuel.
-        stage_backgrounds (dict[int, pygame.Surface]): Fonds d'écran par stage.
+        stage_backgrounds (dict[int, AssetHandle]): Fonds d'écran chargés (stage courant et suivant).
+        assets (AssetService): Chargement en arrière-plan des fonds et musiques.
         stage_thresholds (dict[int, int]): Score requis pour atteindre chaque stage.
         stage_spawns (dict[int, tuple[int, int]]): Positions de spawn du joueur par stage.
         boss (Enemy | None): Référence au boss si présent.
         dialogue_lines (list[str]): Répliques de dialogue en cours.
         dialogue_active (bool): True si un dialogue est en cours.
+        dialogue (DialogueOverlay): Boîte de dialogue pré-rendue des cinématiques.
         in_cutscene (bool): True si une cinématique est en cours.
         door (bool): Indique si la porte du stage est ouverte.
         score (int): Score du joueur.
@@ -52,14 +66,47 @@ class Game:
         spawnable (bool): Indique si les ennemis peuvent apparaître.
         shadow_sprite (Shadow): Sprite représentant l'ombre du joueur selon ses HP.
         sound (SoundEffects): Gestionnaire des effets sonores.
+        renderer (DirtyRenderer | None): Rendu par rectangles sales (si `DIRTY_RENDERING`).
     """
+    # Images chargées par la partie (utilisées aussi par le préchargement)
+    SHADOW_IMAGES = (
+        chemin_relatif("assets/images/shadow/Shadow1.png"),
+        chemin_relatif("assets/images/shadow/Shadow2.png"),
+        chemin_relatif("assets/images/shadow/Shadow3.png"),
+    )
+    STAGE_BACKGROUNDS = (
+        chemin_relatif("assets/images/background/Base_Stage.png"),
+        chemin_relatif("assets/images/background/Second_Stage.png"),
+        chemin_relatif("assets/images/background/Third_Stage.png"),
+        chemin_relatif("assets/images/background/Fourth_Stage.png"),
+        chemin_relatif("assets/images/background/Fifth_Stage.png"),
+    )
+    DOOR_IMAGES = (
+        chemin_relatif("assets/images/ressources/Door.png"),
+        chemin_relatif("assets/images/ressources/Door2.png"),
+        chemin_relatif("assets/images/ressources/Door3.png"),
+        chemin_relatif("assets/images/Pharah.png"),
+    )
+    PLAYER_STATIC_IMAGE = chemin_relatif("assets/images/player/IdleR.png")
+    DIALOGUE_SOUND = chemin_relatif("assets/sounds/sound_effects/dialogue_box.ogg")
+    BOSS_TALK_SOUND = chemin_relatif("assets/sounds/sound_effects/boss_talk.ogg")
+    SNAP_DISTANCE = 150  # déplacement en un pas au-delà duquel un sprite n'est pas interpolé
+
     def __init__(self, screen, fullscreen, isDungeon=False):
         self.screen = screen
         self.fullscreen = fullscreen
         self.isDungeon = isDungeon
         self.running = True
 
-        self.clock = pygame.time.Clock()
+        self.scheduler = frame_scheduler
+        self.timestep = FixedTimestep()
+        self.clock = game_clock
+        self.clock.reset()
+        self.tick = 0
+        self.recorder = None
+        self.overlay = perf_overlay
+        self.previous_rects = {}
+        self.renderer = DirtyRenderer(self.screen) if DIRTY_RENDERING else None
 
         # Game Over
         self.end_screen = None
@@ -80,16 +127,18 @@ class Game:
         # Ath
         self.ath = Ath(self.player)
 
+        # Sprites des ennemis chargés une fois pour toute la partie (cache partagé)
+        warm_enemy_sprites()
+
         self.stage_cleared = False
 
-        # Timer de spawn
-        self.start_time = time.time()
+        # Timer de spawn (temps de jeu)
         self.last_spawn = 0
         self.spawn_delay = 3  # premier ennemi toutes les 3 sec
         self.spawnable = True
         # Score
 
-        self.lastPowerUp = 0
+        self.lastPowerUp = float("-inf")
 
         #Cutscene
         self.in_cutscene = False
@@ -100,31 +149,30 @@ class Game:
 
         # Ressources à charger à l'initialisation
         self.font_title = pygame.font.Font(chemin_relatif("assets/fonts/Chomsky.otf"), 64)
-        self.shadow1 = pygame.image.load(chemin_relatif("assets/images/shadow/Shadow1.png")).convert_alpha()
-        self.shadow2 = pygame.image.load(chemin_relatif("assets/images/shadow/Shadow2.png")).convert_alpha()
-        self.shadow3 = pygame.image.load(chemin_relatif("assets/images/shadow/Shadow3.png")).convert_alpha()
+        self.shadow1 = sprite_cache.get_image(self.SHADOW_IMAGES[0])
+        self.shadow2 = sprite_cache.get_image(self.SHADOW_IMAGES[1])
+        self.shadow3 = sprite_cache.get_image(self.SHADOW_IMAGES[2])
+        self.shadow_none = pygame.Surface(self.shadow1.get_size(), pygame.SRCALPHA)  # pleine vie : pas d'ombre
 
         # On garde un seul sprite shadow et on change son image selon le HP
         self.shadow_sprite = Shadow(self.shadow1, (0, 80))
         self.shadow_sprites = pygame.sprite.LayeredUpdates()
         self.shadow_sprites.add(self.shadow_sprite, layer=4)
 
-        self.firstStage = pygame.image.load(chemin_relatif("assets/images/background/Base_Stage.png")).convert()
-        self.secondStage = pygame.image.load(chemin_relatif("assets/images/background/Second_Stage.png")).convert()
-        self.thirdStage = pygame.image.load(chemin_relatif("assets/images/background/Third_Stage.png")).convert()
-        self.fourthStage = pygame.image.load(chemin_relatif("assets/images/background/Fourth_Stage.png")).convert()
-        self.fifthStage = pygame.image.load(chemin_relatif("assets/images/background/Fifth_Stage.png")).convert()
-
         # Gestion des stages
+        # Seuls les fonds du stage courant et du suivant sont gardés en mémoire :
+        # le suivant est chargé en arrière-plan pendant que le courant est joué.
+        self.assets = AssetService()
         self.stage = 1
-        self.stage_backgrounds = {
-            1: self.firstStage,
-            2: self.secondStage,
-            3: self.thirdStage,
-            4: self.fourthStage,
-            5: self.fifthStage,
-            6: self.fifthStage
+        self.stage_background_paths = {
+            1: self.STAGE_BACKGROUNDS[0],
+            2: self.STAGE_BACKGROUNDS[1],
+            3: self.STAGE_BACKGROUNDS[2],
+            4: self.STAGE_BACKGROUNDS[3],
+            5: self.STAGE_BACKGROUNDS[4],
+            6: self.STAGE_BACKGROUNDS[4]
         }
+        self.stage_backgrounds = {}
         self.stage_thresholds = {
             2: 1000,   # score requis pour passer au stage 2
             3: 2000,   # score requis pour passer au stage 3
@@ -146,17 +194,18 @@ class Game:
 
         #door
         self.door_rect = pygame.Rect(WIDTH // 2 - 30, (HEIGHT - 650), 60, 15)
-        self.door_image1 = pygame.image.load(chemin_relatif("assets/images/ressources/Door.png")).convert_alpha()
-        self.door_image2 = pygame.image.load(chemin_relatif("assets/images/ressources/Door2.png")).convert_alpha()
-        self.door_image3 = pygame.image.load(chemin_relatif("assets/images/ressources/Door3.png")).convert_alpha()
-        self.door_image4 = pygame.image.load(chemin_relatif("assets/images/Pharah.png")).convert_alpha()
+        self.door_image1 = sprite_cache.get_image(self.DOOR_IMAGES[0])
+        self.door_image2 = sprite_cache.get_image(self.DOOR_IMAGES[1])
+        self.door_image3 = sprite_cache.get_image(self.DOOR_IMAGES[2])
+        self.door_image4 = sprite_cache.get_image(self.DOOR_IMAGES[3])
         self.door=False
 
         #player static
-        self.idleRSprites = pygame.image.load("assets/images/player/IdleR.png").convert_alpha()
+        self.idleRSprites = sprite_cache.get_image(self.PLAYER_STATIC_IMAGE)
 
 
         self.font_text = pygame.font.Font(chemin_relatif("assets/fonts/Chomsky.otf"), 32)
+        self.dialogue = DialogueOverlay(self.font_text)
 
         # Initialisation du son
         self.sound = SoundEffects()
@@ -174,18 +223,81 @@ class Game:
             3: chemin_relatif("assets/sounds/music/lvl_3_bridge.ogg")
         }
 
+        # Ressources du premier stage et préchargement du suivant
+        self.prefetch_stage(self.stage)
+        self.prefetch_stage(self.stage + 1)
+        self.streamed_stage = self.stage
+
     def new(self):
         """Nouvelle partie"""
         self.run()
+        self.assets.shutdown()
 
     def run(self):
-        """Boucle principale"""
+        """
+        Boucle principale.
+
+        La simulation avance par pas fixes (`update`, TICK_RATE fois par seconde
+        quelle que soit la fréquence d'affichage) ; l'affichage tourne à RENDER_FPS
+        et interpole les positions entre les deux derniers pas.
+        """
+        self.scheduler.reset()
+        self.timestep.reset()
         while self.running:
-            self.clock.tick(FPS)
-            self.events()
-            self.update()
-            self.draw()
-
+            # Le facteur de vitesse de l'horloge ralentit ou accélère toute la simulation
+            steps = self.timestep.advance(self.scheduler.tick(RENDER_FPS) * self.clock.scale)
+            with scope("Game.frame"):
+                self.overlay.begin_frame()
+                self.events()
+                self.overlay.mark("events")
+                for _ in range(steps):
+                    if not self.running:
+                        break
+                    self.step()
+                self.overlay.mark("update")
+                self.draw()
+
+    def step(self):
+        """
+        Simule exactement un pas : avance l'horloge de jeu puis met à jour la partie.
+        Le résultat ne dépend que des entrées, pas de l'heure système.
+        """
+        self.previous_rects = {sprite: sprite.rect.copy() for sprite in self.all_sprites}
+        self.tick += 1
+        self.clock.advance()
+        self.update()
+
+    def record_action(self, kind):
+        """
+        Enregistre une action prise entre deux pas (si la partie est enregistrée).
+
+        Args:
+            kind (int): Type d'action (voir replay.py).
+        """
+        if self.recorder is not None:
+            self.recorder.write(kind, self.tick)
+
+    def render_pos(self, sprite):
+        """
+        Position d'affichage d'un sprite, interpolée entre le pas précédent et le pas courant.
+
+        Args:
+            sprite (pygame.sprite.Sprite): Sprite à afficher.
+
+        Returns:
+            tuple[int, int]: Coin supérieur gauche à l'écran.
+        """
+        rect = sprite.rect
+        previous = self.previous_rects.get(sprite)
+        # Pas d'interpolation pour un sprite apparu, redimensionné ou téléporté
+        if previous is None or previous.size != rect.size \
+                or abs(rect.x - previous.x) > self.SNAP_DISTANCE or abs(rect.y - previous.y) > self.SNAP_DISTANCE:
+            return rect.topleft
+        alpha = self.timestep.alpha
+        return (round(previous.x + (rect.x - previous.x) * alpha),
+                round(previous.y + (rect.y - previous.y) * alpha))
+
+    @timed
     def events(self):
         """Gestion des événements"""
         for event in pygame.event.get():
@@ -200,51 +312,63 @@ class Game:
                 if self.player.hp <= 0:
                     self.end_screen.handle_event(event)
             elif event.type == pygame.KEYDOWN:
+                # Si le texte est encore en train d'apparaître, la touche l'affiche en entier
                 if self.dialogue_active and (event.key == pygame.K_SPACE or event.key == pygame.K_RETURN):
-                    self.current_line += 1
-                    self.sound.play_sound_one(chemin_relatif("assets/sounds/sound_effects/dialogue_box.ogg"), 0.4)
-                    if self.current_line >= len(self.dialogue_lines):
-                        self.dialogue_active = False
-                        self.in_cutscene = False
-                        self.sound.stop_music()
-                        self.sound.play_music(self.ambient_music[self.stage], 0.2)
-
-                        # Si c’est la cutscene finale avec la princesse → retour menu
-                        if self.stage == 8:
-                            self.sound.stop_music()
-                            self.running = False
-                            self.game_over = True
-
-                        elif self.boss and self.boss.is_dead:
-                            self.stage = 6
-                            self.boss.kill()
-                            self.boss = None
-                            self.spawnable = False
-                            self.player.mana = 40000
+                    self.confirm_dialogue()
+                if event.key == pygame.K_F3:
+                    self.overlay.toggle()
                 if event.key == pygame.K_F11:
                     pygame.display.toggle_fullscreen()
+                    if self.renderer is not None:
+                        self.renderer.invalidate()
             elif self.player.joystick:
                 if event.type == pygame.JOYBUTTONDOWN:
                     if self.player.hp <= 0:
                         self.end_screen.handle_event(event)
                     if self.dialogue_active and event.button == 0:  # Bouton A
-                        self.current_line += 1
-                        self.sound.play_sound_one(chemin_relatif("assets/sounds/sound_effects/dialogue_box.ogg"), 0.4)
-                        if self.current_line >= len(self.dialogue_lines):
-                            self.dialogue_active = False
-                            self.in_cutscene = False
-                            self.sound.stop_music()
-                            self.sound.play_music(self.ambient_music[self.stage], 0.2)
-                            if self.boss and self.boss.is_dead:
-                                self.stage = 6
-                                self.boss.kill()
-                                self.boss = None
-                                self.spawnable = False
-                                self.player.mana = 40000
+                        self.confirm_dialogue()
+
+    def confirm_dialogue(self):
+        """
+        Touche de dialogue : affiche toute la réplique si elle apparaît encore,
+        sinon passe à la suivante.
+        """
+        if not self.dialogue_active:
+            return
+        self.record_action(CONFIRM)
+        if not self.dialogue.reveal_all():
+            self.next_dialogue_line()
+
+    def next_dialogue_line(self):
+        """Passe à la réplique suivante ; termine la cinématique après la dernière."""
+        self.current_line += 1
+        self.sound.play_sound_one(self.DIALOGUE_SOUND, 0.4, category="ui")
+        if self.current_line < len(self.dialogue_lines):
+            self.dialogue.show(self.current_line)
+        else:
+            self.dialogue_active = False
+            self.clock.resume()
+            self.in_cutscene = False
+            self.sound.stop_music()
+            self.play_music(self.ambient_music[self.stage], 0.2)
+
+            # Si c’est la cutscene finale avec la princesse → retour menu
+            if self.stage == 8:
+                self.sound.stop_music()
+                self.running = False
+                self.game_over = True
 
+            elif self.boss and self.boss.is_dead:
+                self.stage = 6
+                self.boss.kill()
+                self.boss = None
+                self.spawnable = False
+                self.player.mana = 40000
+
+    @timed
     def update(self):
         """Mise à jour des objets"""
-        current_time = time.time() - self.start_time
+        current_time = self.clock.time
         # Spawner des ennemis au fil du temps
         if current_time - self.last_spawn >= self.spawn_delay and self.spawnable:
             self.spawn_enemy()
@@ -255,15 +379,22 @@ class Game:
 
         self.all_sprites.update()
 
-        if self.player.invisible and len(self.power_ups) == 0 and (time.time() - self.lastPowerUp >= 2) :
-            self.lastPowerUp = time.time()
+        # Streaming du stage suivant pendant que le stage courant est joué
+        if self.streamed_stage != self.stage:
+            self.prefetch_stage(self.stage + 1)
+            self.release_finished_stages()
+            self.streamed_stage = self.stage
+
+        if self.player.invisible and len(self.power_ups) == 0 and (self.clock.time - self.lastPowerUp >= 2) :
+            self.lastPowerUp = self.clock.time
+            loot = random_streams.loot
             # Génère une position aléatoire dans la zone de jeu
-            x = random.randint(50, WIDTH - 50)
-            y = random.randint(50, HEIGHT - 50)
+            x = loot.randint(50, WIDTH - 50)
+            y = loot.randint(50, HEIGHT - 50)
             if self.player.hp < 4 : # Le joueur ne peut pas avoir plus de 4 coeurs
-                bonus_type = random.choice(["damageAmp", "invulnerability", "heart"])  # Type de bonus aléatoire
+                bonus_type = loot.choice(["damageAmp", "invulnerability", "heart"])  # Type de bonus aléatoire
             else :
-                bonus_type = random.choice(["damageAmp", "invulnerability"])
+                bonus_type = loot.choice(["damageAmp", "invulnerability"])
             power_up = PowerUp((x, y), bonus_type, self.player)
             self.power_ups.add(power_up)
             self.all_sprites.add(power_up, layer=3)
@@ -306,7 +437,7 @@ class Game:
                     self.stage = next_stage
                     if self.stage < 4:
                         self.sound.stop_music()
-                        self.sound.play_music(self.ambient_music_bridge[self.stage], 0.2)
+                        self.play_music(self.ambient_music_bridge[self.stage], 0.2)
                     self.door = False
                     if not self.stage > 4:
                         self.spawnable = True
@@ -329,22 +460,77 @@ class Game:
 
         # Mise à jour explicite de l'ATH
         self.ath.update()
+        if self.dialogue_active:
+            self.dialogue.update()
 
         if self.player.hp <= 0:
             if not self.end_screen:
                 self.end_screen = End(self.screen, self.player, self)
+            for enemy in self.enemies:
+                enemy.kill()
             self.end_screen.update()
             return
         if self.isDungeon and not self.sound.is_playing():
-            self.sound.play_music(chemin_relatif("assets/sounds/music/lvl_dungeon.ogg"), 0.2)
+            self.play_music(chemin_relatif("assets/sounds/music/lvl_dungeon.ogg"), 0.2)
         elif not self.sound.is_playing() and not self.in_cutscene:
-            self.sound.play_music(self.ambient_music[self.stage], 0.2)
+            self.play_music(self.ambient_music[self.stage], 0.2)
+
+    def prefetch_stage(self, stage):
+        """
+        Lance le chargement en arrière-plan du fond et des musiques d'un stage.
+
+        Args:
+            stage (int): Numéro du stage à précharger.
+        """
+        path = self.stage_background_paths.get(stage)
+        if path and stage not in self.stage_backgrounds:
+            self.stage_backgrounds[stage] = self.assets.load_image(path, alpha=False)
+        for music in (self.ambient_music.get(stage), self.ambient_music_bridge.get(stage)):
+            if music:
+                self.assets.load_music(music)
+
+    def release_finished_stages(self):
+        """Libère les fonds et musiques des stages terminés."""
+        in_use = {handle.path for stage, handle in self.stage_backgrounds.items() if stage >= self.stage}
+        in_use.update(self.ambient_music.get(stage) for stage in (self.stage, self.stage + 1))
+        in_use.update(self.ambient_music_bridge.get(stage) for stage in (self.stage, self.stage + 1))
+        for stage in [stage for stage in self.stage_backgrounds if stage < self.stage]:
+            handle = self.stage_backgrounds.pop(stage)
+            if handle.path not in in_use:
+                self.assets.release(handle.path)
+            for music in (self.ambient_music.get(stage), self.ambient_music_bridge.get(stage)):
+                if music and music not in in_use:
+                    self.assets.release(music)
+
+    def stage_background(self):
+        """
+        Retourne le fond du stage courant (None si le stage n'en a pas).
+        Attend la fin du chargement si le fond n'est pas encore prêt.
+        """
+        if self.stage not in self.stage_background_paths:
+            return None
+        if self.stage not in self.stage_backgrounds:
+            self.prefetch_stage(self.stage)
+        return self.stage_backgrounds[self.stage].result()
+
+    def play_music(self, music_file, volume=0.2):
+        """
+        Joue une musique, depuis la mémoire si elle a déjà été chargée en arrière-plan.
+
+        Args:
+            music_file (str): Chemin de la musique.
+            volume (float): Volume relatif au volume global.
+        """
+        handle = self.assets.get("music", music_file)
+        data = handle.result() if handle is not None and handle.done() else None
+        self.sound.play_music(music_file, volume, data=data)
 
     def start_boss_cutscene(self):
         self.sound.stop_music()
-        self.sound.play_sound_one(chemin_relatif("assets/sounds/sound_effects/boss_talk.ogg"), 0.1)
+        self.sound.play_sound_one(self.BOSS_TALK_SOUND, 0.1, category="voice")
         self.in_cutscene = True
         self.dialogue_active = True
+        self.clock.pause()  # les minuteries du jeu ne s'écoulent pas pendant le dialogue
         self.spawnable = False
         self.enemies.empty()
         for ennemies in self.enemies:
@@ -364,8 +550,11 @@ class Game:
             "Alain: Feur",
         ]
         self.current_line = 0
+        self.dialogue.load(self.dialogue_lines)
+        self.dialogue.show(0)
     def start_boss_death_cutscene(self):
         self.dialogue_active = True
+        self.clock.pause()
         self.spawnable = False
 
         # Supprime tous les ennemis normaux
@@ -377,11 +566,14 @@ class Game:
             "Gaêtan jible (mort): Hahaha... je meurs mais ta princesse restera invisible...",
         ]
         self.current_line = 0
+        self.dialogue.load(self.dialogue_lines)
+        self.dialogue.show(0)
     def start_princess_rescue_cutscene(self):
         """Dernière cutscene avec la princesse après avoir sauvé le royaume"""
         self.spawnable = False
         self.in_cutscene = True
         self.dialogue_active = True
+        self.clock.pause()
 
         for enemy in list(self.enemies):
             enemy.kill()
@@ -400,38 +592,42 @@ class Game:
             "Pharah : mmmmmh, la délicieuse soupe !"
         ]
         self.current_line = 0
+        self.dialogue.load(self.dialogue_lines)
+        self.dialogue.show(0)
     def spawn_enemy(self):
         """Crée un ennemi aléatoire et l'ajoute au jeu"""
+        spawn = random_streams.spawn  # tirages préparés par paquets
         if(self.stage == 1):
             if self.isDungeon :
-                enemy_type = random.choice(["pawn", "goblin", "lancier", "scout", "archer", "tnt"])
+                enemy_type = spawn.choice(["pawn", "goblin", "lancier", "scout", "archer", "tnt"])
             else :
-                enemy_type = random.choice(["pawn", "lancier", "archer"])
+                enemy_type = spawn.choice(["pawn", "lancier", "archer"])
         if(self.stage == 2):
-            enemy_type = random.choice(["pawn", "lancier", "archer"])
+            enemy_type = spawn.choice(["pawn", "lancier", "archer"])
         if(self.stage == 3):
-            enemy_type = random.choice(["goblin", "scout", "tnt"])
+            enemy_type = spawn.choice(["goblin", "scout", "tnt"])
         if(self.stage == 4):
-            enemy_type = random.choice(["goblin", "scout", "tnt"])
+            enemy_type = spawn.choice(["goblin", "scout", "tnt"])
         if(self.stage == 5):
-            enemy_type = random.choice(["goblin", "scout", "tnt"])
+            enemy_type = spawn.choice(["goblin", "scout", "tnt"])
         if(self.stage == 6):
-            enemy_type = random.choice(["pawn", "goblin", "lancier", "scout", "archer", "tnt"])
+            enemy_type = spawn.choice(["pawn", "goblin", "lancier", "scout", "archer", "tnt"])
 
         # Spawn autour de la zone de jeu (hors écran)
-        side = random.choice(["top", "bottom", "left", "right"])
+        side = spawn.choice(["top", "bottom", "left", "right"])
         if side == "top":
-            pos = (random.randint(0, WIDTH), ATH_HEIGHT)
+            pos = (spawn.randint(0, WIDTH), ATH_HEIGHT)
         elif side == "bottom":
-            pos = (random.randint(0, WIDTH), HEIGHT + 20)
+            pos = (spawn.randint(0, WIDTH), HEIGHT + 20)
         elif side == "left":
-            pos = (-20, random.randint(ATH_HEIGHT, HEIGHT))
+            pos = (-20, spawn.randint(ATH_HEIGHT, HEIGHT))
         else:  # right
-            pos = (WIDTH + 20, random.randint(ATH_HEIGHT, HEIGHT))
+            pos = (WIDTH + 20, spawn.randint(ATH_HEIGHT, HEIGHT))
 
         enemy = Enemy(enemy_type, self.player, self.screen, pos)
         self.all_sprites.add(enemy, layer=1)
         self.enemies.add(enemy)
+        count("enemies.spawned")
     def clear_stage(self):
         self.spawnable = False
         self.spawn_delay = 2
@@ -439,18 +635,24 @@ class Game:
         self.door=True
         if self.player.hp <4:
             self.player.hp+=2
+    @timed
     def draw(self):
         """Affichage"""
         # Fond du stage courant
-        if self.stage in self.stage_backgrounds:
-            self.screen.blit(self.stage_backgrounds[self.stage], (0, 0))
-        # Sprites
+        background = self.stage_background()
+        # Rendu partiel si activé, sauf pendant les dialogues, l'écran de fin et les stages sans fond
+        if self.renderer is not None and background is not None and not self.dialogue_active and self.player.hp > 0:
+            self.draw_dirty(background)
+            return
+        if background is not None:
+            self.screen.blit(background, (0, 0))
+        # Sprites (positions interpolées entre les deux derniers pas de simulation)
         if self.player.invisible :
             for enemy in self.enemies:
-                self.screen.blit(enemy.question_mark, enemy.question_mark_rect)
-                enemy.update()
+                self.screen.blit(enemy.question_mark, self.question_mark_pos(enemy))
 
-        self.all_sprites.draw(self.screen)
+        for sprite in self.all_sprites.sprites():
+            self.screen.blit(sprite.image, self.render_pos(sprite))
 
         if self.door:
             self.screen.blit(self.door_image, self.door_rect)
@@ -463,13 +665,11 @@ class Game:
         elif self.player.hp == 1:
             self.shadow_sprite.image = self.shadow3
         elif self.player.hp <= 0 and self.end_screen:
-            for enemy in self.enemies:
-                enemy.kill()
-            self.player.image.set_alpha(0)
+            self.player.apply_opacity(0)
             self.shadow_sprites.draw(self.screen)
             self.end_screen.draw()
         else:
-            self.shadow_sprite.image = pygame.Surface(self.shadow1.get_size(), pygame.SRCALPHA)
+            self.shadow_sprite.image = self.shadow_none
 
         # Dessiner le sprite shadow
         if self.player.hp > 0:
@@ -477,28 +677,62 @@ class Game:
             self.ath.draw(self.screen)
 
         if self.dialogue_active:
-            box = pygame.Surface((WIDTH - 100, 150))
-            box.fill((0, 0, 0))
-            pygame.draw.rect(box, (255, 255, 255), box.get_rect(), 3)
-            self.screen.blit(box, (50, HEIGHT - 200))
-
-            # Découper et rendre le texte avec retour à la ligne
-            rendered_lines = render_multiline(
-                self.dialogue_lines[self.current_line],
-                self.font_text,
-                WHITE,
-                WIDTH - 140  # largeur disponible dans la boîte
-            )
-
-            # Blit ligne par ligne avec espacement vertical
-            y_offset = HEIGHT - 180
-            for line_surface in rendered_lines:
-                self.screen.blit(line_surface, (70, y_offset))
-                y_offset += self.font_text.get_height() + 5  # 5px d'espacement
-
-
+            # Boîte et texte pré-rendus au lancement de la cinématique
+            self.dialogue.draw(self.screen)
+
+        self.overlay.draw(self.screen, self)
+        self.present()
+        if self.renderer is not None:
+            self.renderer.invalidate()
+
+    def present(self, rects=None):
+        """
+        Affiche la frame composée.
+
+        Args:
+            rects (list[pygame.Rect] | None): Zones à mettre à jour (None : tout l'écran).
+        """
+        self.overlay.mark("draw")
+        if rects is None:
+            pygame.display.flip()
+        else:
+            pygame.display.update(rects)
+        self.overlay.mark("flip")
+
+    def question_mark_pos(self, enemy):
+        """Position du point d'interrogation d'un ennemi, décalée comme l'ennemi interpolé."""
+        x, y = self.render_pos(enemy)
+        return (enemy.question_mark_rect.x + x - enemy.rect.x, enemy.question_mark_rect.y + y - enemy.rect.y)
+
+    def draw_dirty(self, background):
+        """
+        Affichage par rectangles sales : mêmes éléments que `draw`, dans le même ordre,
+        mais seules les zones modifiées depuis la frame précédente sont redessinées.
+
+        Args:
+            background (pygame.Surface): Fond du stage courant.
+        """
+        drawables = []
+        if self.player.invisible:
+            for enemy in self.enemies:
+                drawables.append(Drawable(("question_mark", enemy), enemy.question_mark, self.question_mark_pos(enemy)))
 
+        for sprite in self.all_sprites.sprites():  # ordre des calques
+            drawables.append(Drawable(sprite, sprite.image, self.render_pos(sprite)))
 
-        pygame.display.flip()
+        if self.door:
+            drawables.append(Drawable("door", self.door_image, self.door_rect.topleft))
+
+        # Ombres selon HP (pleine vie : rien à dessiner)
+        shadows = {3: self.shadow1, 2: self.shadow2, 1: self.shadow3}
+        self.shadow_sprite.image = shadows.get(self.player.hp, self.shadow_none)
+        if self.shadow_sprite.image is not self.shadow_none:
+            drawables.append(Drawable(self.shadow_sprite, self.shadow_sprite.image, self.shadow_sprite.rect.topleft))
+
+        drawables.append(Drawable(self.ath, self.ath.image, self.ath.rect.topleft, changed=self.ath.dirty))
+        self.ath.dirty = False
+        if self.overlay.visible:
+            drawables.append(Drawable(self.overlay, self.overlay.update(self), self.overlay.rect.topleft, changed=True))
+        self.present(self.renderer.draw(background, drawables))
 
 
@@ -0,0 +1,170 @@
+"""
+headless.py
+
+Simulation d'une partie sans fenêtre.
+
+Les pilotes SDL factices remplacent l'écran et la carte son : la partie est
+simulée pas à pas aussi vite que possible (`Game.step`), sans attendre
+l'horloge, avec un bot ou un script à la place du joueur. L'affichage est
+désactivé, ou fait de temps en temps sur la surface hors écran du pilote
+factice. Utile pour l'équilibrage et les mesures de performance, y compris
+sur une machine sans écran :
+
+    python main.py --headless --dungeon --steps 20000 --respawns 100
+"""
+import os
+import time
+import pygame
+from settings import WIDTH, HEIGHT, TICK_RATE
+from game import Game
+from inputs import BotInput, ScriptedInput
+from replay import Replay, record_game
+from rng import random_streams
+from atlas import SpriteAtlas, pack_sprite_cache
+from preload import build_manifest, load_entry
+from utilitaire import sprite_cache
+
+
+def init_headless():
+    """
+    Initialise pygame avec les pilotes vidéo et audio factices, puis précharge
+    et regroupe les sprites comme au lancement du jeu (même disposition en mémoire).
+
+    Returns:
+        pygame.Surface: Surface d'affichage hors écran.
+    """
+    os.environ["SDL_VIDEODRIVER"] = "dummy"
+    os.environ["SDL_AUDIODRIVER"] = "dummy"
+    pygame.init()
+    screen = pygame.display.set_mode((WIDTH, HEIGHT))
+    sprite_cache.attach_atlas(SpriteAtlas.open())
+    for kind, args in build_manifest():
+        load_entry(kind, args)
+    pack_sprite_cache(sprite_cache)
+    return screen
+
+
+class HeadlessReport:
+    """
+    Résultat d'une simulation sans affichage.
+
+    Attributs :
+        steps (int): Pas simulés.
+        elapsed (float): Durée réelle de la simulation (s).
+        score (int): Score du joueur à la fin.
+        hp (int): Points de vie restants.
+        stage (int): Stage atteint.
+        enemies (int): Ennemis en vie à la fin.
+    """
+
+    def __init__(self, steps, elapsed, score, hp, stage, enemies):
+        self.steps = steps
+        self.elapsed = elapsed
+        self.score = score
+        self.hp = hp
+        self.stage = stage
+        self.enemies = enemies
+
+    @property
+    def steps_per_second(self):
+        return self.steps / self.elapsed if self.elapsed else 0.0
+
+    def __str__(self):
+        return (f"{self.steps} pas ({self.steps / TICK_RATE:.1f}s de jeu) en {self.elapsed:.2f}s "
+                f"-> {self.steps_per_second:.0f} pas/s | score {self.score}, vie {self.hp}, "
+                f"stage {self.stage}, {self.enemies} ennemis")
+
+
+def simulate(game, steps, render_every=0, respawns=0):
+    """
+    Simule une partie sans attendre l'horloge, jusqu'à `steps` pas,
+    la fin de la partie ou la mort du joueur. Les dialogues sont passés.
+
+    Args:
+        game (Game): Partie à simuler.
+        steps (int): Nombre maximal de pas.
+        render_every (int): Dessine une frame (hors écran) tous les N pas (0 = jamais).
+        respawns (int): Réapparitions autorisées à la mort du joueur (comme après un cri au micro).
+
+    Returns:
+        HeadlessReport: Résultat de la simulation.
+    """
+    start = time.perf_counter()
+    done = 0
+    while done < steps and game.running:
+        if game.player.hp <= 0:
+            if respawns <= 0 or game.end_screen is None:
+                break
+            game.end_screen.respawn_player()
+            respawns -= 1
+        if game.dialogue_active:
+            game.confirm_dialogue()
+        game.step()
+        done += 1
+        if render_every and done % render_every == 0:
+            game.draw()
+            pygame.event.pump()
+    elapsed = time.perf_counter() - start
+    return HeadlessReport(done, elapsed, game.player.score, game.player.hp, game.stage, len(game.enemies))
+
+
+def run_headless(steps, dungeon=False, render_every=0, controls="bot", respawns=0, record=None, seed=None):
+    """
+    Lance une partie sans fenêtre et affiche son résultat.
+
+    Args:
+        steps (int): Nombre maximal de pas simulés.
+        dungeon (bool): Mode donjon.
+        render_every (int): Dessine une frame hors écran tous les N pas (0 = jamais).
+        controls (str): "bot" (joueur automatique) ou "idle" (joueur immobile).
+        respawns (int): Réapparitions autorisées à la mort du joueur.
+        record (str | None): Fichier où enregistrer la partie simulée.
+        seed (int | None): Graine du hasard de la partie (tirée au hasard si None).
+
+    Returns:
+        HeadlessReport: Résultat de la simulation.
+    """
+    screen = init_headless()
+    seed = random_streams.reseed(seed)
+    game = Game(screen, False, isDungeon=dungeon)
+    game.player.controls = BotInput(game) if controls == "bot" else ScriptedInput([])
+    if record:
+        record_game(game, record, seed)
+    report = simulate(game, steps, render_every, respawns)
+    if record:
+        game.recorder.close(game.tick)
+    game.assets.shutdown()
+    print(f"[Headless] {report} (graine {seed})")
+    return report
+
+
+def run_replay(path, render_every=0):
+    """
+    Rejoue sans fenêtre une partie enregistrée, aussi vite que possible.
+
+    Args:
+        path (str): Fichier de relecture.
+        render_every (int): Dessine une frame hors écran tous les N pas (0 = jamais).
+
+    Returns:
+        HeadlessReport: Résultat de la partie rejouée.
+    """
+    replay = Replay.load(path)
+    screen = init_headless()
+    random_streams.reseed(replay.seed)
+    game = Game(screen, False, isDungeon=replay.dungeon)
+    player = replay.player(game)
+    game.player.controls = player
+
+    start = time.perf_counter()
+    while not player.finished and game.running:
+        player.apply_actions()
+        game.step()
+        if render_every and game.tick % render_every == 0:
+            game.draw()
+            pygame.event.pump()
+    elapsed = time.perf_counter() - start
+    report = HeadlessReport(game.tick, elapsed, game.player.score, game.player.hp, game.stage, len(game.enemies))
+    game.assets.shutdown()
+    print(f"[Replay] {report}")
+    return report
@@ -0,0 +1,166 @@
+"""
+inputs.py
+
+Entrées du joueur sous forme d'instantanés.
+
+Le joueur ne lit plus directement le clavier, la souris et la manette : à
+chaque pas de simulation, il demande un `InputSnapshot` à sa source d'entrées
+(`Player.controls`). La source par défaut lit les périphériques ; en mode sans
+affichage, un script ou un bot fournit les instantanés à la place, par le même
+chemin de code.
+"""
+import math
+import pygame
+
+
+class InputSnapshot:
+    """
+    État des commandes du joueur pour un pas de simulation.
+
+    Attributs :
+        left, right, up, down (bool): Déplacement clavier (flèches / ZQSD).
+        attack (bool): Attaque clavier ou souris (espace / clic gauche).
+        invisible (bool): Invisibilité clavier (Maj gauche).
+        joy_x, joy_y (float): Stick gauche de la manette (-1 à 1).
+        joy_trigger (float): Gâchette de la manette (-1 à 1).
+        joy_attack (bool): Bouton d'attaque de la manette (A).
+        joy_invisible (bool): Bouton d'invisibilité de la manette (X ou LB).
+    """
+    __slots__ = ("left", "right", "up", "down", "attack", "invisible",
+                 "joy_x", "joy_y", "joy_trigger", "joy_attack", "joy_invisible")
+
+    def __init__(self, left=False, right=False, up=False, down=False, attack=False, invisible=False,
+                 joy_x=0.0, joy_y=0.0, joy_trigger=0.0, joy_attack=False, joy_invisible=False):
+        self.left = left
+        self.right = right
+        self.up = up
+        self.down = down
+        self.attack = attack
+        self.invisible = invisible
+        self.joy_x = joy_x
+        self.joy_y = joy_y
+        self.joy_trigger = joy_trigger
+        self.joy_attack = joy_attack
+        self.joy_invisible = joy_invisible
+
+    def __eq__(self, other):
+        return isinstance(other, InputSnapshot) and all(
+            getattr(self, name) == getattr(other, name) for name in self.__slots__)
+
+    def __repr__(self):
+        pressed = [name for name in self.__slots__ if getattr(self, name)]
+        return f"InputSnapshot({', '.join(pressed)})"
+
+
+# Aucune commande (joueur immobile)
+IDLE = InputSnapshot()
+
+
+class DeviceInput:
+    """
+    Source d'entrées lisant le clavier, la souris et la manette.
+
+    Attributs :
+        joystick (pygame.joystick.Joystick | None): Manette détectée.
+    """
+
+    def __init__(self, joystick=None):
+        self.joystick = joystick
+
+    def read(self):
+        """
+        Returns:
+            InputSnapshot: État actuel des périphériques.
+        """
+        keys = pygame.key.get_pressed()
+        snapshot = InputSnapshot(
+            left=keys[pygame.K_LEFT] or keys[pygame.K_q],
+            right=keys[pygame.K_RIGHT] or keys[pygame.K_d],
+            up=keys[pygame.K_UP] or keys[pygame.K_z],
+            down=keys[pygame.K_DOWN] or keys[pygame.K_s],
+            attack=keys[pygame.K_SPACE] or pygame.mouse.get_pressed()[0],
+            invisible=keys[pygame.K_LSHIFT],
+        )
+        if self.joystick:
+            snapshot.joy_x = self.joystick.get_axis(0)  # -1 = gauche, +1 = droite
+            snapshot.joy_y = self.joystick.get_axis(1)  # -1 = haut,   +1 = bas
+            snapshot.joy_trigger = self.joystick.get_axis(5)  # gachette gauche
+            snapshot.joy_attack = bool(self.joystick.get_button(0))
+            snapshot.joy_invisible = bool(self.joystick.get_button(4) or self.joystick.get_button(2))
+        return snapshot
+
+
+class ScriptedInput:
+    """
+    Source d'entrées rejouant une suite d'instantanés, un par pas.
+    Une fois le script épuisé, le joueur reste immobile.
+
+    Attributs :
+        snapshots (list[InputSnapshot]): Instantanés à rejouer.
+        index (int): Prochain instantané.
+    """
+
+    def __init__(self, snapshots):
+        self.snapshots = list(snapshots)
+        self.index = 0
+
+    @property
+    def finished(self):
+        return self.index >= len(self.snapshots)
+
+    def read(self):
+        if self.finished:
+            return IDLE
+        snapshot = self.snapshots[self.index]
+        self.index += 1
+        return snapshot
+
+
+class BotInput:
+    """
+    Joueur automatique simple pour les simulations sans affichage.
+
+    Il va vers l'ennemi le plus proche et l'attaque, devient invisible quand il
+    est blessé et encerclé, et passe la porte du stage quand elle est ouverte.
+
+    Attributs :
+        game (Game): Partie contrôlée.
+    """
+    ATTACK_RANGE = 60  # distance à laquelle le bot frappe
+    DANGER_RANGE = 120  # distance d'un ennemi considérée comme menaçante
+    DEADZONE = 8  # écart (px) en dessous duquel le bot ne corrige plus sa position
+
+    def __init__(self, game):
+        self.game = game
+
+    def read(self):
+        game = self.game
+        player = game.player
+        px, py = player.rect.center
+
+        target = None
+        enemies = [enemy for enemy in game.enemies if not enemy.is_dead]
+        if enemies:
+            target = min(enemies, key=lambda enemy: math.hypot(enemy.rect.centerx - px, enemy.rect.centery - py))
+        if game.door and (target is None or game.stage_cleared):
+            target = game.door_rect
+        snapshot = InputSnapshot()
+        if target is None:
+            return snapshot
+
+        tx, ty = target.rect.center if hasattr(target, "rect") else target.center
+        dx, dy = tx - px, ty - py
+        snapshot.left = dx < -self.DEADZONE
+        snapshot.right = dx > self.DEADZONE
+        snapshot.up = dy < -self.DEADZONE
+        snapshot.down = dy > self.DEADZONE
+
+        if target is not game.door_rect:
+            if math.hypot(dx, dy) < self.ATTACK_RANGE:
+                # Se tourne vers la cible avant de frapper
+                snapshot.attack = True
+                snapshot.left, snapshot.right = dx < 0, dx >= 0
+            close = sum(1 for enemy in enemies
+                        if math.hypot(enemy.rect.centerx - px, enemy.rect.centery - py) < self.DANGER_RANGE)
+            snapshot.invisible = close >= 2 and (player.hp <= 2 or close >= 4)
+        return snapshot
@@ -3,33 +3,95 @@ main.py
 
 Point d'entrée du jeu.
 Gère la boucle principale entre le menu, les crédits et le lancement du jeu.
+
+Avec `--headless`, une partie est simulée sans fenêtre (voir headless.py).
 """
 
+import argparse
 import pygame
 from game import Game
 from menu import Menu
 from credits import Credits
 from lore import Lore
-from settings import WIDTH, HEIGHT, TITLE
-from utilitaire import chemin_relatif
+from preload import Preloader
+from atlas import SpriteAtlas, pack_sprite_cache
+from settings import WIDTH, HEIGHT, TITLE, TICK_RATE
+from utilitaire import audio_engine, chemin_relatif, sprite_cache
+from audio import meter_service
+from headless import run_headless, run_replay
+from replay import record_game
+from rng import random_streams
 
-def main():
+def parse_args(argv=None):
+    """
+    Lit les options de la ligne de commande.
+
+    Args:
+        argv (list[str] | None): Arguments (par défaut ceux du processus).
+
+    Returns:
+        argparse.Namespace: Options lues.
+    """
+    parser = argparse.ArgumentParser(description=TITLE)
+    parser.add_argument("--headless", action="store_true",
+                        help="simule une partie sans fenêtre aussi vite que possible, puis quitte")
+    parser.add_argument("--dungeon", action="store_true", help="mode donjon (avec --headless)")
+    parser.add_argument("--steps", type=int, default=60 * TICK_RATE,
+                        help="nombre maximal de pas simulés (avec --headless, défaut : 1 minute de jeu)")
+    parser.add_argument("--render-every", type=int, default=0, metavar="N",
+                        help="dessine une frame hors écran tous les N pas (avec --headless, 0 = jamais)")
+    parser.add_argument("--input", choices=("bot", "idle"), default="bot",
+                        help="commandes du joueur simulé (avec --headless)")
+    parser.add_argument("--respawns", type=int, default=0, metavar="N",
+                        help="réapparitions du joueur simulé à sa mort (avec --headless)")
+    parser.add_argument("--record", metavar="FICHIER",
+                        help="enregistre les commandes de la partie (la dernière jouée) pour la rejouer")
+    parser.add_argument("--seed", type=int,
+                        help="graine du hasard des parties (ennemis, bonus...), tirée au hasard par défaut")
+    parser.add_argument("--replay", metavar="FICHIER",
+                        help="rejoue sans fenêtre une partie enregistrée, puis quitte")
+    return parser.parse_args(argv)
+
+def main(argv=None):
     """
     Fonction principale du programme.
 
-    - Initialise Pygame et la fenêtre.
+    - Avec `--headless` : simule une partie sans fenêtre, affiche le résultat et quitte.
+    - Avec `--replay` : rejoue sans fenêtre une partie enregistrée avec `--record`.
+    - Initialise Pygame, le moteur audio partagé et la fenêtre.
+    - Précharge les ressources d'une partie (écran de chargement).
     - Affiche le menu principal.
     - Permet d'accéder aux crédits.
     - Lance une partie si le joueur choisit de jouer.
     - Termine l'application si le joueur quitte depuis le menu ou les crédits.
     """
+    args = parse_args(argv)
+    if args.headless or args.replay:
+        if args.replay:
+            run_replay(args.replay, args.render_every)
+        else:
+            run_headless(args.steps, args.dungeon, args.render_every, args.input, args.respawns, args.record,
+                         args.seed)
+        meter_service.close()
+        audio_engine.quit()
+        pygame.quit()
+        return
+
     pygame.init()
+    audio_engine.init()
 
     screen = pygame.display.set_mode((WIDTH, HEIGHT))
     pygame.display.set_caption(TITLE)
     icon = pygame.image.load(chemin_relatif("assets/images/icon.ico"))
     pygame.display.set_icon(icon)
 
+    # Préchargement de toutes les ressources d'une partie avant la première frame
+    # (depuis l'atlas précalculé s'il a été construit avec `python atlas.py`)
+    sprite_cache.attach_atlas(SpriteAtlas.open())
+    Preloader(screen).run()
+    # Regroupe toutes les frames d'animation dans quelques grandes pages
+    pack_sprite_cache(sprite_cache)
+
     fullscreen = False
     running = True
 
@@ -72,14 +134,21 @@ def main():
 
         # Lancer le jeu en mode approprié
         game_mode = menu.start_game_infinite
-        if not start_game(screen, fullscreen, game_mode):
+        if not start_game(screen, fullscreen, game_mode, args.record, args.seed):
             running = False
 
+    meter_service.close()
+    audio_engine.quit()
     pygame.quit()
 
-def start_game(screen, fullscreen, is_dungeon=False):
+def start_game(screen, fullscreen, is_dungeon=False, record=None, seed=None):
+    seed = random_streams.reseed(seed)
     g = Game(screen, fullscreen, isDungeon=is_dungeon)
+    if record:
+        record_game(g, record, seed)
     g.new()
+    if record:
+        g.recorder.close(g.tick)
     return True  # Retourne True pour continuer (game over), False pour quitter
 
 if __name__ == "__main__":
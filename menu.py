@@ -14,6 +14,7 @@ from settings import WIDTH, HEIGHT, TITLE, WHITE, SUBTITLE
 from utilitaire import load_sprites, pixelate, SoundEffects, chemin_relatif, read_score
 from components.button import Button
 from components.animatedElement import AnimatedElement
+from timing import frame_scheduler, game_clock
 
 class Menu:
     """
@@ -26,7 +27,11 @@ class Menu:
         start_game_infinite (bool): Indique si la partie doit démarrer en mode infini/donjon.
         show_credits (bool): Indique si les crédits doivent être affichés.
         running (bool): Boucle de contrôle du menu.
+        back_layer (pygame.Surface): Décor fixe pré-composé (fond, titre, score, boutons).
+        front_layer (pygame.Surface): Bannière et sous-titre pré-composés, dessinés par-dessus le joueur.
     """
+    BG_IMG = chemin_relatif("assets/images/background/bg_menu.png")
+
     def __init__(self, screen, fullscreen):
         self.screen = screen
         self.fullscreen = fullscreen
@@ -93,11 +98,20 @@ class Menu:
         # Lire le score
         self.score = read_score()
 
+        # Décor fixe composé une seule fois : chaque frame ne blitte que les calques
+        # et les éléments animés
+        self.back_layer = self._bake_back_layer()
+        self.front_layer, self.front_pos = self._bake_front_layer()
+
     def run(self):
         """Boucle du menu"""
+        frame_scheduler.reset()
+        game_clock.reset()
         while self.running:
+            game_clock.advance()  # une frame du menu = un pas (minuteries du joueur)
             self.handle_events()
             self.draw()
+            frame_scheduler.tick()
 
     def handle_events(self):
         for event in pygame.event.get():
@@ -143,10 +157,18 @@ class Menu:
         if not self.sound.is_playing():
             self.sound.play_music(chemin_relatif("assets/sounds/music/menu_music.ogg"), volume=0.2)
 
-    def draw(self):
+    def _bake_back_layer(self):
+        """
+        Compose le décor situé sous les éléments animés : fond, score, ruban, titre et boutons.
+
+        Returns:
+            pygame.Surface: Calque opaque de la taille de l'écran.
+        """
+        layer = pygame.Surface(self.screen.get_size()).convert()
+
         # Fond du menu
-        gameMenu = pygame.image.load(chemin_relatif("assets/images/background/bg_menu.png")).convert_alpha()
-        self.screen.blit(gameMenu, (0, 0))
+        gameMenu = pygame.image.load(self.BG_IMG).convert_alpha()
+        layer.blit(gameMenu, (0, 0))
 
         # Titre
         title_text = self.font_title.render(TITLE, True, WHITE)
@@ -156,32 +178,30 @@ class Menu:
         #score
         max_score_text = self.font_text.render(f"Max score", True, WHITE)
         score_text = self.font_text.render(f"{self.score}", True, WHITE)
-        self.screen.blit(max_score_text, (WIDTH //2 - max_score_text.get_width() - 100, HEIGHT // 3))
-        self.screen.blit(score_text, (WIDTH //2 - score_text.get_width() - 100, HEIGHT // 3 + 20))
+        layer.blit(max_score_text, (WIDTH //2 - max_score_text.get_width() - 100, HEIGHT // 3))
+        layer.blit(score_text, (WIDTH //2 - score_text.get_width() - 100, HEIGHT // 3 + 20))
 
         # Ruban
         ribbon_height = self.ribbon.get_height()
         scaled_ribbon = pygame.transform.scale(self.ribbon, (title_text.get_width() * 1.7, ribbon_height + 40))
         ribbon_rect = scaled_ribbon.get_rect(midtop=(WIDTH // 2, title_y - 10))
-        self.screen.blit(scaled_ribbon, ribbon_rect)
-        self.screen.blit(pixelate(title_text, 0.7), (title_x, title_y))
+        layer.blit(scaled_ribbon, ribbon_rect)
+        layer.blit(pixelate(title_text, 0.7), (title_x, title_y))
 
         # Dessiner les boutons
-        self.credit_button.draw(self.screen)
-        self.infinite_button.draw(self.screen)
-        self.lore_button.draw(self.screen)
+        self.credit_button.draw(layer)
+        self.infinite_button.draw(layer)
+        self.lore_button.draw(layer)
+        return layer
 
-        # Mise à jour et rendu des éléments animés
-        self.sheep.update()
-        self.sheep.draw(self.screen)
-        self.tree.update()
-        self.tree.draw(self.screen)
-        self.bush.update()
-        self.bush.draw(self.screen)
+    def _bake_front_layer(self):
+        """
+        Compose la bannière et le sous-titre, affichés au-dessus du joueur.
 
-        # Mise à jour et rendu du joueur
-        self.playerSprites.update()
-        self.playerSprites.draw(self.screen)
+        Returns:
+            tuple[pygame.Surface, tuple[int, int]]: Calque transparent recadré et sa position.
+        """
+        layer = pygame.Surface(self.screen.get_size(), pygame.SRCALPHA)
 
         # Sous-titre
         lines = SUBTITLE.split('\n')
@@ -193,11 +213,34 @@ class Menu:
         banner_height = self.banner.get_height()
         scaled_banner = pygame.transform.scale(self.banner, (subtitle_text_temp.get_width() + 400, banner_height + 100))
         banner_rect = scaled_banner.get_rect(midtop=(subtitle_x + 70, subtitle_y - 30))
-        self.screen.blit(scaled_banner, banner_rect)
+        layer.blit(scaled_banner, banner_rect)
 
         for i, line in enumerate(lines):
             subtitle_text = self.font_subtitle.render(line, True, (0, 0, 0))
             subtitle_text = pygame.transform.rotate(subtitle_text, self.banner_rotation_angle - 5)
-            self.screen.blit(subtitle_text, (subtitle_x - 20, (subtitle_y + 35) + i * 30))
+            layer.blit(subtitle_text, (subtitle_x - 20, (subtitle_y + 35) + i * 30))
+
+        # On ne garde que la zone non transparente
+        bounds = layer.get_bounding_rect()
+        return layer.subsurface(bounds).copy(), bounds.topleft
+
+    def draw(self):
+        # Décor fixe (fond, titre, score, boutons)
+        self.screen.blit(self.back_layer, (0, 0))
+
+        # Mise à jour et rendu des éléments animés
+        self.sheep.update()
+        self.sheep.draw(self.screen)
+        self.tree.update()
+        self.tree.draw(self.screen)
+        self.bush.update()
+        self.bush.draw(self.screen)
+
+        # Mise à jour et rendu du joueur
+        self.playerSprites.update()
+        self.playerSprites.draw(self.screen)
+
+        # Bannière et sous-titre
+        self.screen.blit(self.front_layer, self.front_pos)
 
         pygame.display.flip()
@@ -0,0 +1,191 @@
+"""
+overlay.py
+
+Overlay de performances de la partie (touche F3).
+
+Affiche par-dessus l'ATH : FPS, courbe des durées de frame, temps passé dans
+`events`, `update`, `draw` et `display.flip`, nombre de sprites et taux de
+succès des caches (sprites, sons, textes).
+
+Caché, il ne coûte presque rien : les points de mesure (`mark`) s'arrêtent au
+premier test et il n'est pas dessiné. Affiché, il ne rasterise aucun texte
+pendant la partie : les libellés et les chiffres sont rendus une fois à sa
+création (`DigitCompositor`), pour ne pas fausser ce qu'il mesure, en
+particulier le taux de succès du cache de textes.
+"""
+import time
+import pygame
+from settings import RENDER_FPS, PERF_OVERLAY, WHITE
+from timing import frame_scheduler
+from utilitaire import DigitCompositor, sprite_cache, sound_bank, text_cache
+
+SECTIONS = ("events", "update", "draw", "flip")
+
+
+class PerfOverlay:
+    """
+    Mesures de la boucle de jeu et leur affichage.
+
+    Attributs :
+        visible (bool): Overlay affiché (mesures actives).
+        image (pygame.Surface): Rendu de l'overlay.
+        rect (pygame.Rect): Position de l'overlay à l'écran.
+        section_times (dict[str, float]): Temps moyen (s) par section sur la dernière période.
+        budget_ms (float | None): Durée d'une frame à la fréquence d'affichage de la partie
+            (None si l'affichage n'est pas limité).
+    """
+    FONT_SIZE = 16
+    LINE_HEIGHT = 16
+    PADDING = 6
+    WIDTH = 220
+    GRAPH_HEIGHT = 50
+    GRAPH_MAX_MS = 50  # durée de frame en haut de la courbe
+    REFRESH_FRAMES = 15  # frames entre deux mises à jour des chiffres (lisibles)
+    BACKGROUND = (0, 0, 0, 170)
+    GRAPH_OK = (80, 200, 80)
+    GRAPH_SLOW = (230, 80, 60)
+
+    def __init__(self, visible=PERF_OVERLAY):
+        self.visible = visible
+        self.section_times = dict.fromkeys(SECTIONS, 0.0)
+        self.image = None
+        self.rect = None
+        self._rows = None
+        self._values = {}
+        self._totals = dict.fromkeys(SECTIONS, 0.0)
+        self._frames = 0
+        self._last = 0.0
+        self._last_frame = None
+        # Fréquence d'affichage en vigueur : RENDER_FPS, sinon la cible du cadenceur
+        fps = RENDER_FPS or frame_scheduler.target_fps
+        self.budget_ms = 1000 / fps if fps else None
+
+    def toggle(self):
+        """Affiche ou cache l'overlay."""
+        self.visible = not self.visible
+        self._last = time.perf_counter()
+
+    def mark(self, section):
+        """
+        Point de mesure : attribue le temps écoulé depuis le point précédent à `section`.
+
+        Args:
+            section (str): "events", "update", "draw" ou "flip".
+        """
+        if not self.visible:
+            return
+        now = time.perf_counter()
+        self._totals[section] += now - self._last
+        self._last = now
+
+    def begin_frame(self):
+        """Début de frame (après l'attente du cadenceur) : le temps d'attente n'est pas compté."""
+        if self.visible:
+            self._last = time.perf_counter()
+
+    def _build(self):
+        """Crée les surfaces (police, libellés, chiffres) au premier affichage."""
+        font = pygame.font.Font(None, self.FONT_SIZE + 4)
+        labels = (
+            ("fps", "FPS "), ("frame", "frame us "),
+            ("events", "events us "), ("update", "update us "), ("draw", "draw us "), ("flip", "flip us "),
+            ("all_sprites", "all_sprites "), ("enemies", "enemies "), ("power_ups", "power_ups "),
+            ("sprite_cache", "cache sprites % "), ("sound_bank", "cache sons % "), ("text_cache", "cache textes % "),
+        )
+        self._rows = [(name, DigitCompositor(font, WHITE, prefix=prefix, max_digits=7)) for name, prefix in labels]
+        self._values = dict.fromkeys((name for name, _ in labels), 0)
+        height = self.PADDING * 3 + self.LINE_HEIGHT * len(labels) + self.GRAPH_HEIGHT
+        self.image = pygame.Surface((self.WIDTH, height), pygame.SRCALPHA)
+        self.rect = self.image.get_rect(topright=(pygame.display.get_surface().get_width() - 10, 90))
+        graph_width = self.WIDTH - 2 * self.PADDING
+        self._graph = pygame.Surface((graph_width, self.GRAPH_HEIGHT), pygame.SRCALPHA)
+        self._graph.fill(self.BACKGROUND)
+        self._budget_y = None
+        if self.budget_ms is not None:
+            self._budget_y = self.GRAPH_HEIGHT - round(min(self.budget_ms, self.GRAPH_MAX_MS) / self.GRAPH_MAX_MS
+                                                       * self.GRAPH_HEIGHT)
+
+    @staticmethod
+    def _hit_rate(cache):
+        requests = cache.hits + cache.misses
+        return round(100 * cache.hits / requests) if requests else 100
+
+    def _refresh(self, game):
+        """Met à jour les chiffres affichés (moyennes sur la dernière période)."""
+        frames = max(1, self._frames)
+        for section in SECTIONS:
+            self.section_times[section] = self._totals[section] / frames
+            self._totals[section] = 0.0
+        self._frames = 0
+
+        stats = frame_scheduler.stats()
+        values = self._values
+        values["fps"] = round(stats["fps"])
+        values["frame"] = round(stats["avg_ms"] * 1000)
+        for section in SECTIONS:
+            values[section] = round(self.section_times[section] * 1e6)
+        values["all_sprites"] = len(game.all_sprites)
+        values["enemies"] = len(game.enemies)
+        values["power_ups"] = len(game.power_ups)
+        values["sprite_cache"] = self._hit_rate(sprite_cache)
+        values["sound_bank"] = self._hit_rate(sound_bank)
+        values["text_cache"] = self._hit_rate(text_cache)
+
+    def _plot(self):
+        """Ajoute la durée de la dernière frame à droite de la courbe."""
+        if not frame_scheduler.frame_times or frame_scheduler.frame_count == self._last_frame:
+            return
+        self._last_frame = frame_scheduler.frame_count
+        frame_ms = frame_scheduler.frame_times[-1] * 1000
+        width, height = self._graph.get_size()
+        self._graph.scroll(-1, 0)
+        self._graph.fill(self.BACKGROUND, (width - 1, 0, 1, height))
+        bar = min(height, round(frame_ms / self.GRAPH_MAX_MS * height))
+        slow = self.budget_ms is not None and frame_ms > self.budget_ms * 1.1
+        color = self.GRAPH_SLOW if slow else self.GRAPH_OK
+        self._graph.fill(color, (width - 1, height - bar, 1, bar))
+
+    def update(self, game):
+        """
+        Prépare l'image de l'overlay pour la frame courante.
+
+        Args:
+            game (Game): Partie mesurée.
+
+        Returns:
+            pygame.Surface: Image de l'overlay.
+        """
+        if self.image is None:
+            self._build()
+        self._frames += 1
+        if self._frames >= self.REFRESH_FRAMES:
+            self._refresh(game)
+        self._plot()
+
+        self.image.fill(self.BACKGROUND)
+        y = self.PADDING
+        for name, counter in self._rows:
+            self.image.blit(counter.render(self._values[name]), (self.PADDING, y))
+            y += self.LINE_HEIGHT
+        y += self.PADDING
+        self.image.blit(self._graph, (self.PADDING, y))
+        # Ligne du budget d'une frame à la fréquence d'affichage
+        if self._budget_y is not None:
+            pygame.draw.line(self.image, WHITE, (self.PADDING, y + self._budget_y),
+                             (self.WIDTH - self.PADDING - 1, y + self._budget_y))
+        return self.image
+
+    def draw(self, screen, game):
+        """
+        Dessine l'overlay (s'il est affiché).
+
+        Args:
+            screen (pygame.Surface): Surface d'affichage.
+            game (Game): Partie mesurée.
+        """
+        if self.visible:
+            screen.blit(self.update(game), self.rect)
+
+
+# Overlay unique : reste affiché d'une partie à l'autre
+perf_overlay = PerfOverlay()
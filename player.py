@@ -11,9 +11,11 @@ et interagir avec son environnement. La classe gère :
 - les sons associés (attaques, pas, dégâts, mort).
 """
 import pygame
-import time
 from settings import WIDTH, HEIGHT, GAME_ZONE_BOTTOM, GAME_ZONE_LEFT, GAME_ZONE_RIGHT, GAME_ZONE_TOP
-from utilitaire import load_sprites, animate, SoundEffects, chemin_relatif
+from utilitaire import animate, SoundEffects, chemin_relatif, sprite_cache
+from timing import game_clock
+from inputs import DeviceInput
+from profiling import timed
 
 class Player(pygame.sprite.Sprite):
     """
@@ -32,24 +34,70 @@ class Player(pygame.sprite.Sprite):
         invisible (bool): Indique si le joueur est invisible.
         is_invulnerable (bool): Indique si le joueur est temporairement invulnérable.
         joystick (pygame.joystick.Joystick | None): Manette détectée (si disponible).
+        controls (DeviceInput | ScriptedInput | BotInput): Source des commandes lues à chaque pas.
+        alpha (int): Opacité du joueur (appliquée à sa frame courante après l'animation).
+        current_sprite (pygame.Surface): Frame d'animation courante (partagée, dans les pages du cache).
         nb_rea (int): Nombre de réaparition faite pars le joueur
     """
+    # Spritesheets du joueur : (chemin, nombre de frames)
+    # Les animations vers la gauche sont dérivées par miroir des versions droite.
+    SPRITES = {
+        "walkR": (chemin_relatif("assets/images/player/Warrior_Run.png"), 6),
+        "idleR": (chemin_relatif("assets/images/player/Warrior_Idle.png"), 8),
+        "attackR": (chemin_relatif("assets/images/player/Warrior_Attack2.png"), 4),
+        "invisible": (chemin_relatif("assets/images/items/Foam.png"), 8),
+    }
+
+    # Groupes de sons du joueur (décodés une seule fois dans la banque partagée)
+    SOUND_GROUPS = {
+        "sword_swings": [
+            chemin_relatif("assets/sounds/sound_effects/sword_swing_1.ogg"),
+            chemin_relatif("assets/sounds/sound_effects/sword_swing_2.ogg"),
+            chemin_relatif("assets/sounds/sound_effects/sword_swing_3.ogg"),
+            chemin_relatif("assets/sounds/sound_effects/sword_swoosh_1.ogg")
+        ],  # sons attaque du joueur
+        "player_hurts": [
+            chemin_relatif("assets/sounds/sound_effects/hit_1.ogg"),
+            chemin_relatif("assets/sounds/sound_effects/hit_2.ogg"),
+            chemin_relatif("assets/sounds/sound_effects/hit_3.ogg")
+        ],  # sons dégat joueur
+        "footstep_stone": [
+            chemin_relatif("assets/sounds/sound_effects/footstep_stone_1.ogg"),
+            chemin_relatif("assets/sounds/sound_effects/footstep_stone_2.ogg"),
+            chemin_relatif("assets/sounds/sound_effects/footstep_stone_3.ogg")
+        ],  # sons pas lvl 1, 2 et donjon
+        "footstep_grass": [
+            chemin_relatif("assets/sounds/sound_effects/footstep_grass_1.ogg"),
+            chemin_relatif("assets/sounds/sound_effects/footstep_grass_2.ogg"),
+            chemin_relatif("assets/sounds/sound_effects/footstep_grass_3.ogg")
+        ],  # sons pas lvl 3, 4 et boss
+    }
+    KILL_SOUND = chemin_relatif("assets/sounds/sound_effects/mob_death.ogg")
+
     def __init__(self, game=None):
         super().__init__()
         self.game = game
 
         # === Sprites ===
-        self.walkRSprites = load_sprites(chemin_relatif("assets/images/player/Warrior_Run.png"), 6) # 6 frames d'animation
-        self.idleRSprites = load_sprites(chemin_relatif("assets/images/player/Warrior_Idle.png"),8)
-        self.walkLSprites = load_sprites(chemin_relatif("assets/images/player/Warrior_RunL.png"), 6)
-        self.attackRSprites = load_sprites(chemin_relatif("assets/images/player/Warrior_Attack2.png"), 4)
-        self.attackLSprites = load_sprites(chemin_relatif("assets/images/player/Warrior_Attack2L.png"), 4)
-        self.idleLSprites = load_sprites(chemin_relatif("assets/images/player/Warrior_IdleL.png"), 8)
-        self.invisibleSprite = load_sprites(chemin_relatif("assets/images/items/Foam.png"), 8)
+        # Frames partagées du cache (packées dans ses pages) : elles ne sont jamais
+        # modifiées, l'opacité du joueur passe par ses tampons (`apply_opacity`)
+        self.walkRSprites = sprite_cache.get(*self.SPRITES["walkR"])
+        self.idleRSprites = sprite_cache.get(*self.SPRITES["idleR"])
+        self.walkLSprites = sprite_cache.get_mirrored(*self.SPRITES["walkR"])
+        self.attackRSprites = sprite_cache.get(*self.SPRITES["attackR"])
+        self.attackLSprites = sprite_cache.get_mirrored(*self.SPRITES["attackR"])
+        self.idleLSprites = sprite_cache.get_mirrored(*self.SPRITES["idleR"])
+        self.invisibleSprite = sprite_cache.get(*self.SPRITES["invisible"])
+        self.alpha = 255
+        # Deux tampons alternés pour la frame translucide : une nouvelle image change
+        # de surface, ce que le rendu partiel détecte (il compare les surfaces)
+        self._buffers = [None, None]
+        self._shown = None  # (frame, opacité) affichée dans le tampon courant
 
         # Animation courante
         self.current_frame = 0 #Index de la frame actuelle dans la liste de sprites.
-        self.image = self.walkLSprites[self.current_frame] #Image actuelle du sprite affichée à l'écran.
+        self.current_sprite = self.walkLSprites[self.current_frame]
+        self.image = self.current_sprite #Image actuelle du sprite affichée à l'écran.
         self.rect = self.image.get_rect(center=(WIDTH // 2, HEIGHT // 2)) #Rectangle qui définit la position et la taille du sprite.
         self.original_rect = self.rect.copy()
 
@@ -57,12 +105,12 @@ class Player(pygame.sprite.Sprite):
         self.mask = pygame.mask.from_surface(self.image)
 
         # Cooldown d'attaque
-        self.last_attack_time = 0  # Temps de la dernière attaque
+        self.last_attack_time = float("-inf")  # Temps de jeu de la dernière attaque (jamais)
         self.attack_cooldown = 0.65 # Cooldown en secondes
 
         # Frame d'invulnérabilité
         self.iframe_duration = 1 # temps en secondes
-        self.iframe_start_time = 0
+        self.iframe_start_time = float("-inf")
         self.is_invulnerable = False  # Indique si le joueur est invulnérable
         self.blink_timer = 0
 
@@ -77,11 +125,11 @@ class Player(pygame.sprite.Sprite):
         self.state = "idleR" #État actuel du joueur (idle, walk, attack, invisible).
         self.attacking = False
         self.invisible = False
-        self.invisible_start_time = 0
+        self.invisible_start_time = float("-inf")
         self.invisible_duration = 2  # secondes
         self.nb_rea = 0
         # Ne pas équilibrer les power ups ici
-        self.damageAmpStart = 0
+        self.damageAmpStart = float("-inf")
         self.damageAmpValue = 0
         self.damageAmpDuration = 0
 
@@ -95,30 +143,8 @@ class Player(pygame.sprite.Sprite):
         #initialisation sons
         self.sound = SoundEffects()
 
-        self.sound.load_sound_group("sword_swings", [
-            chemin_relatif("assets/sounds/sound_effects/sword_swing_1.ogg"),
-            chemin_relatif("assets/sounds/sound_effects/sword_swing_2.ogg"),
-            chemin_relatif("assets/sounds/sound_effects/sword_swing_3.ogg"),
-            chemin_relatif("assets/sounds/sound_effects/sword_swoosh_1.ogg")
-        ]) # sons attaque du joueur
-
-        self.sound.load_sound_group("player_hurts", [
-            chemin_relatif("assets/sounds/sound_effects/hit_1.ogg"),
-            chemin_relatif("assets/sounds/sound_effects/hit_2.ogg"),
-            chemin_relatif("assets/sounds/sound_effects/hit_3.ogg")
-        ]) #sons dégat joueur
-
-        self.sound.load_sound_group("footstep_stone", [
-            chemin_relatif("assets/sounds/sound_effects/footstep_stone_1.ogg"),
-            chemin_relatif("assets/sounds/sound_effects/footstep_stone_2.ogg"),
-            chemin_relatif("assets/sounds/sound_effects/footstep_stone_3.ogg")
-        ]) #sons pas lvl 1, 2 et donjon
-
-        self.sound.load_sound_group("footstep_grass", [
-            chemin_relatif("assets/sounds/sound_effects/footstep_grass_1.ogg"),
-            chemin_relatif("assets/sounds/sound_effects/footstep_grass_2.ogg"),
-            chemin_relatif("assets/sounds/sound_effects/footstep_grass_3.ogg")
-        ]) #sons pas lvl 3, 4 et boss
+        for group_name, sound_files in self.SOUND_GROUPS.items():
+            self.sound.load_sound_group(group_name, sound_files)
 
         # Initialisation manette si dispo
         self.joystick = None
@@ -126,29 +152,30 @@ class Player(pygame.sprite.Sprite):
             self.joystick = pygame.joystick.Joystick(0)
             self.joystick.init()
             print("Manette détectée :", self.joystick.get_name())
+        self.controls = DeviceInput(self.joystick)
 
         # Direction face
         self.faceRorL = "R"
 
     def handle_keys(self):
-            keys = pygame.key.get_pressed()
+            controls = self.controls.read()
             moving = False
 
             # ============================================
             # Controle Clavier
             # ============================================
-            if keys[pygame.K_LEFT] or keys[pygame.K_q]:
+            if controls.left:
                 self.rect.x -= self.speed
                 moving = True
                 self.faceRorL = "L"
-            if keys[pygame.K_RIGHT] or keys[pygame.K_d]:
+            if controls.right:
                 self.rect.x += self.speed
                 moving = True
                 self.faceRorL = "R"
-            if keys[pygame.K_UP] or keys[pygame.K_z]:
+            if controls.up:
                 self.rect.y -= self.speed
                 moving = True
-            if keys[pygame.K_DOWN] or keys[pygame.K_s]:
+            if controls.down:
                 self.rect.y += self.speed
                 moving = True
 
@@ -163,22 +190,22 @@ class Player(pygame.sprite.Sprite):
                 self.rect.bottom = GAME_ZONE_BOTTOM
 
             # === Déclenchement invisibilité ===
-            if keys[pygame.K_LSHIFT] and not self.invisible and self.mana >= 4:
+            if controls.invisible and not self.invisible and self.mana >= 4:
                 self.invisible = True
-                self.invisible_start_time = time.time()
+                self.invisible_start_time = game_clock.time
                 self.mana -=4
 
             # === Déclenchement attaque ===
-            if (keys[pygame.K_SPACE] or pygame.mouse.get_pressed()[0]) and not self.attacking and not self.invisible and self.faceRorL == "L":
-                current_time = time.time()
+            if controls.attack and not self.attacking and not self.invisible and self.faceRorL == "L":
+                current_time = game_clock.time
                 if current_time - self.last_attack_time >= self.attack_cooldown:  # Vérifie le cooldown
                     self.state = "attackL"
                     self.attacking = True
                     self.current_frame = 0
                     self.frame_timer = 0
                     self.last_attack_time = current_time  # Met à jour le temps de la dernière attaque
-            elif (keys[pygame.K_SPACE] or pygame.mouse.get_pressed()[0]) and not self.attacking and not self.invisible and self.faceRorL == "R":
-                current_time = time.time()
+            elif controls.attack and not self.attacking and not self.invisible and self.faceRorL == "R":
+                current_time = game_clock.time
                 if current_time - self.last_attack_time >= self.attack_cooldown:  # Vérifie le cooldown
                     self.state = "attackR"
                     self.attacking = True
@@ -190,50 +217,50 @@ class Player(pygame.sprite.Sprite):
             # Controle Manette
             # ============================================
 
-            if self.joystick :
-                # Stick gauche
-                axis_x = self.joystick.get_axis(0)  # -1 = gauche, +1 = droite
-                axis_y = self.joystick.get_axis(1)  # -1 = haut,   +1 = bas
-                axis_rt= self.joystick.get_axis(5)  # gachette gauche
-
-                if (self.joystick.get_button(0) or axis_rt > 0.5 ) and not self.attacking and not self.invisible and self.faceRorL == "L":
-                    current_time = time.time()
-                    if current_time - self.last_attack_time >= self.attack_cooldown:  # Vérifie le cooldown
-                        self.state = "attackL"
-                        self.attacking = True
-                        self.current_frame = 0
-                        self.frame_timer = 0
-                        self.last_attack_time = current_time  # Met à jour le temps de la dernière attaque
-
-                if (self.joystick.get_button(0) or axis_rt > 0.5) and not self.attacking and not self.invisible and self.faceRorL == "R":
-                    current_time = time.time()
-                    if current_time - self.last_attack_time >= self.attack_cooldown:  # Vérifie le cooldown
-                        self.state = "attackR"
-                        self.attacking = True
-                        self.current_frame = 0
-                        self.frame_timer = 0
-                        self.last_attack_time = current_time  # Met à jour le temps de la dernière attaque
-
-                if ( self.joystick.get_button(4) or self.joystick.get_button(2) )  and not self.invisible and self.mana >= 4:
-                    self.invisible = True
-                    self.invisible_start_time = time.time()
-                    self.mana -=4
-
-                # Deadzone (évite les petits tremblements du stick)
-                # Droite
-                if axis_x > 0.5 :
-                    self.rect.x += self.speed
-                    moving = True
-                    self.faceRorL = "R"
-                # Gauche
-                if axis_x < -0.5 :
-                    self.rect.x -= self.speed
-                    moving = True
-                    self.faceRorL = "L"
-                # Haut / Bas
-                if abs(axis_y) > 0.2:
-                    self.rect.y += int(axis_y * self.speed)
-                    moving = True
+            # (sans manette, les axes et boutons de l'instantané restent à zéro)
+            # Stick gauche
+            axis_x = controls.joy_x  # -1 = gauche, +1 = droite
+            axis_y = controls.joy_y  # -1 = haut,   +1 = bas
+            axis_rt = controls.joy_trigger  # gachette gauche
+
+            if (controls.joy_attack or axis_rt > 0.5 ) and not self.attacking and not self.invisible and self.faceRorL == "L":
+                current_time = game_clock.time
+                if current_time - self.last_attack_time >= self.attack_cooldown:  # Vérifie le cooldown
+                    self.state = "attackL"
+                    self.attacking = True
+                    self.current_frame = 0
+                    self.frame_timer = 0
+                    self.last_attack_time = current_time  # Met à jour le temps de la dernière attaque
+
+            if (controls.joy_attack or axis_rt > 0.5) and not self.attacking and not self.invisible and self.faceRorL == "R":
+                current_time = game_clock.time
+                if current_time - self.last_attack_time >= self.attack_cooldown:  # Vérifie le cooldown
+                    self.state = "attackR"
+                    self.attacking = True
+                    self.current_frame = 0
+                    self.frame_timer = 0
+                    self.last_attack_time = current_time  # Met à jour le temps de la dernière attaque
+
+            if controls.joy_invisible and not self.invisible and self.mana >= 4:
+                self.invisible = True
+                self.invisible_start_time = game_clock.time
+                self.mana -=4
+
+            # Deadzone (évite les petits tremblements du stick)
+            # Droite
+            if axis_x > 0.5 :
+                self.rect.x += self.speed
+                moving = True
+                self.faceRorL = "R"
+            # Gauche
+            if axis_x < -0.5 :
+                self.rect.x -= self.speed
+                moving = True
+                self.faceRorL = "L"
+            # Haut / Bas
+            if abs(axis_y) > 0.2:
+                self.rect.y += int(axis_y * self.speed)
+                moving = True
 
 
             if not moving and not self.attacking and not self.invisible and self.faceRorL == "L":
@@ -246,6 +273,35 @@ class Player(pygame.sprite.Sprite):
                 self.state = "walkR"
 
 
+    def apply_opacity(self, alpha):
+        """
+        Affiche la frame courante avec une opacité, sans modifier la frame partagée.
+
+        Opaque, `image` est directement la frame du cache. Sinon la frame est copiée
+        dans un tampon du joueur qui porte l'opacité (seulement quand la frame ou
+        l'opacité change).
+
+        Args:
+            alpha (int): Opacité (0 à 255).
+        """
+        frame = self.current_sprite
+        if alpha == 255:
+            self.image = frame
+            self._shown = None
+            return
+        if self._shown == (frame, alpha):
+            return
+        self._buffers.reverse()
+        buffer = self._buffers[0]
+        if buffer is None or buffer.get_size() != frame.get_size():
+            buffer = self._buffers[0] = pygame.Surface(frame.get_size(), pygame.SRCALPHA)
+        buffer.fill((0, 0, 0, 0))
+        buffer.blit(frame, (0, 0))
+        buffer.set_alpha(alpha)
+        self.image = buffer
+        self._shown = (frame, alpha)
+
+    @timed
     def update(self):
         """Mets à jour le joueur
 
@@ -259,7 +315,7 @@ class Player(pygame.sprite.Sprite):
         """
 
         # Vérifie si l'invisibilité est terminée
-        self.invisibilityDurationLeft = 2 - (time.time() - self.invisible_start_time)
+        self.invisibilityDurationLeft = 2 - (game_clock.time - self.invisible_start_time)
         if self.invisibilityDurationLeft < 0 :
             self.invisible = False
 
@@ -272,71 +328,66 @@ class Player(pygame.sprite.Sprite):
 
 
         if self.state == "dead" :
-            self.image.set_alpha(0)
+            self.alpha = 0
+            self.apply_opacity(self.alpha)
             return
         else:
-            self.image.set_alpha(255)
             self.handle_keys()
 
-        if time.time() - self.damageAmpStart >= 2 :
+        if game_clock.time - self.damageAmpStart >= 2 :
             self.str = 1
 
         # Gérer les iframes
         if self.is_invulnerable:
 
-            current_time = time.time()
+            current_time = game_clock.time
             # Clignotement visuel
             self.blink_timer += self.animation_speed
             if self.blink_timer >= 0.25:  # Change de visibilité toutes les 0.1 secondes
                 self.blink_timer = 0
-                if self.image.get_alpha() == 255:
-                    self.image.set_alpha(100)  # Rend le joueur semi-transparent
-                else:
-                    self.image.set_alpha(255)  # Rétablit l'opacité normale
+                # Alterne entre semi-transparent et opacité normale
+                self.alpha = 100 if self.alpha == 255 else 255
 
             # Vérifie si les iframes sont terminées
             if current_time - self.iframe_start_time >= self.iframe_duration:
                 self.is_invulnerable = False
                 self.iframe_duration = 1
-                self.image.set_alpha(255)  # Rétablit l'opacité normale
+                self.alpha = 255  # Rétablit l'opacité normale
         else :
-            self.image.set_alpha(255)
+            self.alpha = 255
 
         # Animation selon l'état
         if self.invisible :
-            animate(self, self.invisibleSprite, loop=True)
-            # Rendre translucide
-            self.image.set_alpha(10)
+            animate(self, self.invisibleSprite, loop=True, assign_to_image=False)
         elif self.state == "walkR":
-            animate(self, self.walkRSprites, loop=True)
+            animate(self, self.walkRSprites, loop=True, assign_to_image=False)
             self.sound.play_sound_group("footstep_stone", 0.3, 0.4)
-            self.image.set_alpha(255)  # normal
         elif self.state == "walkL" :
-            animate(self, self.walkLSprites, loop=True)
+            animate(self, self.walkLSprites, loop=True, assign_to_image=False)
             self.sound.play_sound_group("footstep_stone", 0.3, 0.4)
-            self.image.set_alpha(255)  # normal
         elif self.state == "attackR":
-            animate(self, self.attackRSprites, loop=False)
+            animate(self, self.attackRSprites, loop=False, assign_to_image=False)
             self.sound.play_sound_group("sword_swings", 0.2)
-            self.image.set_alpha(255)  # normal
             # Quand l'animation d'attaque est terminée
             if self.current_frame == len(self.attackRSprites) - 1 and self.frame_timer == 0:
                 self.state = "idleR"
                 self.attacking = False
                 self.current_frame = 0
         elif self.state == "attackL":
-            animate(self, self.attackLSprites, loop=False)
+            animate(self, self.attackLSprites, loop=False, assign_to_image=False)
             self.sound.play_sound_group("sword_swings", 0.2)
-            self.image.set_alpha(255)  # normal
             # Quand l'animation d'attaque est terminée
             if self.current_frame == len(self.attackLSprites) - 1 and self.frame_timer == 0:
                 self.state = "idleL"
                 self.attacking = False
                 self.current_frame = 0
         elif self.state == "idleR" :
-            animate(self, self.idleRSprites, loop=True)
+            animate(self, self.idleRSprites, loop=True, assign_to_image=False)
         elif self.state == "idleL" :
-            animate(self, self.idleLSprites, loop=True)
+            animate(self, self.idleLSprites, loop=True, assign_to_image=False)
+
+        # Opacité appliquée à la frame courante (translucide si invisible)
+        self.apply_opacity(10 if self.invisible else self.alpha)
 
     def take_damage(self, amount):
         if not self.is_invulnerable and self.state != "dead":  # Vérifie si le joueur est invulnérable ou mort
@@ -348,10 +399,10 @@ class Player(pygame.sprite.Sprite):
             else:
                 # Active les iframes
                 self.is_invulnerable = True
-                self.iframe_start_time = time.time()  # Enregistre le début des iframes
+                self.iframe_start_time = game_clock.time  # Enregistre le début des iframes
 
     def enemy_killed(self, points):
-        self.sound.play_sound_one(chemin_relatif("assets/sounds/sound_effects/mob_death.ogg"), volume=0.4)
+        self.sound.play_sound_one(self.KILL_SOUND, volume=0.4)
         self.score += points
         if self.mana < 4:
             self.mana += 1
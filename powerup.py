@@ -1,7 +1,7 @@
 #powerup.py
 import pygame
-import time
-from utilitaire import load_sprites, chemin_relatif, SoundEffects
+from utilitaire import chemin_relatif, sprite_cache
+from timing import game_clock
 
 class PowerUp(pygame.sprite.Sprite):
     """
@@ -15,6 +15,16 @@ class PowerUp(pygame.sprite.Sprite):
     - "invulnerability" : Rend le joueur invulnérable pendant un certain temps.
     - "heart" : Rend un point de vie au joueur.
     """
+    SIZE = 50
+
+    # Spritesheets des bonus : (chemin, nombre de frames)
+    SPRITES = {
+        "damageAmp": (chemin_relatif("assets/images/items/damageAmp.png"), 8),
+        "invulnerability": (chemin_relatif("assets/images/items/invulnerability.png"), 8),
+        "heart": (chemin_relatif("assets/images/items/heart.png"), 6),
+    }
+    PICKUP_SOUND = chemin_relatif("assets/sounds/sound_effects/powerup.ogg")
+
     def __init__(self, pos, bonus_type, player):
         super().__init__()
         self.image = pygame.Surface((64, 64))  # Taille par défaut
@@ -22,24 +32,12 @@ class PowerUp(pygame.sprite.Sprite):
         self.bonus_type = bonus_type
         self.player = player
 
-        self.size = 50
+        self.size = self.SIZE
 
-        # Charger les sprites selon le type de bonus
-        if self.bonus_type == "damageAmp":
-            self.sprites = [
-                pygame.transform.scale(frame, (self.size, self.size))
-                for frame in load_sprites(chemin_relatif("assets/images/items/damageAmp.png"), 8)
-            ]
-        elif self.bonus_type == "invulnerability":
-            self.sprites = [
-                pygame.transform.scale(frame, (self.size, self.size))
-                for frame in load_sprites(chemin_relatif("assets/images/items/invulnerability.png"), 8)
-            ]
-        elif self.bonus_type == "heart":
-            self.sprites = [
-                pygame.transform.scale(frame, (self.size, self.size))
-                for frame in load_sprites(chemin_relatif("assets/images/items/heart.png"), 6)
-            ]
+        # Charger les sprites selon le type de bonus (partagés via le cache)
+        if self.bonus_type in self.SPRITES:
+            path, frames = self.SPRITES[self.bonus_type]
+            self.sprites = sprite_cache.get(path, frames, size=(self.size, self.size))
         else:
             # Fallback : un carré rouge
             self.sprites = [pygame.Surface((32, 32))]
@@ -50,7 +48,8 @@ class PowerUp(pygame.sprite.Sprite):
         self.frame_timer = 0  # Timer pour l'animation
         self.animationSpeed = 0.1
 
-        self.sound = SoundEffects()
+        # Sons joués via le gestionnaire du joueur (moteur audio partagé)
+        self.sound = player.sound
 
     def update(self):
         """Met à jour l'animation du power-up et vérifie la collision avec le joueur."""
@@ -70,15 +69,15 @@ class PowerUp(pygame.sprite.Sprite):
         # EQUILIBRAGE DES POWER UPS ICI
         # =============================
         if self.rect.colliderect(self.player.rect):
-            self.sound.play_sound_one(chemin_relatif("assets/sounds/sound_effects/powerup.ogg"), volume=0.3)
+            self.sound.play_sound_one(self.PICKUP_SOUND, volume=0.3)
             if self.bonus_type == "damageAmp":
                 self.player.damageAmpValue = 1
                 self.player.damageAmpDuration = 2 + self.player.invisibilityDurationLeft
                 self.player.str += self.player.damageAmpValue
-                self.player.damageAmpStart = time.time()
+                self.player.damageAmpStart = game_clock.time
             elif self.bonus_type == "invulnerability":
                 self.player.iframe_duration = 2 + self.player.invisibilityDurationLeft
-                self.player.iframe_start_time = time.time()
+                self.player.iframe_start_time = game_clock.time
                 self.player.is_invulnerable = True
             elif self.bonus_type == "heart":
                 self.player.hp += 1
@@ -0,0 +1,170 @@
+"""
+preload.py
+
+Phase de préchargement des ressources.
+
+Avant le premier `frame_scheduler.tick` de la partie, toutes les images dont une partie
+a besoin (joueur, ennemis, explosion, bonus, ATH, écran de mort, décors) sont
+chargées dans le cache partagé `sprite_cache`, et les effets sonores dans la
+banque `sound_bank`. Un écran avec barre de progression est affiché pendant
+le chargement, et le temps total est reporté.
+
+Les fonds des stages sont exclus : ils sont chargés en arrière-plan pendant
+la partie (voir streaming.py).
+"""
+import time
+import pygame
+from settings import WIDTH, HEIGHT, WHITE, BLACK
+from utilitaire import sprite_cache, sound_bank, chemin_relatif
+from enemy import ENEMY_SPRITES, EXPLOSION_SPRITES, QUESTION_MARK_IMAGE
+from player import Player
+from powerup import PowerUp
+from ath import Ath
+from end import End
+from game import Game
+
+
+def build_manifest():
+    """
+    Construit la liste de toutes les ressources nécessaires à une partie.
+
+    Chaque entrée est un tuple (type, arguments) où type vaut :
+        - "sheet"  : spritesheet découpé -> `sprite_cache.get(*arguments)`
+        - "mirror" : miroir horizontal   -> `sprite_cache.get_mirrored(*arguments)`
+        - "image"  : image simple        -> `sprite_cache.get_image(*arguments)`
+        - "folder" : dossier de frames   -> `sprite_cache.get_folder(*arguments)`
+        - "sound"  : effet sonore        -> `sound_bank.get(*arguments)`
+
+    Returns:
+        list[tuple[str, tuple]]: Manifeste de préchargement.
+    """
+    manifest = []
+
+    # Joueur (les animations "R" ont aussi une variante miroir)
+    for state, (path, frames) in Player.SPRITES.items():
+        manifest.append(("sheet", (path, frames)))
+        if state.endswith("R"):
+            manifest.append(("mirror", (path, frames)))
+
+    # Ennemis (tous les types, y compris le boss) et ressources communes
+    for sprite_data in ENEMY_SPRITES.values():
+        for state, sprite_info in sprite_data.items():
+            if state == "animation_speed":
+                continue
+            path, frames, scale_factor = sprite_info
+            manifest.append(("sheet", (path, frames, scale_factor or 1)))
+            if state.endswith("R"):
+                manifest.append(("mirror", (path, frames, scale_factor or 1)))
+    manifest.append(("sheet", EXPLOSION_SPRITES))
+    manifest.append(("image", QUESTION_MARK_IMAGE))
+
+    # Bonus
+    for path, frames in PowerUp.SPRITES.values():
+        manifest.append(("sheet", (path, frames, 1, (PowerUp.SIZE, PowerUp.SIZE))))
+
+    # ATH
+    for path in Ath.LIFE_PATHS.values():
+        manifest.append(("folder", (path, Ath.SCALE_FACTOR)))
+    for path in Ath.MANA_PATHS.values():
+        manifest.append(("sheet", (path, 1, Ath.SCALE_FACTOR)))
+
+    # Écran de mort
+    manifest.append(("sheet", (End.DEATH_SPRITE_PATH, End.DEATH_FRAMES)))
+    for path in (End.RETRY_IMG, End.RETRY_PRESSED_IMG, End.MENU_IMG, End.MICRO_IMG):
+        manifest.append(("image", (path,)))
+
+    # Décors de la partie
+    for path in Game.SHADOW_IMAGES + Game.DOOR_IMAGES + (Game.PLAYER_STATIC_IMAGE,):
+        manifest.append(("image", (path,)))
+
+    # Effets sonores (banque de sons partagée)
+    for sound_files in Player.SOUND_GROUPS.values():
+        for path in sound_files:
+            manifest.append(("sound", (path,)))
+    for path in (Player.KILL_SOUND, PowerUp.PICKUP_SOUND, Game.DIALOGUE_SOUND, Game.BOSS_TALK_SOUND):
+        manifest.append(("sound", (path,)))
+
+    return manifest
+
+
+def load_entry(kind, args):
+    """
+    Charge une entrée du manifeste dans le cache partagé.
+
+    Args:
+        kind (str): Type de ressource ("sheet", "mirror", "image", "folder" ou "sound").
+        args (tuple): Arguments transmis à la méthode du cache.
+    """
+    if kind == "sheet":
+        sprite_cache.get(*args)
+    elif kind == "mirror":
+        sprite_cache.get_mirrored(*args)
+    elif kind == "image":
+        sprite_cache.get_image(*args)
+    elif kind == "folder":
+        sprite_cache.get_folder(*args)
+    elif kind == "sound":
+        sound_bank.get(*args)
+    else:
+        raise ValueError(f"Type de ressource inconnu : {kind}")
+
+
+class Preloader:
+    """
+    Écran de chargement affiché avant le lancement du jeu.
+
+    Attributs :
+        screen (pygame.Surface): Surface principale.
+        manifest (list[tuple[str, tuple]]): Ressources à charger.
+        font (pygame.font.Font): Police du texte de progression.
+        load_time (float): Durée totale du chargement en secondes.
+    """
+    FONT = (chemin_relatif("assets/fonts/GenAR102.TTF"), 24)
+    BAR_RECT = pygame.Rect(WIDTH // 2 - 300, HEIGHT // 2 - 15, 600, 30)
+
+    def __init__(self, screen, manifest=None):
+        """
+        Args:
+            screen (pygame.Surface): Surface du jeu.
+            manifest (list | None): Manifeste à charger (par défaut `build_manifest()`).
+        """
+        self.screen = screen
+        self.manifest = manifest if manifest is not None else build_manifest()
+        self.font = pygame.font.Font(*self.FONT)
+        self.load_time = 0.0
+
+    def run(self):
+        """
+        Charge toutes les ressources du manifeste en affichant la progression.
+
+        Returns:
+            float: Durée totale du chargement en secondes.
+        """
+        start = time.perf_counter()
+        total = len(self.manifest)
+        for index, (kind, args) in enumerate(self.manifest):
+            load_entry(kind, args)
+            pygame.event.pump()  # garde la fenêtre réactive pendant le chargement
+            self._draw(index + 1, total)
+
+        self.load_time = time.perf_counter() - start
+        print(f"[Preload] {total} ressources chargées en {self.load_time:.2f}s")
+        return self.load_time
+
+    def _draw(self, loaded, total):
+        """
+        Affiche la barre de progression.
+
+        Args:
+            loaded (int): Nombre de ressources déjà chargées.
+            total (int): Nombre total de ressources.
+        """
+        self.screen.fill(BLACK)
+        pygame.draw.rect(self.screen, WHITE, self.BAR_RECT, 2)
+        fill = self.BAR_RECT.inflate(-8, -8)
+        fill.width = int(fill.width * loaded / max(1, total))
+        pygame.draw.rect(self.screen, WHITE, fill)
+
+        text = self.font.render(f"Chargement... {loaded}/{total}", True, WHITE)
+        self.screen.blit(text, text.get_rect(midbottom=(WIDTH // 2, self.BAR_RECT.top - 10)))
+        pygame.display.flip()
@@ -0,0 +1,275 @@
+"""
+profiling.py
+
+Chronomètres et compteurs pour profiler le jeu.
+
+Désactivé par défaut : `timed` retourne la fonction décorée telle quelle,
+`scope` un contexte vide partagé et `count` ne fait rien, sans coût sur les
+fonctions mesurées. On l'active au lancement avec la variable d'environnement
+`ALAIN_TRACE`, qui donne le fichier de trace à écrire :
+
+    ALAIN_TRACE=trace.json python main.py --replay partie.alrp
+
+Activé, chaque appel mesuré alimente l'histogramme de son nom, et une trace
+au format Chrome (trace events) est écrite à la fin du programme avec un
+résumé des histogrammes dans la console. La trace s'ouvre dans
+https://ui.perfetto.dev ou chrome://tracing : une frame lente y apparaît
+avec les systèmes qui l'ont occupée (`Game.update`, `Enemy.update`...).
+
+Usage :
+    @timed                      # nom : Classe.méthode
+    def update(self): ...
+
+    with scope("Game.frame"):
+        ...
+
+    count("enemies.spawned")
+"""
+import atexit
+import contextlib
+import functools
+import json
+import math
+import os
+import threading
+import time
+
+TRACE_PATH = os.environ.get("ALAIN_TRACE") or None
+ENABLED = TRACE_PATH is not None
+MAX_EVENTS = 1_000_000  # au-delà, seuls les histogrammes sont mis à jour
+BUCKETS_PER_OCTAVE = 4
+
+
+class Histogram:
+    """
+    Répartition des durées d'un chronomètre, par intervalles logarithmiques.
+
+    Attributs :
+        count (int): Nombre de mesures.
+        total (int): Durée totale (ns).
+        min (int): Durée la plus courte (ns).
+        max (int): Durée la plus longue (ns).
+        buckets (dict[int, int]): Nombre de mesures par intervalle
+            (`BUCKETS_PER_OCTAVE` intervalles par doublement de la durée).
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0
+        self.min = None
+        self.max = 0
+        self.buckets = {}
+
+    def add(self, duration):
+        """
+        Args:
+            duration (int): Durée mesurée (ns).
+        """
+        self.count += 1
+        self.total += duration
+        if self.min is None or duration < self.min:
+            self.min = duration
+        if duration > self.max:
+            self.max = duration
+        bucket = int(math.log2(duration) * BUCKETS_PER_OCTAVE) if duration > 0 else 0
+        self.buckets[bucket] = self.buckets.get(bucket, 0) + 1
+
+    @property
+    def mean(self):
+        return self.total / self.count if self.count else 0.0
+
+    def percentile(self, q):
+        """
+        Args:
+            q (float): Quantile (0 à 1).
+
+        Returns:
+            float: Borne haute (ns) de l'intervalle qui contient le quantile.
+        """
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for bucket in sorted(self.buckets):
+            seen += self.buckets[bucket]
+            if seen >= rank:
+                return min(self.max, 2 ** ((bucket + 1) / BUCKETS_PER_OCTAVE))
+        return float(self.max)
+
+
+class _Scope:
+    """Contexte qui mesure la durée de son bloc."""
+    __slots__ = ("profiler", "name", "start")
+
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc):
+        self.profiler.record(self.name, self.start, time.perf_counter_ns())
+        return False
+
+
+class Profiler:
+    """
+    Collecte les mesures : histogrammes, compteurs et événements de trace.
+
+    Attributs :
+        histograms (dict[str, Histogram]): Durées par nom de chronomètre.
+        counters (dict[str, int]): Valeur de chaque compteur.
+        events (list[tuple]): Événements de trace (phase, nom, instant ns, durée ou valeur, thread).
+        dropped_events (int): Événements ignorés au-delà de `max_events`.
+    """
+
+    def __init__(self, max_events=MAX_EVENTS):
+        self.max_events = max_events
+        self.histograms = {}
+        self.counters = {}
+        self.events = []
+        self.dropped_events = 0
+        self._origin = time.perf_counter_ns()
+        self._threads = {}
+
+    def _event(self, phase, name, timestamp, value):
+        if len(self.events) >= self.max_events:
+            self.dropped_events += 1
+            return
+        thread = threading.get_ident()
+        if thread not in self._threads:
+            self._threads[thread] = threading.current_thread().name
+        self.events.append((phase, name, timestamp, value, thread))
+
+    def record(self, name, start, end):
+        """
+        Enregistre une mesure.
+
+        Args:
+            name (str): Nom du chronomètre.
+            start (int): Début (`time.perf_counter_ns`).
+            end (int): Fin (`time.perf_counter_ns`).
+        """
+        histogram = self.histograms.get(name)
+        if histogram is None:
+            histogram = self.histograms.setdefault(name, Histogram())
+        histogram.add(end - start)
+        self._event("X", name, start, end - start)
+
+    def count(self, name, amount=1):
+        """
+        Incrémente un compteur.
+
+        Args:
+            name (str): Nom du compteur.
+            amount (int): Valeur ajoutée.
+        """
+        value = self.counters.get(name, 0) + amount
+        self.counters[name] = value
+        self._event("C", name, time.perf_counter_ns(), value)
+
+    def chrome_trace(self):
+        """
+        Returns:
+            dict: Trace au format Chrome trace events (temps en microsecondes).
+        """
+        pid = os.getpid()
+        trace = [{"name": "thread_name", "ph": "M", "pid": pid, "tid": thread, "args": {"name": name}}
+                 for thread, name in self._threads.items()]
+        for phase, name, timestamp, value, thread in self.events:
+            event = {"name": name, "ph": phase, "ts": (timestamp - self._origin) / 1000, "pid": pid, "tid": thread}
+            if phase == "X":
+                event["dur"] = value / 1000
+            else:
+                event["args"] = {name: value}
+            trace.append(event)
+        return {"traceEvents": trace, "displayTimeUnit": "ms"}
+
+    def export_chrome_trace(self, path):
+        """
+        Écrit la trace au format Chrome.
+
+        Args:
+            path (str): Fichier de sortie (JSON).
+        """
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.chrome_trace(), f)
+        message = f"[Profiling] Trace écrite dans {path} ({len(self.events)} événements"
+        if self.dropped_events:
+            message += f", {self.dropped_events} ignorés"
+        print(message + ")")
+
+    def summary(self):
+        """
+        Returns:
+            str: Tableau des chronomètres (du plus coûteux au moins coûteux) et des compteurs.
+        """
+        lines = [f"{'chronomètre':<32} {'appels':>9} {'total ms':>10} {'moy us':>9} "
+                 f"{'p50 us':>9} {'p95 us':>9} {'max us':>9}"]
+        for name, histogram in sorted(self.histograms.items(), key=lambda item: -item[1].total):
+            lines.append(f"{name:<32} {histogram.count:>9} {histogram.total / 1e6:>10.1f} "
+                         f"{histogram.mean / 1000:>9.1f} {histogram.percentile(0.5) / 1000:>9.1f} "
+                         f"{histogram.percentile(0.95) / 1000:>9.1f} {histogram.max / 1000:>9.1f}")
+        for name, value in sorted(self.counters.items()):
+            lines.append(f"{name:<32} {value:>9}")
+        return "\n".join(lines)
+
+    def finish(self, path):
+        """Affiche le résumé et écrit la trace (à la fin du programme)."""
+        print(self.summary())
+        self.export_chrome_trace(path)
+
+
+# Collecteur unique (vide tant que le profilage est désactivé)
+profiler = Profiler()
+
+if ENABLED:
+    def scope(name):
+        """
+        Contexte qui mesure la durée de son bloc.
+
+        Args:
+            name (str): Nom du chronomètre.
+        """
+        return _Scope(profiler, name)
+
+    count = profiler.count
+    atexit.register(profiler.finish, TRACE_PATH)
+else:
+    _NULL_SCOPE = contextlib.nullcontext()
+
+    def scope(name):
+        return _NULL_SCOPE
+
+    def count(name, amount=1):
+        pass
+
+
+def timed(func=None, *, name=None):
+    """
+    Décorateur qui mesure chaque appel d'une fonction.
+    Sans profilage, la fonction est retournée telle quelle.
+
+    Args:
+        func (callable | None): Fonction décorée (`@timed`), ou None (`@timed(name=...)`).
+        name (str | None): Nom du chronomètre (par défaut le nom qualifié de la fonction).
+    """
+    def decorate(func):
+        if not ENABLED:
+            return func
+        label = name or func.__qualname__
+        record = profiler.record
+        clock = time.perf_counter_ns
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            start = clock()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                record(label, start, clock())
+        return wrapper
+
+    return decorate(func) if func is not None else decorate
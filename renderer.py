@@ -0,0 +1,155 @@
+"""
+renderer.py
+
+Rendu par rectangles sales (dirty rectangles) de la partie.
+
+Au lieu de reblitter tout le fond puis tous les sprites et d'appeler
+`pygame.display.flip()`, le renderer compare la liste des éléments à
+afficher avec celle de la frame précédente. Seules les zones qui ont changé
+(sprite déplacé, frame d'animation différente, transparence modifiée,
+élément apparu ou disparu, ATH redessiné) sont recomposées : fond, puis
+tous les éléments qui touchent la zone, dans l'ordre des calques. L'appelant
+met ensuite l'écran à jour avec `pygame.display.update(rects)` (ou `flip`
+après un rendu complet).
+
+Le rendu complet reste utilisé quand c'est plus simple ou moins cher
+(changement de stage, dialogues, écran de fin, trop de zones sales).
+"""
+import pygame
+
+
+class Drawable:
+    """
+    Élément à afficher pour une frame.
+
+    Attributs :
+        key (object): Identifiant stable de l'élément d'une frame à l'autre.
+        image (pygame.Surface): Surface à blitter.
+        rect (pygame.Rect): Zone couverte à l'écran.
+        alpha (int | None): Transparence de la surface au moment de l'affichage.
+        changed (bool): True si le contenu de `image` a été modifié en place.
+    """
+    __slots__ = ("key", "image", "rect", "alpha", "changed")
+
+    def __init__(self, key, image, pos, changed=False):
+        self.key = key
+        self.image = image
+        self.rect = pygame.Rect(pos[0], pos[1], *image.get_size())
+        self.alpha = image.get_alpha()
+        self.changed = changed
+
+    def same_as(self, other):
+        """True si l'élément s'affiche à l'identique de `other` (frame précédente)."""
+        return (not self.changed and self.image is other.image
+                and self.rect == other.rect and self.alpha == other.alpha)
+
+
+class DirtyRenderer:
+    """
+    Compose l'écran en ne redessinant que les zones modifiées.
+
+    Attributs :
+        screen (pygame.Surface): Surface d'affichage.
+        full_redraw_ratio (float): Au-delà de cette fraction de l'écran à redessiner,
+            un rendu complet est fait à la place.
+        full_redraws (int): Nombre de rendus complets.
+        partial_redraws (int): Nombre de rendus partiels.
+        last_dirty_area (int): Surface (en pixels) mise à jour à la dernière frame.
+    """
+
+    def __init__(self, screen, full_redraw_ratio=0.5):
+        self.screen = screen
+        self.full_redraw_ratio = full_redraw_ratio
+        self.full_redraws = 0
+        self.partial_redraws = 0
+        self.last_dirty_area = 0
+        self._background = None
+        self._previous = None  # key -> Drawable de la frame précédente
+
+    def invalidate(self):
+        """Force un rendu complet à la prochaine frame (l'écran a été dessiné par ailleurs)."""
+        self._previous = None
+
+    @staticmethod
+    def _merge(rects):
+        """
+        Fusionne les rectangles qui se chevauchent quand leur union ne coûte pas plus
+        cher que les deux séparément (évite de redessiner deux fois la même zone sans
+        faire grossir les zones autour d'un groupe d'ennemis).
+        """
+        merged = []
+        for rect in rects:
+            rect = rect.copy()
+            merging = True
+            while merging:
+                merging = False
+                for index in rect.collidelistall(merged):
+                    other = merged[index]
+                    union = rect.union(other)
+                    if union.width * union.height <= rect.width * rect.height + other.width * other.height:
+                        rect = union
+                        merged.pop(index)
+                        merging = True
+                        break
+            merged.append(rect)
+        return merged
+
+    def _dirty_rects(self, drawables):
+        dirty = []
+        current = {}
+        for drawable in drawables:
+            current[drawable.key] = drawable
+            previous = self._previous.get(drawable.key)
+            if previous is None:
+                dirty.append(drawable.rect)
+            elif not drawable.same_as(previous):
+                dirty.append(previous.rect)
+                dirty.append(drawable.rect)
+        for key, previous in self._previous.items():
+            if key not in current:
+                dirty.append(previous.rect)
+        screen_rect = self.screen.get_rect()
+        return self._merge([rect.clip(screen_rect) for rect in dirty if rect.colliderect(screen_rect)])
+
+    def draw(self, background, drawables):
+        """
+        Compose une frame sur l'écran (sans l'afficher).
+
+        Args:
+            background (pygame.Surface): Fond (taille de l'écran).
+            drawables (list[Drawable]): Éléments à afficher, du plus bas au plus haut.
+
+        Returns:
+            list[pygame.Rect] | None: Zones à mettre à jour à l'écran (None : tout l'écran).
+        """
+        if self._previous is None or background is not self._background:
+            return self._draw_full(background, drawables)
+
+        rects = self._dirty_rects(drawables)
+        area = sum(rect.width * rect.height for rect in rects)
+        screen_width, screen_height = self.screen.get_size()
+        if area > self.full_redraw_ratio * screen_width * screen_height:
+            return self._draw_full(background, drawables)
+
+        for rect in rects:
+            self.screen.set_clip(rect)
+            self.screen.blit(background, rect, rect)
+            for drawable in drawables:
+                if rect.colliderect(drawable.rect):
+                    self.screen.blit(drawable.image, drawable.rect)
+        self.screen.set_clip(None)
+
+        self._previous = {drawable.key: drawable for drawable in drawables}
+        self.partial_redraws += 1
+        self.last_dirty_area = area
+        return rects
+
+    def _draw_full(self, background, drawables):
+        self.screen.blit(background, (0, 0))
+        for drawable in drawables:
+            self.screen.blit(drawable.image, drawable.rect)
+        self._background = background
+        self._previous = {drawable.key: drawable for drawable in drawables}
+        self.full_redraws += 1
+        self.last_dirty_area = self.screen.get_width() * self.screen.get_height()
+        return None
@@ -0,0 +1,259 @@
+"""
+replay.py
+
+Enregistrement et relecture des commandes d'une partie.
+
+L'enregistreur capture, pas par pas, les commandes lues par le joueur
+(`InputSnapshot`) et les actions prises entre deux pas (réplique de dialogue
+suivante, réapparition après un cri), avec la graine du hasard de la partie,
+dans un petit fichier binaire. La relecture réinjecte ces commandes par le
+même chemin de code (`Player.controls`) : la simulation étant à pas fixe et
+son horloge indépendante de l'heure système, la partie se rejoue à
+l'identique, par exemple sous un profileur :
+
+    python main.py --record partie.alrp          # jouer normalement
+    python main.py --replay partie.alrp          # rejouer sans fenêtre
+
+Format (petit-boutiste) : un en-tête, puis un enregistrement de 10 octets par
+changement de commandes ou par action. Les axes de la manette sont quantifiés
+sur 8 bits avant d'être donnés au jeu, pour que la relecture voie exactement
+les mêmes valeurs.
+"""
+import struct
+from inputs import InputSnapshot
+
+MAGIC = b"ALRP"
+VERSION = 2  # 2 : graine des flux de rng.py
+HEADER = struct.Struct("<4sBBQI")  # magic, version, options, graine, nombre de pas
+RECORD = struct.Struct("<BIHbbb")  # type, pas, boutons, stick x, stick y, gâchette
+
+# Types d'enregistrement
+INPUT = 0  # nouvelles commandes du joueur
+CONFIRM = 1  # touche de dialogue (réplique suivante)
+RESPAWN = 2  # réapparition après un cri au micro
+
+DUNGEON_FLAG = 1
+BUTTONS = ("left", "right", "up", "down", "attack", "invisible", "joy_attack", "joy_invisible")
+
+
+def record_game(game, path, seed):
+    """
+    Enregistre une partie : commandes du joueur et actions entre les pas.
+
+    Args:
+        game (Game): Partie à enregistrer (avant son premier pas).
+        path (str): Fichier de sortie.
+        seed (int): Graine des flux aléatoires de la partie (`random_streams.seed`).
+
+    Returns:
+        ReplayRecorder: Enregistreur (à fermer avec `close(game.tick)`).
+    """
+    game.recorder = ReplayRecorder(path, seed, game.isDungeon)
+    game.player.controls = game.recorder.wrap(game.player.controls, game)
+    return game.recorder
+
+
+def _quantize(value):
+    return max(-127, min(127, round(value * 127)))
+
+
+def encode_snapshot(snapshot):
+    """
+    Args:
+        snapshot (InputSnapshot): Commandes à encoder.
+
+    Returns:
+        tuple[int, int, int, int]: Boutons (bits) et axes quantifiés.
+    """
+    buttons = 0
+    for bit, name in enumerate(BUTTONS):
+        if getattr(snapshot, name):
+            buttons |= 1 << bit
+    return buttons, _quantize(snapshot.joy_x), _quantize(snapshot.joy_y), _quantize(snapshot.joy_trigger)
+
+
+def decode_snapshot(buttons, joy_x, joy_y, joy_trigger):
+    """
+    Returns:
+        InputSnapshot: Commandes décodées (inverse de `encode_snapshot`).
+    """
+    snapshot = InputSnapshot(joy_x=joy_x / 127, joy_y=joy_y / 127, joy_trigger=joy_trigger / 127)
+    for bit, name in enumerate(BUTTONS):
+        setattr(snapshot, name, bool(buttons >> bit & 1))
+    return snapshot
+
+
+class ReplayRecorder:
+    """
+    Écrit le fichier de relecture d'une partie.
+
+    Attributs :
+        path (str): Fichier de sortie.
+        seed (int): Graine du hasard de la partie.
+        dungeon (bool): Partie en mode donjon.
+        records (int): Nombre d'enregistrements écrits.
+    """
+
+    def __init__(self, path, seed, dungeon=False):
+        """
+        Args:
+            path (str): Fichier de sortie (écrasé).
+            seed (int): Graine du hasard de la partie.
+            dungeon (bool): Partie en mode donjon.
+        """
+        self.path = path
+        self.seed = seed
+        self.dungeon = dungeon
+        self.records = 0
+        self._file = open(path, "wb")
+        self._write_header(0)
+
+    def _write_header(self, ticks):
+        flags = DUNGEON_FLAG if self.dungeon else 0
+        self._file.write(HEADER.pack(MAGIC, VERSION, flags, self.seed, ticks))
+
+    def write(self, kind, tick, encoded=(0, 0, 0, 0)):
+        """
+        Ajoute un enregistrement.
+
+        Args:
+            kind (int): INPUT, CONFIRM ou RESPAWN.
+            tick (int): Pas de simulation concerné.
+            encoded (tuple): Commandes encodées (INPUT uniquement).
+        """
+        self._file.write(RECORD.pack(kind, tick, *encoded))
+        self.records += 1
+
+    def wrap(self, source, game):
+        """
+        Enveloppe la source de commandes du joueur pour l'enregistrer.
+
+        Returns:
+            RecordingInput: Source à donner au joueur.
+        """
+        return RecordingInput(source, self, game)
+
+    def close(self, ticks):
+        """
+        Termine le fichier.
+
+        Args:
+            ticks (int): Nombre total de pas simulés.
+        """
+        if self._file.closed:
+            return
+        self._file.seek(0)
+        self._write_header(ticks)
+        self._file.close()
+        print(f"[Replay] {ticks} pas enregistrés dans {self.path} ({self.records} enregistrements)")
+
+
+class RecordingInput:
+    """
+    Source de commandes qui enregistre celles d'une autre source.
+    Seuls les changements sont écrits.
+    """
+
+    def __init__(self, source, recorder, game):
+        self.source = source
+        self.recorder = recorder
+        self.game = game
+        self._last = None
+
+    def read(self):
+        encoded = encode_snapshot(self.source.read())
+        if encoded != self._last:
+            self.recorder.write(INPUT, self.game.tick, encoded)
+            self._last = encoded
+        # Le jeu reçoit les valeurs quantifiées, celles que verra la relecture
+        return decode_snapshot(*encoded)
+
+
+class Replay:
+    """
+    Fichier de relecture chargé.
+
+    Attributs :
+        seed (int): Graine du hasard de la partie.
+        dungeon (bool): Partie en mode donjon.
+        ticks (int): Nombre de pas de la partie.
+        inputs (list[tuple[int, InputSnapshot]]): Changements de commandes (pas, commandes).
+        actions (list[tuple[int, int]]): Actions entre deux pas (pas, type).
+    """
+
+    def __init__(self, seed, dungeon, ticks, inputs, actions):
+        self.seed = seed
+        self.dungeon = dungeon
+        self.ticks = ticks
+        self.inputs = inputs
+        self.actions = actions
+
+    @classmethod
+    def load(cls, path):
+        """
+        Args:
+            path (str): Fichier de relecture.
+
+        Returns:
+            Replay: Partie enregistrée.
+        """
+        with open(path, "rb") as f:
+            data = f.read()
+        magic, version, flags, seed, ticks = HEADER.unpack_from(data)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"Fichier de relecture invalide : {path}")
+
+        inputs, actions = [], []
+        for kind, tick, *encoded in RECORD.iter_unpack(data[HEADER.size:]):
+            if kind == INPUT:
+                inputs.append((tick, decode_snapshot(*encoded)))
+            else:
+                actions.append((tick, kind))
+        return cls(seed, bool(flags & DUNGEON_FLAG), ticks, inputs, actions)
+
+    def player(self, game):
+        """
+        Returns:
+            ReplayPlayer: Lecteur de cette partie pour `game`.
+        """
+        return ReplayPlayer(self, game)
+
+
+class ReplayPlayer:
+    """
+    Rejoue une partie enregistrée : source de commandes du joueur et actions entre les pas.
+
+    Attributs :
+        replay (Replay): Partie enregistrée.
+        game (Game): Partie qui rejoue.
+    """
+
+    def __init__(self, replay, game):
+        self.replay = replay
+        self.game = game
+        self._input_index = 0
+        self._action_index = 0
+        self._current = InputSnapshot()
+
+    @property
+    def finished(self):
+        return self.game.tick >= self.replay.ticks
+
+    def read(self):
+        """Commandes en vigueur au pas courant."""
+        inputs = self.replay.inputs
+        while self._input_index < len(inputs) and inputs[self._input_index][0] <= self.game.tick:
+            self._current = inputs[self._input_index][1]
+            self._input_index += 1
+        return self._current
+
+    def apply_actions(self):
+        """Applique les actions enregistrées avant le prochain pas."""
+        actions = self.replay.actions
+        while self._action_index < len(actions) and actions[self._action_index][0] <= self.game.tick:
+            kind = actions[self._action_index][1]
+            if kind == CONFIRM:
+                self.game.confirm_dialogue()
+            elif kind == RESPAWN and self.game.end_screen is not None:
+                self.game.end_screen.respawn_player()
+            self._action_index += 1
@@ -0,0 +1,123 @@
+"""
+rng.py
+
+Hasard de la partie, par sous-système.
+
+Chaque sous-système tire dans son propre flux, dérivé de la graine de la
+partie et du nom du flux : "spawn" (type et position des ennemis), "loot"
+(bonus) et "audio" (variations des sons). Les flux sont indépendants : un
+son joué de plus ou de moins ne décale pas les apparitions d'ennemis, et une
+même graine redonne la même partie (`--seed`).
+
+Les tirages sont préparés par paquets : un flux génère d'un coup (numpy)
+`batch_size` valeurs uniformes, puis les distribue une par une.
+"""
+import random
+import zlib
+import numpy as np
+
+
+class RandomStream:
+    """
+    Flux de nombres aléatoires tirés par paquets.
+
+    Attributs :
+        batch_size (int): Nombre de valeurs générées à chaque paquet.
+        draws (int): Nombre de valeurs distribuées.
+    """
+
+    def __init__(self, seed_sequence, batch_size=256):
+        """
+        Args:
+            seed_sequence (np.random.SeedSequence): Graine du flux.
+            batch_size (int): Taille des paquets.
+        """
+        self._generator = np.random.default_rng(seed_sequence)
+        self.batch_size = batch_size
+        self.draws = 0
+        self._values = []
+        self._index = 0
+
+    def random(self):
+        """
+        Returns:
+            float: Valeur uniforme dans [0, 1).
+        """
+        if self._index >= len(self._values):
+            self._values = self._generator.random(self.batch_size).tolist()
+            self._index = 0
+        value = self._values[self._index]
+        self._index += 1
+        self.draws += 1
+        return value
+
+    def randint(self, a, b):
+        """
+        Returns:
+            int: Entier dans [a, b] (bornes incluses, comme `random.randint`).
+        """
+        return a + int(self.random() * (b - a + 1))
+
+    def choice(self, options):
+        """
+        Returns:
+            object: Élément choisi dans une séquence non vide.
+        """
+        return options[int(self.random() * len(options))]
+
+
+class RandomRegistry:
+    """
+    Registre des flux aléatoires d'une partie.
+
+    Attributs :
+        seed (int): Graine de la partie.
+    """
+
+    def __init__(self, seed=None):
+        self.reseed(seed)
+
+    def reseed(self, seed=None):
+        """
+        Change la graine et recrée tous les flux.
+
+        Args:
+            seed (int | None): Graine (tirée au hasard si None).
+
+        Returns:
+            int: Graine utilisée.
+        """
+        self.seed = seed if seed is not None else random.SystemRandom().getrandbits(63)
+        self._streams = {}
+        return self.seed
+
+    def stream(self, name):
+        """
+        Args:
+            name (str): Nom du flux ("spawn", "loot" ou "audio").
+
+        Returns:
+            RandomStream: Flux du sous-système (créé au premier appel).
+        """
+        stream = self._streams.get(name)
+        if stream is None:
+            # La graine du flux ne dépend que de la graine de la partie et du nom
+            stream = RandomStream(np.random.SeedSequence([self.seed, zlib.crc32(name.encode())]))
+            self._streams[name] = stream
+        return stream
+
+    @property
+    def spawn(self):
+        return self.stream("spawn")
+
+    @property
+    def loot(self):
+        return self.stream("loot")
+
+    @property
+    def audio(self):
+        return self.stream("audio")
+
+
+# Registre unique, réinitialisé avec la graine de chaque partie
+random_streams = RandomRegistry()
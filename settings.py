@@ -15,10 +15,41 @@ GAME_ZONE_BOTTOM = HEIGHT - 70
 
 # Paramètres du jeu
 FPS = 60
+# Rendu par rectangles sales : seules les zones modifiées de l'écran sont redessinées
+DIRTY_RENDERING = False
+# Overlay de performances affiché au lancement de la partie (F3 pour l'afficher ou le cacher)
+PERF_OVERLAY = False
+IDLE_FPS = 30  # écrans statiques (crédits, histoire)
+# Simulation à pas fixe : les vitesses et animations sont exprimées par pas
+TICK_RATE = 60
+MAX_STEPS_PER_FRAME = 5  # au-delà, la simulation ralentit au lieu de rattraper son retard
+RENDER_FPS = FPS  # fréquence d'affichage de la partie (0 = non limitée)
 TITLE = "The InvisiBlade Knight 2"
 SUBTITLE = """Ultimate Legendary Game
 of the Year Edition"""
 
+# Audio
+AUDIO_FREQUENCY = 44100
+AUDIO_MASTER_VOLUME = 0.1
+# Canaux du mixer par catégorie ("voice" et "ui" sont réservés, "sfx" se partage le reste)
+AUDIO_CHANNELS = {"voice": 1, "ui": 2, "sfx": 13}
+# Polyphonie des effets sonores par groupe : nom -> (voix simultanées max, priorité)
+# (le groupe d'un son isolé est le nom de son fichier, ex: "mob_death")
+SOUND_LIMITS = {
+    "player_hurts": (2, 3),
+    "sword_swings": (2, 2),
+    "powerup": (2, 2),
+    "mob_death": (4, 1),
+    "footstep_stone": (1, 0),
+    "footstep_grass": (1, 0),
+}
+SOUND_DEFAULT_LIMIT = (4, 1)
+# Nombre max de lectures d'un même son par frame (None = pas de limite)
+SOUND_MAX_PER_FRAME = 2
+
+# Dialogues : caractères révélés par pas de simulation (effet machine à écrire, 0 = désactivé)
+DIALOGUE_TYPEWRITER_SPEED = 0
+
 # Couleurs (R, G, B)
 WHITE = (255, 255, 255)
 BLACK = (0, 0, 0)
@@ -0,0 +1,164 @@
+"""
+streaming.py
+
+Chargement des ressources en arrière-plan.
+
+Les fichiers PNG et OGG sont lus et décodés sur des threads de travail ;
+le thread principal récupère ensuite des objets prêts à l'emploi
+(`pygame.Surface` convertie au format de l'écran, données de musique)
+via des handles façon "future".
+"""
+import io
+import os
+from concurrent.futures import ThreadPoolExecutor
+import pygame
+from profiling import timed
+
+
+@timed(name="streaming.decode_image")
+def _decode_image(path):
+    """Décode un PNG sur un thread de travail (surface non convertie)."""
+    with open(path, "rb") as f:
+        data = f.read()
+    return pygame.image.load(io.BytesIO(data), os.path.basename(path))
+
+
+@timed(name="streaming.read_file")
+def _read_file(path):
+    """Lit un fichier (musique OGG) en mémoire sur un thread de travail."""
+    with open(path, "rb") as f:
+        return f.read()
+
+
+@timed(name="streaming.decode_sound")
+def _decode_sound(path):
+    """Décode un effet sonore OGG en buffer PCM sur un thread de travail."""
+    return pygame.mixer.Sound(path)
+
+
+class AssetHandle:
+    """
+    Handle vers une ressource en cours de chargement.
+
+    Le décodage se fait sur un thread de travail ; la finalisation
+    (ex: `convert()` d'une surface) est faite une seule fois, sur le
+    thread principal, au premier appel de `result()`.
+
+    Attributs :
+        path (str): Chemin de la ressource.
+    """
+    def __init__(self, path, future, finalize=None):
+        self.path = path
+        self._future = future
+        self._finalize = finalize
+        self._value = None
+        self._ready = False
+
+    def done(self):
+        """Retourne True si la ressource est prête (sans bloquer)."""
+        return self._ready or self._future.done()
+
+    def result(self):
+        """
+        Retourne la ressource, en attendant la fin du décodage si besoin.
+        Doit être appelé depuis le thread principal.
+        """
+        if not self._ready:
+            value = self._future.result()
+            if self._finalize is not None:
+                value = self._finalize(value)
+            self._value = value
+            self._ready = True
+            self._future = None
+        return self._value
+
+    def cancel(self):
+        """Annule le chargement s'il n'a pas encore commencé."""
+        if self._future is not None:
+            self._future.cancel()
+
+
+class AssetService:
+    """
+    Service de chargement asynchrone des ressources.
+
+    Les handles sont indexés par chemin : demander deux fois la même
+    ressource retourne le même handle.
+
+    Attributs :
+        max_workers (int): Nombre de threads de décodage.
+    """
+    def __init__(self, max_workers=2):
+        self.max_workers = max_workers
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="assets")
+        self._handles = {}
+
+    def _request(self, key, loader, path, finalize=None):
+        handle = self._handles.get(key)
+        if handle is None:
+            handle = AssetHandle(path, self._executor.submit(loader, path), finalize)
+            self._handles[key] = handle
+        return handle
+
+    def load_image(self, path, alpha=True):
+        """
+        Demande le chargement d'une image.
+
+        Args:
+            path (str): Chemin du PNG.
+            alpha (bool): Si False, convertit sans canal alpha (fonds d'écran).
+
+        Returns:
+            AssetHandle: Handle dont `result()` est une surface convertie.
+        """
+        finalize = pygame.Surface.convert_alpha if alpha else pygame.Surface.convert
+        return self._request(("image", path), _decode_image, path, finalize)
+
+    def load_music(self, path):
+        """
+        Demande la lecture d'une musique en mémoire.
+
+        Args:
+            path (str): Chemin du fichier OGG.
+
+        Returns:
+            AssetHandle: Handle dont `result()` est le contenu binaire du fichier.
+        """
+        return self._request(("music", path), _read_file, path)
+
+    def load_sound(self, path):
+        """
+        Demande le décodage d'un effet sonore.
+
+        Args:
+            path (str): Chemin du fichier OGG.
+
+        Returns:
+            AssetHandle: Handle dont `result()` est un `pygame.mixer.Sound`.
+        """
+        return self._request(("sound", path), _decode_sound, path)
+
+    def get(self, kind, path):
+        """
+        Retourne le handle déjà demandé pour une ressource, ou None.
+
+        Args:
+            kind (str): "image", "music" ou "sound".
+            path (str): Chemin de la ressource.
+        """
+        return self._handles.get((kind, path))
+
+    def release(self, path):
+        """
+        Oublie toutes les ressources associées à un chemin.
+
+        Args:
+            path (str): Chemin de la ressource à libérer.
+        """
+        for key in [key for key in self._handles if key[1] == path]:
+            self._handles.pop(key).cancel()
+
+    def shutdown(self, wait=False):
+        """Arrête les threads de décodage."""
+        self._executor.shutdown(wait=wait, cancel_futures=True)
+        self._handles.clear()
@@ -0,0 +1,244 @@
+"""
+timing.py
+
+Cadencement des boucles de jeu.
+
+`frame_scheduler` est partagé par toutes les scènes (menu, crédits, histoire,
+partie) : à la fin de chaque frame, `tick()` attend l'échéance de la frame
+suivante pour tenir la fréquence visée, sans dérive (les échéances sont
+calculées à partir de la précédente, pas de l'instant courant).
+
+En mode adaptatif, l'attente se fait en deux temps : un `time.sleep` qui
+s'arrête un peu avant l'échéance (la marge suit le retard moyen observé
+du sleep), puis de courtes cessions du processeur jusqu'à l'échéance exacte.
+
+`FixedTimestep` découple la simulation de l'affichage : le temps écoulé entre
+deux frames est accumulé et consommé par pas fixes de 1 / TICK_RATE, et la
+fraction de pas restante sert à interpoler les positions à l'affichage.
+
+`game_clock` est l'horloge de jeu lue par tous les systèmes (minuteries du
+joueur, des ennemis, des bonus, de l'écran de fin, apparition des ennemis) :
+elle avance d'un pas fixe à chaque pas de simulation, au lieu que chaque entité
+lise l'heure système. Elle peut être mise en pause (cinématiques) et la partie
+peut être accélérée ou ralentie via son facteur `scale`.
+"""
+import time
+from collections import deque
+from settings import FPS, TICK_RATE, MAX_STEPS_PER_FRAME
+
+
+class FrameScheduler:
+    """
+    Cadence une boucle à une fréquence cible et mesure la durée des frames.
+
+    Attributs :
+        target_fps (float): Fréquence visée par défaut (0 = pas de limite).
+        adaptive (bool): Attente adaptative (sleep puis yield) au lieu d'un simple sleep.
+        frame_times (deque[float]): Durées des dernières frames (s), attente comprise.
+        work_times (deque[float]): Durées de travail des dernières frames (s), hors attente.
+        frame_count (int): Nombre de frames depuis la création.
+    """
+
+    def __init__(self, target_fps=FPS, adaptive=True, history=240):
+        """
+        Args:
+            target_fps (float): Fréquence visée par défaut (0 = pas de limite).
+            adaptive (bool): Active l'attente adaptative.
+            history (int): Nombre de frames gardées pour les statistiques.
+        """
+        self.target_fps = target_fps
+        self.adaptive = adaptive
+        self.frame_times = deque(maxlen=history)
+        self.work_times = deque(maxlen=history)
+        self.frame_count = 0
+        self._last = None  # fin de la frame précédente
+        self._deadline = None  # échéance de la frame en cours
+        self._sleep_margin = 0.001  # avance prise sur l'échéance pour absorber le retard du sleep
+
+    def reset(self):
+        """Repart d'une frame neuve (début de scène) sans fausser les statistiques."""
+        self._last = None
+        self._deadline = None
+
+    def tick(self, fps=None):
+        """
+        Termine la frame : attend l'échéance de la suivante.
+
+        Args:
+            fps (float | None): Fréquence visée pour cette frame (par défaut `target_fps`).
+
+        Returns:
+            float: Durée de la frame écoulée en secondes (0 pour la première).
+        """
+        fps = self.target_fps if fps is None else fps
+        now = time.perf_counter()
+        if self._last is None:
+            self._last = self._deadline = now
+            return 0.0
+
+        self.work_times.append(now - self._last)
+        if fps:
+            period = 1.0 / fps
+            self._deadline += period
+            if now - self._deadline > period:
+                # Trop en retard (chargement, fenêtre déplacée...) : on se recale au lieu de rattraper
+                self._deadline = now
+            else:
+                self._wait(self._deadline)
+        else:
+            self._deadline = now
+
+        end = time.perf_counter()
+        dt = end - self._last
+        self._last = end
+        self.frame_times.append(dt)
+        self.frame_count += 1
+        return dt
+
+    def _wait(self, deadline):
+        remaining = deadline - time.perf_counter()
+        if not self.adaptive:
+            if remaining > 0:
+                time.sleep(remaining)
+            return
+
+        if remaining > self._sleep_margin:
+            requested = remaining - self._sleep_margin
+            start = time.perf_counter()
+            time.sleep(requested)
+            overshoot = time.perf_counter() - start - requested
+            # La marge suit le retard moyen du sleep (granularité de l'OS)
+            self._sleep_margin = max(0.0005, 0.9 * self._sleep_margin + 0.1 * 2 * max(overshoot, 0.0))
+        while time.perf_counter() < deadline:
+            time.sleep(0)  # cède le processeur jusqu'à l'échéance exacte
+
+    def stats(self):
+        """
+        Statistiques des dernières frames.
+
+        Returns:
+            dict: fps moyen, durée moyenne / 95e centile / max des frames (ms)
+            et charge (part du temps passée à travailler plutôt qu'à attendre).
+        """
+        if not self.frame_times:
+            return {"fps": 0.0, "avg_ms": 0.0, "p95_ms": 0.0, "max_ms": 0.0, "load": 0.0}
+        frames = sorted(self.frame_times)
+        total = sum(frames)
+        return {
+            "fps": len(frames) / total if total else 0.0,
+            "avg_ms": total / len(frames) * 1000,
+            "p95_ms": frames[int(0.95 * (len(frames) - 1))] * 1000,
+            "max_ms": frames[-1] * 1000,
+            "load": sum(self.work_times) / total if total else 0.0,
+        }
+
+
+class FixedTimestep:
+    """
+    Accumulateur de temps pour une simulation à pas fixe.
+
+    Attributs :
+        step (float): Durée d'un pas de simulation (s).
+        max_steps (int): Nombre maximal de pas exécutés pour une frame.
+        accumulator (float): Temps écoulé pas encore simulé (s).
+        alpha (float): Fraction de pas restante (0 à 1), pour l'interpolation.
+        steps (int): Nombre total de pas simulés.
+    """
+    SNAP = 0.002  # écart (s) en dessous duquel une frame compte pour exactement un pas
+
+    def __init__(self, rate=TICK_RATE, max_steps=MAX_STEPS_PER_FRAME):
+        """
+        Args:
+            rate (float): Pas de simulation par seconde.
+            max_steps (int): Nombre maximal de pas par frame.
+        """
+        self.step = 1.0 / rate
+        self.max_steps = max_steps
+        self.accumulator = 0.0
+        self.alpha = 0.0
+        self.steps = 0
+
+    def reset(self):
+        """Oublie le temps accumulé."""
+        self.accumulator = 0.0
+        self.alpha = 0.0
+
+    def advance(self, dt):
+        """
+        Ajoute le temps d'une frame et retourne le nombre de pas à simuler.
+
+        Args:
+            dt (float): Durée de la frame (s).
+
+        Returns:
+            int: Nombre de pas de simulation à exécuter avant l'affichage.
+        """
+        # Quand l'affichage tourne à la fréquence de la simulation, la gigue du
+        # cadencement ferait alterner 0 et 2 pas : une frame proche d'un pas en vaut un
+        if abs(dt - self.step) < self.SNAP:
+            dt = self.step
+        self.accumulator = min(self.accumulator + dt, self.max_steps * self.step)
+        steps = int(self.accumulator / self.step)
+        self.accumulator -= steps * self.step
+        self.alpha = self.accumulator / self.step
+        self.steps += steps
+        return steps
+
+
+class GameClock:
+    """
+    Horloge de jeu monotone, avancée une fois par pas de simulation.
+
+    Le temps ne dépend que du nombre de pas simulés (hors pause) : deux parties
+    qui simulent les mêmes pas voient exactement les mêmes instants.
+
+    Attributs :
+        step (float): Durée d'un pas (s).
+        time (float): Temps de jeu écoulé (s), figé pendant les pauses.
+        ticks (int): Nombre de pas simulés hors pause.
+        paused (bool): True si le temps de jeu est figé.
+        scale (float): Vitesse de la simulation (1 = normale, 0.5 = ralenti...).
+    """
+
+    def __init__(self, rate=TICK_RATE):
+        """
+        Args:
+            rate (float): Pas de simulation par seconde.
+        """
+        self.step = 1.0 / rate
+        self.scale = 1.0
+        self.reset()
+
+    def reset(self):
+        """Remet le temps de jeu à zéro (nouvelle partie)."""
+        self.time = 0.0
+        self.ticks = 0
+        self.paused = False
+
+    def pause(self):
+        """Fige le temps de jeu (les minuteries ne s'écoulent plus)."""
+        self.paused = True
+
+    def resume(self):
+        """Relance le temps de jeu."""
+        self.paused = False
+
+    def advance(self):
+        """
+        Avance d'un pas (sauf en pause).
+
+        Returns:
+            float: Temps de jeu écoulé pendant ce pas (s).
+        """
+        if self.paused:
+            return 0.0
+        self.ticks += 1
+        self.time = self.ticks * self.step  # pas de dérive par accumulation d'arrondis
+        return self.step
+
+
+# Cadenceur unique partagé par toutes les scènes
+frame_scheduler = FrameScheduler()
+
+# Horloge de jeu unique lue par tous les systèmes
+game_clock = GameClock()
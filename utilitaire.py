@@ -1,8 +1,12 @@
-import random
 import pygame
-import os, sys
-
-pygame.mixer.init()
+import io, os, sys
+from collections import OrderedDict
+from settings import (
+    FPS, AUDIO_FREQUENCY, AUDIO_CHANNELS, AUDIO_MASTER_VOLUME,
+    SOUND_LIMITS, SOUND_DEFAULT_LIMIT, SOUND_MAX_PER_FRAME,
+)
+from rng import random_streams
+from profiling import timed, scope, count
 
 def chemin_relatif(fichier: str) -> str:
     """
@@ -15,6 +19,7 @@ def chemin_relatif(fichier: str) -> str:
         base_path = os.path.abspath(".")
     return os.path.join(base_path, fichier)
 
+@timed
 def load_sprites(path="", num_frames=1, nopath=False, imagestring=None):
     """
     Charge un spritesheet horizontal et le découpe en plusieurs frames.
@@ -47,9 +52,11 @@ def load_sprites(path="", num_frames=1, nopath=False, imagestring=None):
         rect = frame.get_bounding_rect()
         cropped = frame.subsurface(rect).copy()
         sprites.append(cropped)
+    count("sprites.frames_loaded", num_frames)
     return sprites
 
 
+@timed
 def load_sprites_from_folder(folder):
     """
     Charge une animation depuis un dossier contenant plusieurs fichiers PNG.
@@ -68,6 +75,7 @@ def load_sprites_from_folder(folder):
     return sprites
 
 
+@timed
 def animate(entity, sprites, loop=True, assign_to_image=True, animation_speed=None):
     """
     Anime une entité (doit avoir `current_frame`, `frame_timer` et `image`).
@@ -141,6 +149,244 @@ def scale_sprites(sprites, scale_factor):
     """
     return [pygame.transform.scale(sprite, (int(sprite.get_width() * scale_factor), int(sprite.get_height() * scale_factor))) for sprite in sprites]
 
+def flip_sprites(sprites):
+    """
+    Retourne horizontalement une liste de sprites (orientation droite -> gauche).
+
+    Args:
+        sprites (list[pygame.Surface]): Liste des images.
+
+    Returns:
+        list[pygame.Surface]: Liste des sprites retournés.
+    """
+    return [pygame.transform.flip(sprite, True, False) for sprite in sprites]
+
+
+class SpriteCache:
+    """
+    Cache de frames partagé par tout le processus.
+
+    Chaque spritesheet est chargé, recadré et redimensionné une seule fois,
+    puis stocké sous forme de tuple (immuable) : toutes les instances qui
+    demandent la même clé partagent exactement les mêmes surfaces.
+
+    Les clés sont de la forme (chemin, nb_frames, facteur_echelle, taille).
+
+    Si un atlas précalculé est attaché (voir atlas.py), les frames absentes
+    du cache y sont cherchées avant de refaire le découpage et la mise à l'échelle.
+
+    Attributes:
+        hits (int): Nombre de requêtes servies depuis le cache.
+        misses (int): Nombre de requêtes absentes du cache.
+        atlas_hits (int): Nombre de requêtes absentes servies par l'atlas disque.
+        atlas (SpriteAtlas | None): Atlas précalculé attaché au cache.
+        packed (int): Nombre de frames regroupées au dernier `repack`.
+    """
+    def __init__(self):
+        self._frames = {}
+        self._mirrored = {}
+        self.hits = 0
+        self.misses = 0
+        self.atlas_hits = 0
+        self.atlas = None
+        self.packed = 0
+
+    def attach_atlas(self, atlas):
+        """
+        Attache un atlas précalculé consulté avant tout chargement.
+
+        Args:
+            atlas (SpriteAtlas | None): Atlas à utiliser (None pour le détacher).
+        """
+        self.atlas = atlas
+
+    def _lookup(self, key):
+        """Cherche une clé dans le cache puis dans l'atlas (None si absente)."""
+        value = self._frames.get(key)
+        if value is not None:
+            self.hits += 1
+            return value
+
+        self.misses += 1
+        if self.atlas is not None:
+            value = self.atlas.load(key)
+            if value is not None:
+                self.atlas_hits += 1
+                self._frames[key] = value
+        return value
+
+    def repack(self, pack):
+        """
+        Remplace toutes les frames d'animation par une version réorganisée.
+
+        Args:
+            pack (callable): Reçoit la liste de toutes les frames et retourne
+                les frames de remplacement dans le même ordre (voir atlas.TexturePacker).
+        """
+        entries = [
+            (store, key, frames)
+            for store in (self._frames, self._mirrored)
+            for key, frames in store.items()
+            if isinstance(frames, tuple)
+        ]
+        all_frames = [frame for _, _, frames in entries for frame in frames]
+        packed = iter(pack(all_frames))
+        for store, key, frames in entries:
+            store[key] = tuple(next(packed) for _ in frames)
+        self.packed = len(all_frames)
+
+    def items(self):
+        """Retourne les couples (clé, frames) actuellement en cache."""
+        return list(self._frames.items())
+
+    @staticmethod
+    def make_key(path, num_frames=1, scale_factor=1, size=None):
+        """Construit la clé de cache d'un spritesheet."""
+        return (path, num_frames, scale_factor, size)
+
+    def get(self, path, num_frames=1, scale_factor=1, size=None):
+        """
+        Retourne les frames d'un spritesheet, en le chargeant si besoin.
+
+        Args:
+            path (str): Chemin vers l'image.
+            num_frames (int): Nombre de frames du spritesheet.
+            scale_factor (float): Facteur d'échelle appliqué aux frames.
+            size (tuple[int, int] | None): Taille fixe des frames (prioritaire sur l'échelle).
+
+        Returns:
+            tuple[pygame.Surface]: Frames partagées (ne pas les modifier).
+        """
+        key = self.make_key(path, num_frames, scale_factor, size)
+        frames = self._lookup(key)
+        if frames is not None:
+            return frames
+
+        sprites = load_sprites(path, num_frames)
+        if size is not None:
+            sprites = [pygame.transform.scale(sprite, size) for sprite in sprites]
+        elif scale_factor != 1:
+            sprites = scale_sprites(sprites, scale_factor)
+        frames = tuple(sprites)
+        self._frames[key] = frames
+        return frames
+
+    def get_mirrored(self, path, num_frames=1, scale_factor=1, size=None):
+        """
+        Retourne les frames d'un spritesheet retournées horizontalement.
+
+        Les variantes "gauche" des animations sont dérivées des frames "droite"
+        par un unique flip mis en cache, au lieu de charger un second spritesheet.
+
+        Args:
+            path (str): Chemin vers l'image orientée vers la droite.
+            num_frames (int): Nombre de frames du spritesheet.
+            scale_factor (float): Facteur d'échelle appliqué aux frames.
+            size (tuple[int, int] | None): Taille fixe des frames.
+
+        Returns:
+            tuple[pygame.Surface]: Frames miroir partagées (ne pas les modifier).
+        """
+        key = self.make_key(path, num_frames, scale_factor, size)
+        frames = self._mirrored.get(key)
+        if frames is not None:
+            self.hits += 1
+            return frames
+
+        # Absente : comptée comme un échec, même si les frames "droite" sont déjà en cache
+        self.misses += 1
+        source = self._frames.get(key)
+        if source is None:
+            source = self.get(path, num_frames, scale_factor, size)
+        frames = tuple(flip_sprites(source))
+        count("sprites.frames_loaded", len(frames))
+        self._mirrored[key] = frames
+        return frames
+
+    def get_image(self, path, size=None, alpha=True):
+        """
+        Retourne une image simple (non découpée ni recadrée) depuis le cache.
+
+        Args:
+            path (str): Chemin vers l'image.
+            size (tuple[int, int] | None): Taille de redimensionnement éventuelle.
+            alpha (bool): Si False, l'image est convertie sans canal alpha (fonds d'écran).
+
+        Returns:
+            pygame.Surface: Image partagée (ne pas la modifier).
+        """
+        key = (path, None, size, alpha)
+        image = self._lookup(key)
+        if image is not None:
+            return image
+
+        image = pygame.image.load(path)
+        image = image.convert_alpha() if alpha else image.convert()
+        if size is not None:
+            image = pygame.transform.scale(image, size)
+        self._frames[key] = image
+        return image
+
+    def get_folder(self, folder, scale_factor=1):
+        """
+        Retourne une animation chargée depuis un dossier de PNG.
+
+        Args:
+            folder (str): Chemin vers le dossier contenant les images.
+            scale_factor (float): Facteur d'échelle appliqué aux frames.
+
+        Returns:
+            tuple[pygame.Surface]: Frames partagées (ne pas les modifier).
+        """
+        key = (folder, "folder", scale_factor, None)
+        frames = self._lookup(key)
+        if frames is not None:
+            return frames
+
+        sprites = load_sprites_from_folder(folder)
+        if scale_factor != 1:
+            sprites = scale_sprites(sprites, scale_factor)
+        frames = tuple(sprites)
+        self._frames[key] = frames
+        return frames
+
+    def warm(self, entries):
+        """
+        Précharge une liste de spritesheets.
+
+        Args:
+            entries (iterable[tuple]): Arguments de `get` (chemin, nb_frames, échelle, taille).
+        """
+        for entry in entries:
+            self.get(*entry)
+
+    def evict(self, path=None):
+        """
+        Retire des entrées du cache.
+
+        Args:
+            path (str | None): Si fourni, retire uniquement les entrées de ce fichier,
+                sinon vide tout le cache.
+        """
+        if path is None:
+            self._frames.clear()
+            self._mirrored.clear()
+            return
+        for key in [key for key in self._frames if key[0] == path]:
+            del self._frames[key]
+        for key in [key for key in self._mirrored if key[0] == path]:
+            del self._mirrored[key]
+
+    def __contains__(self, key):
+        return key in self._frames
+
+    def __len__(self):
+        return len(self._frames) + len(self._mirrored)
+
+
+# Cache unique partagé par toutes les entités du jeu
+sprite_cache = SpriteCache()
+
 
 class AnimatedEntity:
     """
@@ -174,64 +420,572 @@ class AnimatedEntity:
         """Affiche l'entité sur l'écran."""
         screen.blit(self.image, self.pos)
 
+class SoundBank:
+    """
+    Banque de sons partagée par tous les `SoundEffects`, indexée par chemin.
+
+    Chaque fichier n'est décodé qu'une seule fois ; les sons les moins
+    récemment joués sont évincés (LRU) quand le budget mémoire est dépassé.
+
+    Attributes:
+        budget (int): Mémoire maximale occupée par les sons décodés (en octets).
+        memory (int): Mémoire actuellement occupée (estimation, en octets).
+        hits (int): Nombre de requêtes servies depuis la banque.
+        misses (int): Nombre de requêtes ayant nécessité un décodage.
+    """
+    def __init__(self, budget=32 * 1024 * 1024):
+        self.budget = budget
+        self.memory = 0
+        self.hits = 0
+        self.misses = 0
+        self._sounds = OrderedDict()  # chemin -> (son, taille)
+        self._missing = set()  # chemins inexistants, pour ne pas retester le disque
+
+    @staticmethod
+    def _sound_size(sound):
+        """Estime la taille mémoire d'un son décodé (sans copier ses données)."""
+        init = pygame.mixer.get_init()
+        if not init:
+            return 0
+        frequency, sample_format, channels = init
+        return int(sound.get_length() * frequency * channels * abs(sample_format) // 8)
+
+    def get(self, path):
+        """
+        Retourne le son associé à un chemin, en le décodant si besoin.
+
+        Args:
+            path (str): Chemin du fichier audio.
+
+        Returns:
+            pygame.mixer.Sound | None: Son partagé (None si le fichier n'existe pas).
+        """
+        entry = self._sounds.get(path)
+        if entry is not None:
+            self.hits += 1
+            self._sounds.move_to_end(path)
+            return entry[0]
+        if path in self._missing:
+            return None
+
+        self.misses += 1
+        if not os.path.exists(path):
+            self._missing.add(path)
+            return None
+        if not audio_engine.init():
+            return None
+        with scope("SoundBank.decode"):
+            sound = pygame.mixer.Sound(path)
+        size = self._sound_size(sound)
+        self._sounds[path] = (sound, size)
+        self.memory += size
+        self._evict_over_budget()
+        return sound
+
+    def preload(self, paths):
+        """Décode à l'avance une liste de sons."""
+        for path in paths:
+            self.get(path)
+
+    def _evict_over_budget(self):
+        # Le son le plus récent n'est jamais évincé
+        while self.memory > self.budget and len(self._sounds) > 1:
+            _, (_, size) = self._sounds.popitem(last=False)
+            self.memory -= size
+
+    def evict(self, path=None):
+        """
+        Retire des sons de la banque.
+
+        Args:
+            path (str | None): Son à retirer (tous si None).
+        """
+        if path is None:
+            self._sounds.clear()
+            self.memory = 0
+        elif path in self._sounds:
+            self.memory -= self._sounds.pop(path)[1]
+
+    def __contains__(self, path):
+        return path in self._sounds
+
+    def __len__(self):
+        return len(self._sounds)
+
+
+# Banque unique partagée par tous les gestionnaires de sons
+sound_bank = SoundBank()
+
+
+class ChannelPool:
+    """
+    Pool de canaux pour les effets sonores, avec limitation de voix.
+
+    Chaque son joué appartient à un groupe (ex: "sword_swings", "mob_death")
+    qui a un nombre maximal de voix simultanées et une priorité :
+        - si le groupe a atteint sa limite, sa voix la plus ancienne est remplacée ;
+        - si aucun canal n'est libre, la voix de plus faible priorité (puis la plus
+          ancienne) est volée, à condition que sa priorité ne dépasse pas celle du
+          nouveau son ; sinon le nouveau son est abandonné ;
+        - un même son ne peut être lancé que `max_per_frame` fois par frame.
+
+    Attributes:
+        channels (list[pygame.mixer.Channel]): Canaux gérés par le pool.
+        limits (dict[str, tuple[int, int]]): (voix max, priorité) par groupe.
+        default_limit (tuple[int, int]): Limite des groupes absents de `limits`.
+        max_per_frame (int | None): Lectures max d'un même son par frame.
+        played (int): Nombre de sons lancés.
+        stolen (int): Nombre de voix coupées pour en jouer une autre.
+        dropped (int): Nombre de sons abandonnés.
+    """
+    FRAME_MS = 1000 / FPS
+
+    def __init__(self, channels, limits=SOUND_LIMITS, default_limit=SOUND_DEFAULT_LIMIT,
+                 max_per_frame=SOUND_MAX_PER_FRAME):
+        self.channels = channels
+        self.limits = limits
+        self.default_limit = default_limit
+        self.max_per_frame = max_per_frame
+        self.played = 0
+        self.stolen = 0
+        self.dropped = 0
+        self._voices = [None] * len(channels)  # (groupe, priorité, instant) par canal
+        self._recent = {}  # son -> (début de la frame, nombre de lectures)
+
+    def _active(self, index):
+        return self._voices[index] is not None and self.channels[index].get_busy()
+
+    def _pick_channel(self, group, priority):
+        """Retourne l'indice du canal à utiliser, ou None si le son doit être abandonné."""
+        max_voices, _ = self.limits.get(group, self.default_limit)
+        active = [i for i in range(len(self.channels)) if self._active(i)]
+
+        same_group = [i for i in active if self._voices[i][0] == group]
+        if len(same_group) >= max_voices:
+            return min(same_group, key=lambda i: self._voices[i][2])
+
+        if len(active) < len(self.channels):
+            return next(i for i in range(len(self.channels)) if not self._active(i))
+
+        candidates = [i for i in active if self._voices[i][1] <= priority]
+        if not candidates:
+            return None
+        return min(candidates, key=lambda i: (self._voices[i][1], self._voices[i][2]))
+
+    def play(self, sound, group, volume=1.0):
+        """
+        Joue un son sur un canal du pool.
+
+        Args:
+            sound (pygame.mixer.Sound): Son à jouer.
+            group (str): Groupe de polyphonie du son.
+            volume (float): Volume effectif du canal.
+
+        Returns:
+            pygame.mixer.Channel | None: Canal utilisé, None si le son est abandonné.
+        """
+        now = pygame.time.get_ticks()
+        if self.max_per_frame is not None:
+            frame_start, count = self._recent.get(sound, (now, 0))
+            if now - frame_start >= self.FRAME_MS:
+                frame_start, count = now, 0
+            if count >= self.max_per_frame:
+                self.dropped += 1
+                return None
+
+        _, priority = self.limits.get(group, self.default_limit)
+        index = self._pick_channel(group, priority)
+        if index is None:
+            self.dropped += 1
+            return None
+        if self._active(index):
+            self.stolen += 1
+
+        channel = self.channels[index]
+        channel.play(sound)
+        channel.set_volume(volume)
+        self._voices[index] = (group, priority, now)
+        self.played += 1
+        if self.max_per_frame is not None:
+            self._recent[sound] = (frame_start, count + 1)
+        return channel
+
+
+class AudioEngine:
+    """
+    Moteur audio unique du processus.
+
+    Il possède seul le mixer pygame : il l'initialise (`init`), le ferme
+    (`quit`), réserve des canaux par catégorie et applique le volume global.
+    Les catégories sont "music", "sfx", "ui" et "voice" : la musique passe par
+    `pygame.mixer.music`, les catégories de `AUDIO_CHANNELS` ont leurs propres
+    canaux réservés, et les effets ("sfx") se partagent les canaux restants
+    via un `ChannelPool` (limitation de voix par groupe).
+
+    Attributes:
+        master_volume (float): Volume global (0.0 à 1.0).
+        category_volumes (dict[str, float]): Volume relatif de chaque catégorie.
+        available (bool): False si aucun périphérique audio n'a pu être ouvert.
+        pool (ChannelPool | None): Canaux des effets sonores (après `init`).
+    """
+    CATEGORIES = ("music", "sfx", "ui", "voice")
+
+    def __init__(self, master_volume=AUDIO_MASTER_VOLUME):
+        self.master_volume = master_volume
+        self.category_volumes = {category: 1.0 for category in self.CATEGORIES}
+        self.available = True
+        self.pool = None
+        self._initialized = False
+        self._channels = {}  # catégorie -> canaux réservés
+        self._music_volume = 0.0  # volume relatif de la musique en cours
+
+    @property
+    def initialized(self):
+        return self._initialized
+
+    def init(self, frequency=AUDIO_FREQUENCY):
+        """
+        Ouvre le mixer (si besoin) et réserve les canaux de chaque catégorie.
+        Sans effet si le moteur est déjà initialisé.
+
+        Args:
+            frequency (int): Fréquence d'échantillonnage.
+
+        Returns:
+            bool: True si l'audio est disponible.
+        """
+        if self._initialized:
+            return self.available
+        self._initialized = True
+        try:
+            if not pygame.mixer.get_init():
+                pygame.mixer.init(frequency=frequency)
+        except pygame.error as e:
+            print(f"[Audio] Mixer indisponible, le jeu continue sans son : {e}")
+            self.available = False
+            return False
+
+        # Les premiers canaux sont réservés : pygame ne les donne jamais à Sound.play()
+        reserved = sum(AUDIO_CHANNELS[category] for category in ("voice", "ui"))
+        total = reserved + AUDIO_CHANNELS["sfx"]
+        pygame.mixer.set_num_channels(total)
+        pygame.mixer.set_reserved(reserved)
+        index = 0
+        for category in ("voice", "ui"):
+            count = AUDIO_CHANNELS[category]
+            self._channels[category] = [pygame.mixer.Channel(i) for i in range(index, index + count)]
+            index += count
+        self.pool = ChannelPool([pygame.mixer.Channel(i) for i in range(reserved, total)])
+        return True
+
+    def quit(self):
+        """Arrête tous les sons et ferme le mixer."""
+        if self._initialized and self.available:
+            pygame.mixer.music.stop()
+            pygame.mixer.stop()
+            pygame.mixer.quit()
+        self._channels.clear()
+        self.pool = None
+        self._initialized = False
+        self.available = True
+
+    def volume(self, category):
+        """Volume effectif d'une catégorie (master x catégorie)."""
+        return self.master_volume * self.category_volumes[category]
+
+    def set_master_volume(self, volume):
+        """Change le volume global (0.0 - 1.0) ; la musique en cours suit."""
+        self.master_volume = max(0.0, min(1.0, volume))  # clamp entre 0 et 1
+        self._apply_music_volume()
+
+    def set_category_volume(self, category, volume):
+        """Change le volume relatif d'une catégorie (0.0 - 1.0)."""
+        self.category_volumes[category] = max(0.0, min(1.0, volume))
+        if category == "music":
+            self._apply_music_volume()
+
+    def _apply_music_volume(self):
+        if self._initialized and self.available:
+            pygame.mixer.music.set_volume(self._music_volume * self.volume("music"))
+
+    def play(self, sound, volume=1.0, category="sfx", group=None):
+        """
+        Joue un son sur un canal de sa catégorie.
+
+        Args:
+            sound (pygame.mixer.Sound): Son à jouer (partagé, son volume propre n'est pas modifié).
+            volume (float): Volume relatif à la catégorie.
+            category (str): "sfx", "ui" ou "voice".
+            group (str | None): Groupe de polyphonie (effets sonores uniquement).
+
+        Returns:
+            pygame.mixer.Channel | None: Canal utilisé (None si le son est abandonné).
+        """
+        if not self.init():
+            return None
+        if category == "sfx":
+            return self.pool.play(sound, group, volume * self.volume(category))
+
+        channels = self._channels[category]
+        # Canal libre de la catégorie, sinon on coupe le premier
+        channel = next((channel for channel in channels if not channel.get_busy()), channels[0])
+        channel.play(sound)
+        channel.set_volume(volume * self.volume(category))
+        return channel
+
+    def play_music(self, music_file, volume=0.2, data=None):
+        """
+        Lance une musique en boucle.
+
+        Args:
+            music_file (str): Chemin du fichier.
+            volume (float): Volume relatif à la catégorie "music".
+            data (bytes | None): Contenu du fichier déjà lu en mémoire (chargement en arrière-plan).
+        """
+        if not self.init():
+            return
+        if data is not None:
+            pygame.mixer.music.load(io.BytesIO(data), os.path.basename(music_file))
+        elif os.path.exists(music_file):
+            pygame.mixer.music.load(music_file)
+        else:
+            return
+        self._music_volume = volume
+        self._apply_music_volume()
+        pygame.mixer.music.play(-1)  # -1 = boucle
+
+    def stop_music(self):
+        if self._initialized and self.available:
+            pygame.mixer.music.stop()
+
+    def is_music_playing(self):
+        return self._initialized and self.available and pygame.mixer.music.get_busy()
+
+
+# Moteur unique : initialisé par main.py, ou au premier son joué
+audio_engine = AudioEngine()
+
+
 class SoundEffects:
-    def __init__(self):
+    """
+    Façade légère vers `audio_engine` : la créer ne touche pas au mixer.
+
+    Chaque propriétaire (joueur, partie, menu...) garde ses propres groupes
+    de sons et cooldowns, mais les sons, les canaux et le volume sont partagés.
+
+    Attributes:
+        category (str): Catégorie par défaut des sons joués ("sfx", "ui" ou "voice").
+        sound_groups (dict[str, list]): Sons de chaque groupe.
+        last_played (dict[str, float]): Instant de la dernière lecture de chaque groupe.
+    """
+    def __init__(self, category="sfx"):
+        self.category = category
         self.sound_groups = {}
         self.last_played = {}
-        self.master_volume = 0.1  # Volume global (0.0 à 1.0)
-        pygame.mixer.init(frequency=44100)
+
+    @property
+    def master_volume(self):
+        return audio_engine.master_volume
 
     def set_master_volume(self, volume: float):
         """Change le volume global (0.0 - 1.0)."""
-        self.master_volume = max(0.0, min(1.0, volume))  # clamp entre 0 et 1
-        pygame.mixer.music.set_volume(self.master_volume)
-        for group in self.sound_groups.values():
-            for sound in group:
-                sound.set_volume(self.master_volume)
+        audio_engine.set_master_volume(volume)
 
     def load_sound_group(self, group_name, sound_files):
         sounds = []
         for sound_file in sound_files:
-            if os.path.exists(sound_file):
-                sound = pygame.mixer.Sound(sound_file)
-                sound.set_volume(self.master_volume)  # applique le volume global
+            sound = sound_bank.get(sound_file)
+            if sound is not None:
                 sounds.append(sound)
         self.sound_groups[group_name] = sounds
 
-    def play_sound_group(self, group_name, volume=1.0, cooldown=0.5):
+    def _play(self, sound, volume, group, category=None):
+        """Joue un son partagé : le volume est appliqué au canal, pas au son."""
+        return audio_engine.play(sound, volume, category or self.category, group)
+
+    def play_sound_group(self, group_name, volume=1.0, cooldown=0.5, category=None):
         """volume est relatif au master (ex: 0.5 -> 50% du master)"""
         current_time = pygame.time.get_ticks() / 1000.0
         if group_name in self.last_played and (current_time - self.last_played[group_name]) < cooldown:
             return False
-        if group_name not in self.sound_groups:
+        if group_name not in self.sound_groups or not self.sound_groups[group_name]:
             return False
 
-        sound = random.choice(self.sound_groups[group_name])
-        sound.set_volume(volume * self.master_volume)
-        sound.play()
+        # Flux à part : les sons (joués selon l'heure réelle) ne décalent pas le hasard de la partie
+        sound = random_streams.audio.choice(self.sound_groups[group_name])
+        self._play(sound, volume, group_name, category)
         self.last_played[group_name] = current_time
 
-    def play_sound_one(self, sound_file, volume=1.0):
-        if os.path.exists(sound_file):
-            sound = pygame.mixer.Sound(sound_file)
-            sound.set_volume(volume * self.master_volume)
-            sound.play()
+    def play_sound_one(self, sound_file, volume=1.0, category=None, group=None):
+        """group : groupe de polyphonie (par défaut le nom du fichier, ex: "mob_death")"""
+        sound = sound_bank.get(sound_file)
+        if sound is not None:
+            group = group or os.path.splitext(os.path.basename(sound_file))[0]
+            self._play(sound, volume, group, category)
 
-    def play_music(self, music_file, volume=0.2):
-        if os.path.exists(music_file):
-            pygame.mixer.music.load(music_file)
-            pygame.mixer.music.set_volume(volume * self.master_volume)
-            pygame.mixer.music.play(-1)  # -1 = boucle
+    def play_music(self, music_file, volume=0.2, data=None):
+        """data : contenu du fichier déjà lu en mémoire (chargement en arrière-plan)."""
+        audio_engine.play_music(music_file, volume, data)
 
     def stop_music(self):
-        pygame.mixer.music.stop()
+        audio_engine.stop_music()
 
     def is_playing(self):
-        return pygame.mixer.music.get_busy()
+        return audio_engine.is_music_playing()
 
 
-def render_multiline(text, font, color, max_width):
-    """Découpe et rend un texte multi-lignes selon une largeur max."""
+class TextCache:
+    """
+    Cache LRU des textes rendus, partagé par tout le jeu.
+
+    Les surfaces sont indexées par (police, texte, couleur, largeur de
+    retour à la ligne) : un texte qui ne change pas n'est rasterisé qu'une
+    fois, et les plus anciens sont évincés au-delà de `max_entries`.
+
+    Attributes:
+        max_entries (int): Nombre maximal d'entrées gardées.
+        hits (int): Nombre de rendus servis depuis le cache.
+        misses (int): Nombre de rendus ayant nécessité la police.
+    """
+    def __init__(self, max_entries=256):
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+
+    def _lookup(self, key):
+        entry = self._entries.get(key)
+        if entry is not None:
+            self.hits += 1
+            self._entries.move_to_end(key)
+        return entry
+
+    def _store(self, key, value):
+        self.misses += 1
+        self._entries[key] = value
+        if len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return value
+
+    def render(self, font, text, color, antialias=True):
+        """
+        Rend une ligne de texte (comme `font.render`), depuis le cache si possible.
+
+        Args:
+            font (pygame.font.Font): Police.
+            text (str): Texte à rendre.
+            color (tuple): Couleur du texte.
+            antialias (bool): Lissage des caractères.
+
+        Returns:
+            pygame.Surface: Surface partagée (à ne pas modifier).
+        """
+        key = (font, text, color, None, antialias)
+        surface = self._lookup(key)
+        if surface is None:
+            surface = self._store(key, font.render(text, antialias, color))
+        return surface
+
+    @timed
+    def render_multiline(self, font, text, color, max_width):
+        """
+        Découpe et rend un texte multi-lignes, depuis le cache si possible.
+
+        Returns:
+            tuple[pygame.Surface]: Lignes rendues (partagées).
+        """
+        key = (font, text, color, max_width, True)
+        lines = self._lookup(key)
+        if lines is None:
+            lines = self._store(key, tuple(
+                self.render(font, line, color) for line in wrap_text(text, font, max_width)
+            ))
+        return lines
+
+    def clear(self):
+        self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+
+# Cache unique partagé par l'ATH, les dialogues et les écrans
+text_cache = TextCache()
+
+
+class DigitCompositor:
+    """
+    Affiche un compteur numérique (ex: score) sans rasteriser de texte.
+
+    Les glyphes des chiffres et le préfixe sont rendus une seule fois ;
+    chaque nouvelle valeur est composée en blittant les glyphes dans une
+    surface allouée une fois. Tant que la valeur ne change pas, la même
+    surface est retournée.
+
+    Attributes:
+        prefix (str): Texte affiché avant le nombre (ex: "Score: ").
+    """
+    CHARACTERS = "0123456789-"
+
+    def __init__(self, font, color, prefix="", max_digits=12):
+        """
+        Args:
+            font (pygame.font.Font): Police du compteur.
+            color (tuple): Couleur du texte.
+            prefix (str): Texte fixe avant le nombre.
+            max_digits (int): Nombre maximal de caractères du nombre.
+        """
+        self.prefix = prefix
+        self._prefix = text_cache.render(font, prefix, color) if prefix else None
+        self._glyphs = {char: text_cache.render(font, char, color) for char in self.CHARACTERS}
+        prefix_width = self._prefix.get_width() if self._prefix else 0
+        glyph_width = max(glyph.get_width() for glyph in self._glyphs.values())
+        self._surface = pygame.Surface(
+            (prefix_width + glyph_width * max_digits, font.get_linesize()), pygame.SRCALPHA
+        )
+        self._surface.fill((0, 0, 0, 0))
+        self._blank = self._surface.copy()  # sert à effacer les chiffres (plus rapide que fill)
+        if self._prefix:
+            self._surface.blit(self._prefix, (0, 0))  # le préfixe ne change jamais
+        self._prefix_width = prefix_width
+        self._width = prefix_width  # largeur actuellement dessinée
+        self._value = None
+        self._view = None
+
+    def render(self, value):
+        """
+        Args:
+            value (int): Valeur à afficher.
+
+        Returns:
+            pygame.Surface: Surface du compteur (réutilisée, à ne pas modifier).
+        """
+        if value == self._value:
+            return self._view
+        self._value = value
+        # Efface uniquement les chiffres précédents
+        height = self._surface.get_height()
+        digits_area = (self._prefix_width, 0, self._width - self._prefix_width, height)
+        self._surface.blit(self._blank, digits_area, digits_area, special_flags=pygame.BLEND_RGBA_MIN)
+        x = self._prefix_width
+        for char in str(value):
+            glyph = self._glyphs[char]
+            if x + glyph.get_width() > self._surface.get_width():
+                break
+            self._surface.blit(glyph, (x, 0))
+            x += glyph.get_width()
+        self._width = x
+        self._view = self._surface.subsurface((0, 0, max(1, x), height))
+        return self._view
+
+
+def wrap_text(text, font, max_width):
+    """
+    Découpe un texte en lignes ne dépassant pas une largeur max.
+
+    Returns:
+        list[str]: Lignes (chacune terminée par une espace, comme à l'affichage).
+    """
     words = text.split(" ")
     lines = []
     current_line = ""
@@ -250,7 +1004,11 @@ def render_multiline(text, font, color, max_width):
     if current_line:
         lines.append(current_line)
 
-    return [font.render(line, True, color) for line in lines]
+    return lines
+
+def render_multiline(text, font, color, max_width):
+    """Découpe et rend un texte multi-lignes selon une largeur max (via `text_cache`)."""
+    return list(text_cache.render_multiline(font, text, color, max_width))
 
 def write_score(text: str):
     """Écrit le score dans le fichier score.txt."""